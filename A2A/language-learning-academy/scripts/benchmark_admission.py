@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import os
+import time
+
+import httpx
+
+from benchmark_concurrency import percentile
+from benchmark_workers import send_payload, serve, wait_ready
+
+
+QUERY = 'Teach me 5 beginner Spanish food words'
+
+
+async def calibrate(client: httpx.AsyncClient, url: str, concurrency: int, duration: float) -> float:
+    deadline = time.perf_counter() + duration
+    ok = 0
+
+    async def user():
+        nonlocal ok
+        while time.perf_counter() < deadline:
+            response = await client.post(url, json=send_payload(QUERY))
+            ok += response.status_code == 200
+
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    return ok / duration
+
+
+async def overload(client: httpx.AsyncClient, url: str, rate: float, duration: float, window: float):
+    results: list[tuple[float, int, float]] = []
+
+    async def one(sent_at: float):
+        try:
+            response = await client.post(url, json=send_payload(QUERY))
+            status = response.status_code
+            if status == 200 and 'error' in response.json():
+                status = 500
+        except httpx.TransportError:
+            status = 0
+        results.append((sent_at, status, time.perf_counter() - sent_at))
+
+    started = time.perf_counter()
+    requests = []
+    for i in range(int(rate * duration)):
+        delay = started + i / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        requests.append(asyncio.create_task(one(time.perf_counter())))
+    await asyncio.gather(*requests)
+
+    ok = [latency for _, status, latency in results if status == 200]
+    shed = sum(status in (429, 503) for _, status, _ in results)
+    failed = len(results) - len(ok) - shed
+    windows = []
+    for start in range(0, int(duration), int(window)):
+        bucket = [
+            latency for sent_at, status, latency in results
+            if status == 200 and start <= sent_at - started < start + window
+        ]
+        windows.append(f'{percentile(bucket, 99) * 1000:.0f}' if bucket else '-')
+    return ok, shed, failed, windows
+
+
+async def run(url: str, concurrency: int, overload_factor: float, duration: float, window: float, capacity: float | None):
+    limits = httpx.Limits(max_connections=2000, max_keepalive_connections=200)
+    async with httpx.AsyncClient(timeout=120.0, limits=limits) as client:
+        await wait_ready(client, url)
+        if capacity is None:
+            capacity = await calibrate(client, url, concurrency, 5.0)
+        ok, shed, failed, windows = await overload(client, url, capacity * overload_factor, duration, window)
+    return capacity, ok, shed, failed, windows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='p99 latency of admitted requests under overload, with and without admission control')
+    parser.add_argument('--model-latency', type=float, default=0.5, help='stub model seconds per call')
+    parser.add_argument('--provider-capacity', type=int, default=8, help='concurrent calls the stub provider serves')
+    parser.add_argument('--concurrency', type=int, default=8, help='ADMISSION_MAX_CONCURRENCY')
+    parser.add_argument('--queue', type=int, default=16, help='ADMISSION_MAX_QUEUE')
+    parser.add_argument('--queue-timeout', type=float, default=2.0)
+    parser.add_argument('--overload', type=float, default=3.0, help='offered load as a multiple of measured capacity')
+    parser.add_argument('--duration', type=float, default=30.0)
+    parser.add_argument('--window', type=float, default=5.0, help='seconds per p99 window')
+    parser.add_argument('--port', type=int, default=9991)
+    args = parser.parse_args()
+
+    url = f'http://127.0.0.1:{args.port}'
+    os.environ['STUB_MODEL_LATENCY'] = str(args.model_latency)
+    os.environ['STUB_MODEL_CAPACITY'] = str(args.provider_capacity)
+    capacity = None
+    for enabled in (True, False):
+        os.environ['ADMISSION_MAX_CONCURRENCY'] = str(args.concurrency if enabled else 0)
+        os.environ['ADMISSION_MAX_QUEUE'] = str(args.queue)
+        os.environ['ADMISSION_QUEUE_TIMEOUT_SECONDS'] = str(args.queue_timeout)
+        process = serve(args.port, 1)
+        try:
+            capacity, ok, shed, failed, windows = asyncio.run(
+                run(url, args.concurrency, args.overload, args.duration, args.window, capacity)
+            )
+        finally:
+            process.terminate()
+            process.wait()
+        label = 'admission on' if enabled else 'admission off'
+        p99 = percentile(ok, 99) * 1000 if ok else float('nan')
+        print(
+            f"{label:<14} offered={capacity * args.overload:6.1f} rps  ok={len(ok):<5} shed={shed:<5} failed={failed:<4} "
+            f"p99={p99:8.0f}ms  p99 per {args.window:.0f}s window (ms): {' '.join(windows)}"
+        )
+
+
+if __name__ == '__main__':
+    main()
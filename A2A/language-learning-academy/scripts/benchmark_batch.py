@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import sys
+import time
+
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from a2a.server.agent_execution import RequestContext
+from a2a.server.events import EventQueue
+from a2a.types import DataPart, Message, MessageSendParams, Part, Role, TaskArtifactUpdateEvent
+
+from benchmark_concurrency import build_context
+from language_learning_academy.agent.checkpoint import BoundedCheckpointSaver
+from language_learning_academy.agent.executor import (
+    LanguageLearningAgent,
+    LLMLanguageLearningAgentExecutor,
+)
+from stub_model import StubChatModel
+
+
+TOPICS = ['food', 'greetings', 'travel', 'numbers', 'colors', 'family', 'weather', 'shopping', 'work', 'school']
+
+
+class CountingEventQueue(EventQueue):
+    def __init__(self):
+        super().__init__()
+        self.artifacts = 0
+
+    async def enqueue_event(self, event) -> None:
+        if isinstance(event, TaskArtifactUpdateEvent):
+            self.artifacts += 1
+        await super().enqueue_event(event)
+
+
+def build_executor(latency: float, capacity: int) -> tuple[LLMLanguageLearningAgentExecutor, StubChatModel]:
+    model = StubChatModel(latency=latency, capacity=capacity)
+    agent = LanguageLearningAgent(model=model, checkpointer=BoundedCheckpointSaver(), response_cache=False)
+    return LLMLanguageLearningAgentExecutor(agent=agent), model
+
+
+async def individual(queries: list[str], latency: float, capacity: int) -> tuple[float, int]:
+    executor, model = build_executor(latency, capacity)
+    model.calls.clear()
+    started = time.perf_counter()
+    await asyncio.gather(*(executor.execute(build_context(q), EventQueue()) for q in queries))
+    return time.perf_counter() - started, len(model.calls)
+
+
+async def batched(queries: list[str], latency: float, capacity: int) -> tuple[float, int, int]:
+    executor, model = build_executor(latency, capacity)
+    model.calls.clear()
+    message = Message(
+        role=Role.user,
+        parts=[Part(root=DataPart(data={'batch': queries}))],
+        message_id=uuid4().hex,
+    )
+    queue = CountingEventQueue()
+    started = time.perf_counter()
+    await executor.execute(RequestContext(request=MessageSendParams(message=message)), queue)
+    return time.perf_counter() - started, len(model.calls), queue.artifacts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Throughput of one batch task versus the same queries as individual tasks')
+    parser.add_argument('--students', type=int, default=30)
+    parser.add_argument('--unique', type=int, default=10, help='distinct queries among the students')
+    parser.add_argument('--model-latency', type=float, default=0.2)
+    parser.add_argument('--provider-capacity', type=int, default=8, help='concurrent calls the stub provider serves')
+    args = parser.parse_args()
+
+    queries = [f'Teach me 5 beginner Spanish {TOPICS[i % args.unique % len(TOPICS)]} words #{i % args.unique}' for i in range(args.students)]
+
+    elapsed, calls = asyncio.run(individual(queries, args.model_latency, args.provider_capacity))
+    print(f"individual tasks  {args.students / elapsed:6.1f} queries/s  wall={elapsed:6.2f}s  model calls={calls}")
+    elapsed, calls, artifacts = asyncio.run(batched(queries, args.model_latency, args.provider_capacity))
+    print(f"one batch task    {args.students / elapsed:6.1f} queries/s  wall={elapsed:6.2f}s  model calls={calls}  item artifacts={artifacts}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import sys
+import time
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from a2a.server.agent_execution import RequestContext
+from a2a.server.events import EventQueue
+from a2a.types import TaskState, TaskStatusUpdateEvent
+
+from benchmark_concurrency import build_context
+from language_learning_academy.agent.checkpoint import BoundedCheckpointSaver
+from language_learning_academy.agent.executor import (
+    LanguageLearningAgent,
+    LLMLanguageLearningAgentExecutor,
+)
+from stub_model import StubChatModel
+
+
+async def bench(tasks: int, model_latency: float, bound: float) -> None:
+    agent = LanguageLearningAgent(
+        model=StubChatModel(latency=model_latency),
+        checkpointer=BoundedCheckpointSaver(),
+        response_cache=False,
+    )
+    executor = LLMLanguageLearningAgentExecutor(agent=agent)
+
+    contexts = [build_context('Teach me 5 beginner Spanish food words') for _ in range(tasks)]
+    running = [asyncio.create_task(executor.execute(ctx, EventQueue())) for ctx in contexts]
+    while executor.in_flight < tasks:
+        await asyncio.sleep(0.01)
+    print(f"in flight before cancel: {executor.in_flight}")
+
+    cancel_queues = [EventQueue() for _ in contexts]
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        executor.cancel(RequestContext(task_id=ctx.task_id, context_id=ctx.context_id), queue)
+        for ctx, queue in zip(contexts, cancel_queues)
+    ))
+    elapsed = time.perf_counter() - started
+
+    canceled = 0
+    for queue in cancel_queues:
+        event = await queue.dequeue_event(no_wait=True)
+        if isinstance(event, TaskStatusUpdateEvent) and event.status.state == TaskState.canceled:
+            canceled += 1
+
+    print(f"in flight after cancel:  {executor.in_flight}")
+    print(f"canceled statuses:       {canceled}/{tasks}")
+    print(f"all slots freed in:      {elapsed * 1000:.1f}ms (bound {bound * 1000:.0f}ms)")
+    assert executor.in_flight == 0, 'executor still tracks running tasks'
+    assert all(task.done() for task in running), 'graph runs still in progress'
+    assert canceled == tasks, 'missing canceled status updates'
+    assert elapsed <= bound, 'cancellation exceeded the time bound'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cancel in-flight tasks and check every slot is released')
+    parser.add_argument('--tasks', type=int, default=500)
+    parser.add_argument('--model-latency', type=float, default=60.0, help='stub model latency (seconds)')
+    parser.add_argument('--bound', type=float, default=2.0, help='maximum seconds allowed to free all slots')
+    args = parser.parse_args()
+    asyncio.run(bench(args.tasks, args.model_latency, args.bound))
+
+
+if __name__ == '__main__':
+    main()
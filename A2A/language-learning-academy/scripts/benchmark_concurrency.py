@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from a2a.server.agent_execution import RequestContext
+from a2a.server.events import EventQueue
+from a2a.types import Message, MessageSendParams, Part, Role, TaskStatusUpdateEvent, TextPart
+
+from language_learning_academy.agent.checkpoint import BoundedCheckpointSaver
+from language_learning_academy.agent.executor import (
+    LanguageLearningAgent,
+    LLMLanguageLearningAgentExecutor,
+)
+from stub_model import StubChatModel
+
+
+class TimingEventQueue(EventQueue):
+    def __init__(self, started: float):
+        super().__init__()
+        self.started = started
+        self.first_status_at: float | None = None
+
+    async def enqueue_event(self, event) -> None:
+        if self.first_status_at is None and isinstance(event, TaskStatusUpdateEvent):
+            self.first_status_at = time.perf_counter() - self.started
+        await super().enqueue_event(event)
+
+
+def build_context(query: str) -> RequestContext:
+    message = Message(
+        role=Role.user,
+        parts=[Part(root=TextPart(text=query))],
+        message_id=uuid4().hex,
+    )
+    return RequestContext(request=MessageSendParams(message=message))
+
+
+async def run_one(executor: LLMLanguageLearningAgentExecutor) -> float:
+    queue = TimingEventQueue(time.perf_counter())
+    await executor.execute(build_context('Teach me 5 beginner Spanish food words'), queue)
+    return queue.first_status_at
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def bench(concurrency: int, latency: float, async_mode: bool) -> None:
+    agent = LanguageLearningAgent(
+        model=StubChatModel(latency=latency),
+        async_mode=async_mode,
+        checkpointer=BoundedCheckpointSaver(),
+        response_cache=False,
+    )
+    executor = LLMLanguageLearningAgentExecutor(agent=agent)
+
+    started = time.perf_counter()
+    samples = await asyncio.gather(*(run_one(executor) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    mode = 'astream' if async_mode else 'thread-offload'
+    print(
+        f"{mode:<15} n={concurrency:<5} "
+        f"p50={statistics.median(samples) * 1000:8.1f}ms "
+        f"p99={percentile(samples, 99) * 1000:8.1f}ms "
+        f"wall={elapsed:6.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time-to-first-status-update under concurrent load')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 10, 100, 300])
+    parser.add_argument('--latency', type=float, default=0.2, help='stub model latency per call (seconds)')
+    parser.add_argument('--sync', action='store_true', help='also benchmark the thread-offload fallback')
+    args = parser.parse_args()
+
+    for n in args.concurrency:
+        asyncio.run(bench(n, args.latency, async_mode=True))
+        if args.sync:
+            asyncio.run(bench(n, args.latency, async_mode=False))
+
+
+if __name__ == '__main__':
+    main()
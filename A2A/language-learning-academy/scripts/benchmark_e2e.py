@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+
+import httpx
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR.parent / 'src'))
+
+from benchmark_concurrency import percentile
+from benchmark_workers import send_payload, wait_ready
+
+
+QUERIES = [
+    'Teach me 5 beginner Spanish food words',
+    'Explain French past tense rules',
+    'Quiz me on German vocabulary',
+    'Translate "where is the station" to Italian',
+    'Practice restaurant conversation in Portuguese',
+]
+
+
+def start_fake_openai(port: int, args) -> subprocess.Popen:
+    return subprocess.Popen([
+        sys.executable, str(SCRIPTS_DIR / 'fake_openai_server.py'), '--port', str(port),
+        '--latency', args.latency, '--latency-mean', str(args.latency_mean), '--latency-spread', str(args.latency_spread),
+        '--tokens-per-second', str(args.tokens_per_second), '--reply-words', str(args.reply_words), '--seed', '7',
+    ])
+
+
+def start_agent(port: int, openai_port: int, workers: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        'OPENAI_BASE_URL': f'http://127.0.0.1:{openai_port}/v1',
+        'OPENAI_API_KEY': 'fake',
+        'SERVER_PORT': str(port),
+        'TASK_STORE_BACKEND': 'memory',
+        'CHECKPOINT_BACKEND': 'memory',
+        # Every request should reach the model stand-in.
+        'RESPONSE_CACHE': 'false',
+        'ROUTER_ENABLED': 'false',
+    }
+    return subprocess.Popen(
+        [sys.executable, '-m', 'language_learning_academy.server.main', '--port', str(port), '--workers', str(workers)],
+        cwd=SCRIPTS_DIR.parent / 'src',
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def load(url: str, concurrency: int, requests: int) -> tuple[list[float], int, float]:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=120.0, limits=limits) as client:
+        await wait_ready(client, url)
+        load_started = time.perf_counter()
+        latencies, failed = [], 0
+        remaining = iter(range(requests))
+
+        async def user():
+            nonlocal failed
+            for i in remaining:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(url, json=send_payload(QUERIES[i % len(QUERIES)]))
+                    result = response.json().get('result', {})
+                    ok = response.status_code == 200 and result.get('status', {}).get('state') == 'completed'
+                except httpx.TransportError:
+                    ok = False
+                if ok:
+                    latencies.append(time.perf_counter() - started)
+                else:
+                    failed += 1
+
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        return latencies, failed, time.perf_counter() - load_started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='End-to-end A2A server load test against the local OpenAI stand-in')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--requests', type=int, default=64, help='requests per concurrency level')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--latency', default='lognormal')
+    parser.add_argument('--latency-mean', type=float, default=0.3)
+    parser.add_argument('--latency-spread', type=float, default=0.4)
+    parser.add_argument('--tokens-per-second', type=float, default=200.0)
+    parser.add_argument('--reply-words', type=int, default=60)
+    parser.add_argument('--port', type=int, default=9988)
+    parser.add_argument('--openai-port', type=int, default=8089)
+    args = parser.parse_args()
+
+    fake = start_fake_openai(args.openai_port, args)
+    agent = start_agent(args.port, args.openai_port, args.workers)
+    try:
+        for concurrency in args.concurrency:
+            latencies, failed, elapsed = asyncio.run(load(f'http://127.0.0.1:{args.port}', concurrency, args.requests))
+            print(
+                f'concurrency={concurrency:<4} rps={len(latencies) / elapsed:6.1f} '
+                f'p50={percentile(latencies, 50) * 1000:7.0f}ms p99={percentile(latencies, 99) * 1000:7.0f}ms failed={failed}'
+            )
+    finally:
+        for process in (agent, fake):
+            process.terminate()
+            process.wait()
+
+
+if __name__ == '__main__':
+    main()
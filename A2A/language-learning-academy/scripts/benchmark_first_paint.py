@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from benchmark_concurrency import percentile
+from benchmark_workers import serve, wait_ready
+from language_learning_academy.ui.client import AgentClient, StreamState
+
+
+QUERY = 'Teach me 5 beginner Spanish food words'
+
+
+def measure(client: AgentClient, requests: int) -> tuple[list[float], list[float], list[float]]:
+    buffered, first_paint, last_paint = [], [], []
+    for _ in range(requests):
+        # Previous UI behaviour: collect every chunk, then render once.
+        started = time.perf_counter()
+        client.run(client.send_message(QUERY, use_streaming=True))
+        buffered.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        state = StreamState()
+        first = None
+        for event in client.iter_stream(QUERY):
+            if state.apply(event) and first is None:
+                first = time.perf_counter() - started
+        first_paint.append(first)
+        last_paint.append(time.perf_counter() - started)
+    return buffered, first_paint, last_paint
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time to first paint of a streamed reply, buffered versus progressive')
+    parser.add_argument('--requests', type=int, default=20)
+    parser.add_argument('--model-latency', type=float, default=0.5, help='stub seconds before each model call starts')
+    parser.add_argument('--token-latency', type=float, default=0.05, help='stub seconds per streamed word')
+    parser.add_argument('--port', type=int, default=9993)
+    args = parser.parse_args()
+
+    os.environ['SERVER_PORT'] = str(args.port)
+    os.environ['STUB_MODEL_LATENCY'] = str(args.model_latency)
+    os.environ['STUB_TOKEN_LATENCY'] = str(args.token_latency)
+    os.environ['AGENT_STREAM_TOKENS'] = 'true'
+    url = f'http://127.0.0.1:{args.port}'
+    process = serve(args.port, 1)
+    client = None
+    try:
+        asyncio.run(_ready(url))
+        client = AgentClient(url)
+        buffered, first_paint, last_paint = measure(client, args.requests)
+    finally:
+        if client is not None:
+            client.close()
+        process.terminate()
+        process.wait()
+
+    for label, samples in (
+        ('buffered (first paint = complete)', buffered),
+        ('progressive first paint', first_paint),
+        ('progressive complete', last_paint),
+    ):
+        print(f"{label:<34} p50={percentile(samples, 50) * 1000:7.1f}ms  p99={percentile(samples, 99) * 1000:7.1f}ms")
+
+
+async def _ready(url: str) -> None:
+    async with httpx.AsyncClient() as client:
+        await wait_ready(client, url)
+
+
+if __name__ == '__main__':
+    main()
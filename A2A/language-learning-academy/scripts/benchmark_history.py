@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import sys
+import time
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from language_learning_academy.agent.checkpoint import BoundedCheckpointSaver
+from language_learning_academy.agent.executor import LanguageLearningAgent
+from language_learning_academy.agent.history import HistoryPolicy
+from stub_model import StubChatModel, count_tokens
+
+
+PROFILE = {
+    'native_language': 'Hindi',
+    'learning_goal': 'Travel',
+    'tutor_persona': 'Friendly',
+    'correction_strictness': 'Gentle',
+}
+
+
+async def converse(policy: HistoryPolicy, turns: int, checkpoints: set[int], prompt_latency: float) -> dict[int, tuple[int, float]]:
+    model = StubChatModel(latency=0, prompt_latency=prompt_latency)
+    agent = LanguageLearningAgent(
+        model=model,
+        checkpointer=BoundedCheckpointSaver(max_messages=None),
+        response_cache=False,
+        history_policy=policy,
+    )
+
+    results = {}
+    for turn in range(1, turns + 1):
+        model.calls.clear()
+        started = time.perf_counter()
+        async for _ in agent.stream(f'Teach me Spanish travel phrase #{turn}', 'history-bench', PROFILE):
+            pass
+        elapsed = time.perf_counter() - started
+        if turn in checkpoints:
+            results[turn] = (sum(count_tokens(call) for call in model.calls), elapsed)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Prompt tokens and turn latency as a conversation grows, per history policy')
+    parser.add_argument('--turns', type=int, nargs='+', default=[5, 50, 500])
+    parser.add_argument('--window', type=int, default=10, help='learner turns kept verbatim')
+    parser.add_argument('--prompt-latency', type=float, default=0.001, help='stub model seconds per 1k prompt tokens')
+    args = parser.parse_args()
+
+    policies = {
+        'full history': HistoryPolicy(max_turns=None),
+        f'last {args.window} turns': HistoryPolicy(max_turns=args.window),
+        f'last {args.window} + summary': HistoryPolicy(max_turns=args.window, summarize=True),
+    }
+    checkpoints = set(args.turns)
+    for label, policy in policies.items():
+        results = asyncio.run(converse(policy, max(checkpoints), checkpoints, args.prompt_latency))
+        samples = '  '.join(
+            f't{turn}: {tokens:>6} tok {elapsed * 1000:7.1f}ms'
+            for turn, (tokens, elapsed) in sorted(results.items())
+        )
+        print(f"{label:<20} {samples}")
+
+
+if __name__ == '__main__':
+    main()
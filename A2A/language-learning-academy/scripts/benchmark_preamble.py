@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import sys
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from language_learning_academy.agent.checkpoint import BoundedCheckpointSaver
+from language_learning_academy.agent.executor import LanguageLearningAgent, _build_profile_preamble
+from stub_model import StubChatModel, count_tokens
+
+
+PROFILE = {
+    'native_language': 'Hindi',
+    'learning_goal': 'Business',
+    'tutor_persona': 'Coach',
+    'correction_strictness': 'Strict',
+}
+
+
+async def converse(turns: int, interned: bool) -> tuple[list[int], int]:
+    model = StubChatModel(latency=0)
+    checkpointer = BoundedCheckpointSaver(max_messages=None)
+    agent = LanguageLearningAgent(model=model, checkpointer=checkpointer, response_cache=False)
+    config = {'configurable': {'thread_id': 'preamble-bench'}}
+
+    per_turn = []
+    for turn in range(turns):
+        model.calls.clear()
+        query = f'Teach me Spanish business word #{turn}'
+        if interned:
+            async for _ in agent.stream(query, 'preamble-bench', PROFILE):
+                pass
+        else:
+            # Previous behaviour: the preamble is prepended to every turn.
+            inputs = {'messages': [('system', _build_profile_preamble(PROFILE)), ('user', query)]}
+            async for _ in agent.graph.astream(inputs, config):
+                pass
+        per_turn.append(sum(count_tokens(call) for call in model.calls))
+
+    saved = checkpointer.get_tuple(config)
+    checkpoint_bytes = len(checkpointer.serde.dumps_typed(saved.checkpoint)[1])
+    return per_turn, checkpoint_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Prompt tokens per turn with and without the interned profile preamble')
+    parser.add_argument('--turns', type=int, default=20)
+    args = parser.parse_args()
+
+    for interned in (False, True):
+        per_turn, checkpoint_bytes = asyncio.run(converse(args.turns, interned))
+        label = 'once per context' if interned else 'every turn'
+        samples = ' '.join(f't{i + 1}={per_turn[i]}' for i in (0, 4, 9, args.turns - 1) if i < len(per_turn))
+        print(
+            f"{label:<17} total prompt tokens={sum(per_turn):>7} {samples} "
+            f"checkpoint={checkpoint_bytes / 1024:.1f}KB"
+        )
+
+
+if __name__ == '__main__':
+    main()
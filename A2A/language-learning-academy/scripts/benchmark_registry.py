@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+os.environ.setdefault('OPENAI_API_KEY', 'stub')
+os.environ.setdefault('CHECKPOINT_BACKEND', 'memory')
+
+from langchain_openai import ChatOpenAI
+from langgraph.prebuilt import create_react_agent
+
+from language_learning_academy.agent import registry
+from language_learning_academy.agent.executor import LanguageLearningAgent, ResponseFormat
+
+
+COMPLETION = json.dumps({
+    'id': 'chatcmpl-bench',
+    'object': 'chat.completion',
+    'created': 0,
+    'model': 'bench',
+    'choices': [{
+        'index': 0,
+        'message': {'role': 'assistant', 'content': 'hola'},
+        'finish_reason': 'stop',
+    }],
+    'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}).encode()
+
+
+class CompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    connections: set = set()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('content-length', 0)))
+        CompletionHandler.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header('content-type', 'application/json')
+        self.send_header('content-length', str(len(COMPLETION)))
+        self.end_headers()
+        self.wfile.write(COMPLETION)
+
+    def log_message(self, *args):
+        pass
+
+
+def bench_startup(agents: int) -> None:
+    started = time.perf_counter()
+    for _ in range(agents):
+        model = ChatOpenAI(model='bench', openai_api_key='stub', temperature=0.7)
+        create_react_agent(
+            model,
+            tools=[],
+            prompt=LanguageLearningAgent.SYSTEM_INSTRUCTION,
+            response_format=(LanguageLearningAgent.FORMAT_INSTRUCTION, ResponseFormat),
+        )
+    fresh = (time.perf_counter() - started) / agents
+
+    registry.clear()
+    started = time.perf_counter()
+    for _ in range(agents):
+        LanguageLearningAgent(response_cache=False)
+    pooled = (time.perf_counter() - started) / agents
+
+    print(f"agent construction  fresh={fresh * 1000:7.2f}ms  registry={pooled * 1000:7.3f}ms")
+
+
+async def bench_requests(requests: int, base_url: str) -> None:
+    CompletionHandler.connections.clear()
+    started = time.perf_counter()
+    for _ in range(requests):
+        async with httpx.AsyncClient() as client:
+            model = ChatOpenAI(model='bench', openai_api_key='stub', base_url=base_url, http_async_client=client)
+            await model.ainvoke('hola')
+    fresh = (time.perf_counter() - started) / requests
+    fresh_connections = len(CompletionHandler.connections)
+
+    CompletionHandler.connections.clear()
+    model = registry.get_chat_model('bench', api_key='stub', base_url=base_url)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await model.ainvoke('hola')
+    pooled = (time.perf_counter() - started) / requests
+    pooled_connections = len(CompletionHandler.connections)
+
+    print(
+        f"per-request latency fresh={fresh * 1000:7.2f}ms ({fresh_connections} connections)  "
+        f"registry={pooled * 1000:7.2f}ms ({pooled_connections} connections)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Agent startup and per-request connection cost with and without the registry')
+    parser.add_argument('--agents', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=300)
+    args = parser.parse_args()
+
+    bench_startup(args.agents)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CompletionHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        asyncio.run(bench_requests(args.requests, f'http://127.0.0.1:{server.server_port}/v1'))
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
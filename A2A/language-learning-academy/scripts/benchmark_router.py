@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import random
+import sys
+import time
+import timeit
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from a2a.server.events import EventQueue
+
+from benchmark_concurrency import build_context
+from language_learning_academy.agent.checkpoint import BoundedCheckpointSaver
+from language_learning_academy.agent.executor import (
+    LEVELS,
+    SUPPORTED_LANGUAGES,
+    LanguageLearningAgent,
+    LLMLanguageLearningAgentExecutor,
+)
+from language_learning_academy.agent.router import build_intent_router
+from language_learning_academy.server.main import build_agent_cards
+from stub_model import StubChatModel
+
+
+FAQ_QUERIES = [
+    'What languages do you support?',
+    'Show me available services',
+    'Help me get started',
+    'Which levels are available?',
+]
+LESSON_QUERIES = [
+    'Teach me Spanish vocabulary for beginners',
+    'Explain French past tense rules',
+    'What languages do you support for business travel in Asia?',
+    'Quiz me on German vocabulary',
+]
+
+
+async def mixed_traffic(router, requests: int, faq_share: float, latency: float) -> float:
+    agent = LanguageLearningAgent(
+        model=StubChatModel(latency=latency),
+        checkpointer=BoundedCheckpointSaver(),
+        response_cache=False,
+    )
+    executor = LLMLanguageLearningAgentExecutor(agent=agent, router=router)
+    rng = random.Random(0)
+    started = time.perf_counter()
+    for _ in range(requests):
+        queries = FAQ_QUERIES if rng.random() < faq_share else LESSON_QUERIES
+        await executor.execute(build_context(rng.choice(queries)), EventQueue())
+    return (time.perf_counter() - started) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cost of the local intent router and its effect on mixed traffic')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--faq-share', type=float, default=0.2, help='fraction of traffic that is FAQ queries')
+    parser.add_argument('--model-latency', type=float, default=0.05)
+    args = parser.parse_args()
+
+    public_card, _ = build_agent_cards()
+    router = build_intent_router(public_card.skills, SUPPORTED_LANGUAGES, LEVELS)
+
+    for label, query in (('hit', FAQ_QUERIES[0]), ('miss', LESSON_QUERIES[0])):
+        seconds = timeit.timeit(lambda: router.route(query), number=100_000) / 100_000
+        print(f"route() {label:<4} {seconds * 1e6:6.2f}us")
+
+    router.total = 0
+    router.routed = dict.fromkeys(router.routed, 0)
+    without = asyncio.run(mixed_traffic(None, args.requests, args.faq_share, args.model_latency))
+    with_router = asyncio.run(mixed_traffic(router, args.requests, args.faq_share, args.model_latency))
+    print(f"mean request latency  llm only={without * 1000:7.2f}ms  with router={with_router * 1000:7.2f}ms")
+    print(f"short-circuited {router.short_circuit_fraction:.1%} of {router.total} requests: {router.routed}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import sqlite3
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from language_learning_academy.agent.checkpoint import BoundedCheckpointSaver
+from language_learning_academy.agent.executor import LanguageLearningAgent
+from stub_model import StubChatModel
+
+
+class CountingSqliteSaver(SqliteSaver):
+    reads = 0
+
+    def get_tuple(self, config):
+        CountingSqliteSaver.reads += 1
+        return super().get_tuple(config)
+
+
+async def bench(path: str, requests: int, turns: int, legacy: bool) -> tuple[float, float]:
+    backing = CountingSqliteSaver(sqlite3.connect(path, check_same_thread=False))
+    # No in-memory tier: every checkpoint read goes to SQLite.
+    checkpointer = BoundedCheckpointSaver(backing=backing, max_threads=0)
+    agent = LanguageLearningAgent(model=StubChatModel(latency=0), checkpointer=checkpointer, response_cache=False)
+
+    CountingSqliteSaver.reads = 0
+    started = time.perf_counter()
+    for i in range(requests):
+        context_id = f'reads-{legacy}-{i % (requests // turns)}'
+        async for _ in agent.stream('Teach me 5 beginner Spanish food words', context_id):
+            pass
+        if legacy:
+            # Previous behaviour: read the checkpoint back for structured_response.
+            await agent.graph.aget_state({'configurable': {'thread_id': context_id}})
+    elapsed = time.perf_counter() - started
+    return elapsed / requests, CountingSqliteSaver.reads / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Latency and checkpoint reads per request with and without the get_state read-back')
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--turns', type=int, default=5, help='turns per conversation')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for legacy in (True, False):
+            latency, reads = asyncio.run(bench(f'{directory}/checkpoints.sqlite', args.requests, args.turns, legacy))
+            label = 'get_state read-back' if legacy else 'from stream'
+            print(f"{label:<20} {latency * 1000:7.2f}ms per request  {reads:.2f} SQLite reads per request")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from a2a.types import Task, TaskState, TaskStatus
+
+from language_learning_academy.server.task_store import SqliteTaskStore
+
+
+async def timed(label: str, count: int, op) -> None:
+    started = time.perf_counter()
+    await op()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<7} {count / elapsed:>10,.0f} ops/s  ({elapsed:.2f}s)")
+
+
+async def bench(count: int, path: str) -> None:
+    store = SqliteTaskStore(path=path, completed_ttl_seconds=None)
+    tasks = [
+        Task(id=uuid4().hex, context_id=uuid4().hex, status=TaskStatus(state=TaskState.submitted))
+        for _ in range(count)
+    ]
+
+    async def create():
+        for task in tasks:
+            await store.save(task)
+
+    async def update():
+        for task in tasks:
+            task.status = TaskStatus(state=TaskState.completed)
+            await store.save(task)
+
+    async def get():
+        for task in tasks:
+            assert await store.get(task.id) is not None
+
+    print(f"{count:,} tasks")
+    await timed('create', count, create)
+    await timed('update', count, update)
+    await timed('get', count, get)
+    store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SqliteTaskStore create/update/get throughput')
+    parser.add_argument('--tasks', type=int, nargs='+', default=[10_000, 1_000_000])
+    args = parser.parse_args()
+
+    for count in args.tasks:
+        with tempfile.TemporaryDirectory() as tmp:
+            asyncio.run(bench(count, str(Path(tmp) / 'tasks.sqlite')))
+
+
+if __name__ == '__main__':
+    main()
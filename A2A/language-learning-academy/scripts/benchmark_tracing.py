@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import timeit
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import structlog
+
+from a2a.server.events import EventQueue
+
+from benchmark_concurrency import build_context
+from language_learning_academy.agent.checkpoint import BoundedCheckpointSaver
+from language_learning_academy.agent.executor import (
+    LanguageLearningAgent,
+    LLMLanguageLearningAgentExecutor,
+)
+from language_learning_academy.agent.tracing import tracer
+from stub_model import StubChatModel
+
+
+async def per_request(executor: LLMLanguageLearningAgentExecutor, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        await executor.execute(build_context('Teach me 5 beginner Spanish food words'), EventQueue())
+    return (time.perf_counter() - started) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Executor overhead of request tracing when disabled and enabled')
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    # Keep log rendering out of the measurement; spans and metrics still run.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    tracer.enabled = False
+    span_ns = timeit.timeit('with span("x"): pass', globals={'span': tracer.span}, number=1_000_000) * 1000
+    print(f"disabled span enter/exit: {span_ns:.0f}ns")
+
+    agent = LanguageLearningAgent(
+        model=StubChatModel(latency=0),
+        checkpointer=BoundedCheckpointSaver(),
+        response_cache=False,
+    )
+    executor = LLMLanguageLearningAgentExecutor(agent=agent)
+    asyncio.run(per_request(executor, 20))
+
+    results = {False: [], True: []}
+    for _ in range(args.rounds):
+        for enabled in (False, True):
+            tracer.enabled = enabled
+            results[enabled].append(asyncio.run(per_request(executor, args.requests)))
+    for enabled, samples in results.items():
+        print(f"tracing {'on ' if enabled else 'off'}  {min(samples) * 1000:7.3f}ms per request (best of {args.rounds})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from a2a.server.events import EventQueue
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.types import Message, MessageSendParams, Part, Role, TaskArtifactUpdateEvent, TextPart
+
+from benchmark_concurrency import build_context
+from language_learning_academy.agent import executor as executor_module
+from language_learning_academy.agent.checkpoint import BoundedCheckpointSaver
+from language_learning_academy.agent.executor import (
+    LanguageLearningAgent,
+    LLMLanguageLearningAgentExecutor,
+)
+from language_learning_academy.server.task_store import SqliteTaskStore
+from stub_model import StubChatModel
+
+
+class FirstArtifactQueue(EventQueue):
+    def __init__(self, started: float):
+        super().__init__()
+        self.started = started
+        self.first_artifact_at: float | None = None
+        self.chunks = 0
+
+    async def enqueue_event(self, event) -> None:
+        if isinstance(event, TaskArtifactUpdateEvent):
+            self.chunks += 1
+            if self.first_artifact_at is None:
+                self.first_artifact_at = time.perf_counter() - self.started
+        await super().enqueue_event(event)
+
+
+class TimedTaskStore(SqliteTaskStore):
+    saves = 0
+    save_seconds = 0.0
+
+    async def save(self, task) -> None:
+        started = time.perf_counter()
+        await super().save(task)
+        self.saves += 1
+        self.save_seconds += time.perf_counter() - started
+
+
+def build_executor(stream_tokens: bool, latency: float, token_latency: float, words: int) -> LLMLanguageLearningAgentExecutor:
+    model = StubChatModel(
+        latency=latency,
+        token_latency=token_latency,
+        reply=' '.join(f'palabra{i}' for i in range(words)),
+    )
+    agent = LanguageLearningAgent(
+        model=model,
+        checkpointer=BoundedCheckpointSaver(),
+        stream_tokens=stream_tokens,
+        response_cache=False,
+    )
+    return LLMLanguageLearningAgentExecutor(agent=agent)
+
+
+async def bench(stream_tokens: bool, runs: int, latency: float, token_latency: float) -> None:
+    executor = build_executor(stream_tokens, latency, token_latency, 200)
+
+    ttft, total, chunks = [], [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        queue = FirstArtifactQueue(started)
+        await executor.execute(build_context('Teach me 200 Spanish words'), queue)
+        ttft.append(queue.first_artifact_at)
+        total.append(time.perf_counter() - started)
+        chunks.append(queue.chunks)
+
+    label = 'token stream' if stream_tokens else 'final artifact'
+    print(
+        f"{label:<15} time-to-first-token={statistics.median(ttft) * 1000:8.1f}ms "
+        f"total={statistics.median(total) * 1000:8.1f}ms "
+        f"artifact events={statistics.median(chunks):.0f}"
+    )
+
+
+async def bench_task_store(label: str, words: int, latency: float, token_latency: float) -> None:
+    """Stream one reply through the request handler so every event is saved to a SQLite task store."""
+    executor = build_executor(True, latency, token_latency, words)
+    with tempfile.TemporaryDirectory() as directory:
+        store = TimedTaskStore(f'{directory}/tasks.sqlite')
+        handler = DefaultRequestHandler(agent_executor=executor, task_store=store)
+        params = MessageSendParams(message=Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text=f'Teach me {words} Spanish words'))],
+            message_id=uuid4().hex,
+        ))
+        started = time.perf_counter()
+        first_artifact = None
+        artifact_events = 0
+        async for event in handler.on_message_send_stream(params):
+            if isinstance(event, TaskArtifactUpdateEvent):
+                artifact_events += 1
+                first_artifact = first_artifact or time.perf_counter() - started
+        total = time.perf_counter() - started
+        store.close()
+    print(
+        f"{label:<15} words={words:<5} time-to-first-token={first_artifact * 1000:8.1f}ms "
+        f"total={total * 1000:8.1f}ms artifact events={artifact_events:<5} "
+        f"task saves={store.saves:<5} save time={store.save_seconds * 1000:8.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time-to-first-token with and without token streaming')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0.3, help='stub model latency to first token (seconds)')
+    parser.add_argument('--token-latency', type=float, default=0.01, help='stub model seconds per token')
+    parser.add_argument(
+        '--words', type=int, nargs='+', default=[500, 2000],
+        help='reply lengths streamed through a SQLite task store, per token versus coalesced',
+    )
+    args = parser.parse_args()
+
+    asyncio.run(bench(False, args.runs, args.latency, args.token_latency))
+    asyncio.run(bench(True, args.runs, args.latency, args.token_latency))
+
+    default_interval = executor_module.STREAM_FLUSH_INTERVAL_SECONDS
+    for words in args.words:
+        for label, interval in (('per token', 0.0), ('coalesced', default_interval)):
+            executor_module.STREAM_FLUSH_INTERVAL_SECONDS = interval
+            asyncio.run(bench_task_store(label, words, args.latency, args.token_latency))
+    executor_module.STREAM_FLUSH_INTERVAL_SECONDS = default_interval
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from pathlib import Path
+from uuid import uuid4
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from a2a.client import A2ACardResolver, A2AClient
+from a2a.types import MessageSendParams, SendMessageRequest
+
+from benchmark_workers import serve, wait_ready
+from language_learning_academy.ui.client import AgentClient
+
+
+QUERY = 'What languages do you support?'
+
+
+async def fetch_card(url: str):
+    async with httpx.AsyncClient() as httpx_client:
+        return await A2ACardResolver(httpx_client=httpx_client, base_url=url).get_agent_card()
+
+
+async def send_per_message_client(card) -> None:
+    # Previous UI behaviour: a new httpx client and A2AClient for every message.
+    async with httpx.AsyncClient(timeout=200.0) as httpx_client:
+        client = A2AClient(httpx_client=httpx_client, agent_card=card)
+        request = SendMessageRequest(
+            id=str(uuid4()),
+            params=MessageSendParams(message={
+                'role': 'user',
+                'parts': [{'kind': 'text', 'text': QUERY}],
+                'message_id': uuid4().hex,
+            }),
+        )
+        await client.send_message(request)
+
+
+def bench(url: str, requests: int) -> None:
+    loop = asyncio.new_event_loop()
+    card = loop.run_until_complete(fetch_card(url))
+    started = time.perf_counter()
+    for _ in range(requests):
+        loop.run_until_complete(send_per_message_client(card))
+    fresh = (time.perf_counter() - started) / requests
+    loop.close()
+
+    client = AgentClient(url)
+    client.run(client.send_message(QUERY))
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.run(client.send_message(QUERY))
+    pooled = (time.perf_counter() - started) / requests
+    client.close()
+
+    print(f"per-message latency  new client each time={fresh * 1000:7.2f}ms  shared AgentClient={pooled * 1000:7.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='UI message latency with a per-message client versus the shared AgentClient')
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--port', type=int, default=9992)
+    args = parser.parse_args()
+
+    # A zero-latency stub model keeps the comparison on client-side cost.
+    os.environ.setdefault('STUB_MODEL_LATENCY', '0')
+    # The agent card advertises SERVER_PORT, which the client then posts to.
+    os.environ['SERVER_PORT'] = str(args.port)
+    url = f'http://127.0.0.1:{args.port}'
+    process = serve(args.port, 1)
+    try:
+        asyncio.run(_ready(url))
+        bench(url, args.requests)
+    finally:
+        process.terminate()
+        process.wait()
+
+
+async def _ready(url: str) -> None:
+    async with httpx.AsyncClient() as client:
+        await wait_ready(client, url)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from streamlit.testing.v1 import AppTest
+
+from benchmark_concurrency import percentile
+
+
+APP_PATH = Path(__file__).resolve().parent.parent / 'src' / 'language_learning_academy' / 'ui' / 'streamlit_app.py'
+SRC_PATH = APP_PATH.parents[2]
+IMPORT_PROBE = (
+    'import time, streamlit; started = time.perf_counter(); '
+    'import language_learning_academy.ui.client; print(time.perf_counter() - started)'
+)
+
+
+def client_import_seconds() -> float:
+    """Cost of the a2a/httpx client stack in a fresh interpreter, which the app now pays on first agent call."""
+    output = subprocess.run(
+        [sys.executable, '-W', 'ignore', '-c', IMPORT_PROBE], cwd=SRC_PATH, capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def heavy_modules_loaded() -> list[str]:
+    return [name for name in ('a2a', 'httpx', 'language_learning_academy.ui.client') if name in sys.modules]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time Streamlit script execution for the cold first run and each rerun')
+    parser.add_argument('--reruns', type=int, default=50)
+    args = parser.parse_args()
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=30)
+
+    started = time.perf_counter()
+    at.run()
+    cold = time.perf_counter() - started
+    # The agent is not running, so the first run also pays for one refused connection attempt.
+    loaded = heavy_modules_loaded()
+
+    timings = []
+    for _ in range(args.reruns):
+        started = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - started)
+
+    if at.exception:
+        print(f'app raised: {at.exception[0].message}')
+    print(f'agent client import: {client_import_seconds() * 1000:.1f}ms')
+    print(f'cold first run: {cold * 1000:.1f}ms (loaded: {", ".join(loaded) or "none"})')
+    print(
+        f'rerun ({args.reruns}x): mean {statistics.mean(timings) * 1000:.1f}ms '
+        f'p50 {percentile(timings, 50) * 1000:.1f}ms p99 {percentile(timings, 99) * 1000:.1f}ms'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+from uuid import uuid4
+
+import httpx
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR.parent / 'src'))
+
+
+def create_stub_app():
+    from language_learning_academy.agent.checkpoint import BoundedCheckpointSaver
+    from language_learning_academy.agent.executor import (
+        LanguageLearningAgent,
+        LLMLanguageLearningAgentExecutor,
+    )
+    from language_learning_academy.server.main import create_app
+    from stub_model import StubChatModel
+
+    agent = LanguageLearningAgent(
+        model=StubChatModel(
+            latency=float(os.getenv('STUB_MODEL_LATENCY', '0.05')),
+            capacity=int(os.getenv('STUB_MODEL_CAPACITY', '0')),
+            token_latency=float(os.getenv('STUB_TOKEN_LATENCY', '0')),
+        ),
+        checkpointer=BoundedCheckpointSaver(),
+        response_cache=False,
+    )
+    return create_app(LLMLanguageLearningAgentExecutor(agent=agent))
+
+
+def serve(port: int, workers: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        'PYTHONPATH': os.pathsep.join([str(SCRIPTS_DIR), str(SCRIPTS_DIR.parent / 'src')]),
+        'TASK_STORE_BACKEND': 'memory',
+        'OPENAI_API_KEY': os.getenv('OPENAI_API_KEY', 'stub'),
+    }
+    return subprocess.Popen(
+        [
+            sys.executable, '-m', 'uvicorn', 'benchmark_workers:create_stub_app', '--factory',
+            '--port', str(port), '--workers', str(workers), '--log-level', 'warning',
+            '--timeout-graceful-shutdown', '5',
+        ],
+        env=env,
+    )
+
+
+def send_payload(query: str) -> dict:
+    return {
+        'jsonrpc': '2.0',
+        'id': uuid4().hex,
+        'method': 'message/send',
+        'params': {
+            'message': {
+                'role': 'user',
+                'parts': [{'kind': 'text', 'text': query}],
+                'messageId': uuid4().hex,
+            }
+        },
+    }
+
+
+async def wait_ready(client: httpx.AsyncClient, url: str) -> None:
+    delay = 0.05
+    for _ in range(100):
+        try:
+            if (await client.get(f'{url}/.well-known/agent-card.json')).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 1.0)
+    raise RuntimeError('server did not become ready')
+
+
+async def load(url: str, concurrency: int, duration: float) -> tuple[int, int]:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=60.0, limits=limits) as client:
+        await wait_ready(client, url)
+        deadline = time.perf_counter() + duration
+        ok = failed = 0
+
+        async def user():
+            nonlocal ok, failed
+            while time.perf_counter() < deadline:
+                try:
+                    response = await client.post(url, json=send_payload('Teach me 5 beginner Spanish food words'))
+                except httpx.TransportError:
+                    failed += 1
+                    continue
+                if response.status_code == 200 and 'error' not in response.json():
+                    ok += 1
+                else:
+                    failed += 1
+
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        return ok, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Requests/sec versus worker count against a stubbed model')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--duration', type=float, default=15.0)
+    parser.add_argument('--port', type=int, default=9990)
+    args = parser.parse_args()
+
+    for workers in args.workers:
+        process = serve(args.port, workers)
+        try:
+            ok, failed = asyncio.run(load(f'http://127.0.0.1:{args.port}', args.concurrency, args.duration))
+        finally:
+            process.terminate()
+            process.wait()
+        print(f"workers={workers:<3} rps={ok / args.duration:8.1f} ok={ok} failed={failed}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import re
+import time
+
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+import uvicorn
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+
+LATENCY_DISTRIBUTIONS = ('constant', 'uniform', 'normal', 'lognormal', 'exponential')
+
+# Each rule calls the listed tools when its pattern matches the latest user
+# message and the request offers all of them. Missing arguments are filled
+# from the tool's JSON schema.
+DEFAULT_TOOL_SCRIPT = [
+    {'pattern': r'vocab|words', 'tool_calls': [{'name': 'get_vocabulary_lesson'}]},
+    {'pattern': r'grammar|tense|conjugat', 'tool_calls': [{'name': 'get_grammar_lesson'}]},
+    {'pattern': r'quiz|test me', 'tool_calls': [{'name': 'create_language_quiz'}]},
+    {'pattern': r'translat', 'tool_calls': [{'name': 'translate_with_context'}]},
+    {'pattern': r'conversation|practi[cs]e|role.?play', 'tool_calls': [{'name': 'get_conversation_practice'}]},
+]
+
+LANGUAGES = ('spanish', 'french', 'german', 'italian', 'portuguese', 'japanese', 'chinese', 'korean')
+FILLER = (
+    'practice', 'this', 'phrase', 'slowly', 'then', 'repeat', 'it', 'aloud', 'with', 'a', 'partner', 'and',
+    'notice', 'how', 'the', 'stress', 'falls', 'on', 'second', 'syllable',
+)
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """Time to first token. ``mean`` is the median for lognormal; ``spread`` is its sigma."""
+
+    distribution: str = 'constant'
+    mean: float = 0.2
+    spread: float = 0.0
+
+    def sample(self) -> float:
+        if self.distribution == 'uniform':
+            value = random.uniform(self.mean - self.spread, self.mean + self.spread)
+        elif self.distribution == 'normal':
+            value = random.gauss(self.mean, self.spread)
+        elif self.distribution == 'lognormal':
+            value = self.mean * random.lognormvariate(0.0, self.spread)
+        elif self.distribution == 'exponential':
+            value = random.expovariate(1 / self.mean) if self.mean > 0 else 0.0
+        else:
+            value = self.mean
+        return max(0.0, value)
+
+
+@dataclass
+class FakeOpenAIConfig:
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    tokens_per_second: float = 50.0
+    reply_words: int = 120
+    capacity: int = 0
+    tool_script: list[dict] = field(default_factory=lambda: list(DEFAULT_TOOL_SCRIPT))
+
+
+def _text(content) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return ' '.join(part.get('text', '') for part in content if isinstance(part, dict))
+    return ''
+
+
+def _resolve(schema: dict, defs: dict) -> dict:
+    ref = schema.get('$ref')
+    if ref:
+        return _resolve(defs.get(ref.rsplit('/', 1)[-1], {}), defs)
+    if 'anyOf' in schema:
+        options = [option for option in schema['anyOf'] if option.get('type') != 'null']
+        return _resolve(options[0] if options else {}, defs)
+    return schema
+
+
+def fill_schema(schema: dict, text: str, defs: dict | None = None, name: str = ''):
+    """Build a value that validates against ``schema``, using ``text`` for free-form strings."""
+    defs = {**(defs or {}), **schema.get('$defs', {}), **schema.get('definitions', {})}
+    schema = _resolve(schema, defs)
+    if 'default' in schema:
+        return schema['default']
+    if 'enum' in schema:
+        return 'completed' if 'completed' in schema['enum'] else schema['enum'][0]
+    kind = schema.get('type', 'object' if 'properties' in schema else 'string')
+    if kind == 'object':
+        return {key: fill_schema(value, text, defs, key) for key, value in schema.get('properties', {}).items()}
+    if kind == 'array':
+        return []
+    if kind == 'integer':
+        return 5
+    if kind == 'number':
+        return 1.0
+    if kind == 'boolean':
+        return True
+    if 'language' in name:
+        mentioned = [language for language in LANGUAGES if language in text.lower()]
+        return mentioned[0] if mentioned else 'spanish'
+    return text
+
+
+def _tool_arguments(function: dict, given: dict, text: str) -> dict:
+    schema = function.get('parameters') or {}
+    properties = schema.get('properties', {})
+    arguments = {}
+    for key, value in properties.items():
+        if key in given:
+            arguments[key] = given[key]
+        elif key in schema.get('required', ()) or 'language' in key:
+            arguments[key] = fill_schema(value, text, schema.get('$defs'), key)
+    return arguments
+
+
+def _count_tokens(messages: list[dict]) -> int:
+    words = sum(len(_text(message.get('content')).split()) for message in messages)
+    return max(1, words * 4 // 3)
+
+
+class FakeOpenAI:
+    """Plans one chat completion: tool calls, a structured object, or plain text."""
+
+    def __init__(self, config: FakeOpenAIConfig):
+        self.config = config
+        self.rules = [(re.compile(rule['pattern'], re.IGNORECASE), rule) for rule in config.tool_script]
+        self.requests = 0
+        self.in_flight = 0
+        self._slots = asyncio.Semaphore(config.capacity) if config.capacity > 0 else None
+
+    def slot(self):
+        return self._slots if self._slots is not None else contextlib.nullcontext()
+
+    def reply_text(self, messages: list[dict], rule: dict | None = None) -> str:
+        tool_results = [_text(m.get('content')) for m in messages if m.get('role') == 'tool']
+        lead = (rule or {}).get('reply') or (
+            f'Here is your lesson based on: {tool_results[-1]}.' if tool_results else 'Here is your lesson.'
+        )
+        words = lead.split()
+        while len(words) < self.config.reply_words:
+            words.extend(FILLER)
+        return ' '.join(words[:max(self.config.reply_words, len(lead.split()))])
+
+    def plan(self, body: dict) -> dict:
+        messages = body.get('messages', [])
+        functions = {tool['function']['name']: tool['function'] for tool in body.get('tools', []) if 'function' in tool}
+        user_text = next((_text(m.get('content')) for m in reversed(messages) if m.get('role') == 'user'), '')
+
+        forced = body.get('tool_choice')
+        if isinstance(forced, dict) and forced.get('function', {}).get('name') in functions:
+            function = functions[forced['function']['name']]
+            arguments = fill_schema(function.get('parameters') or {}, self.reply_text(messages))
+            return {'tool_calls': [self._tool_call(function['name'], arguments)]}
+
+        response_format = body.get('response_format') or {}
+        if response_format.get('type') == 'json_schema':
+            schema = response_format.get('json_schema', {}).get('schema', {})
+            return {'content': json.dumps(fill_schema(schema, self.reply_text(messages)))}
+        if response_format.get('type') == 'json_object':
+            return {'content': json.dumps({'status': 'completed', 'message': self.reply_text(messages)})}
+
+        if functions and messages and messages[-1].get('role') != 'tool':
+            for pattern, rule in self.rules:
+                calls = rule.get('tool_calls', [])
+                if calls and pattern.search(user_text) and all(call['name'] in functions for call in calls):
+                    return {'tool_calls': [
+                        self._tool_call(call['name'], _tool_arguments(functions[call['name']], call.get('arguments', {}), user_text))
+                        for call in calls
+                    ]}
+
+        rule = next((rule for pattern, rule in self.rules if pattern.search(user_text)), None)
+        return {'content': self.reply_text(messages, rule)}
+
+    @staticmethod
+    def _tool_call(name: str, arguments: dict) -> dict:
+        return {'id': f'call_{uuid4().hex[:24]}', 'type': 'function', 'function': {'name': name, 'arguments': json.dumps(arguments)}}
+
+
+def _usage(prompt_tokens: int, completion_tokens: int) -> dict:
+    return {
+        'prompt_tokens': prompt_tokens,
+        'completion_tokens': completion_tokens,
+        'total_tokens': prompt_tokens + completion_tokens,
+    }
+
+
+def create_app(config: FakeOpenAIConfig | None = None) -> Starlette:
+    fake = FakeOpenAI(config or FakeOpenAIConfig())
+    token_delay = 1 / fake.config.tokens_per_second if fake.config.tokens_per_second > 0 else 0.0
+
+    async def chat_completions(request: Request):
+        body = await request.json()
+        fake.requests += 1
+        model = body.get('model', 'fake-model')
+        completion_id = f'chatcmpl-{uuid4().hex}'
+        created = int(time.time())
+        plan = fake.plan(body)
+        prompt_tokens = _count_tokens(body.get('messages', []))
+        content = plan.get('content')
+        tokens = content.split(' ') if content else []
+        finish_reason = 'tool_calls' if 'tool_calls' in plan else 'stop'
+
+        if not body.get('stream'):
+            async with fake.slot():
+                fake.in_flight += 1
+                try:
+                    await asyncio.sleep(fake.config.latency.sample() + len(tokens) * token_delay)
+                finally:
+                    fake.in_flight -= 1
+            message = {'role': 'assistant', 'content': content}
+            if 'tool_calls' in plan:
+                message['tool_calls'] = plan['tool_calls']
+            return JSONResponse({
+                'id': completion_id,
+                'object': 'chat.completion',
+                'created': created,
+                'model': model,
+                'choices': [{'index': 0, 'message': message, 'finish_reason': finish_reason}],
+                'usage': _usage(prompt_tokens, max(len(tokens), 1)),
+            })
+
+        include_usage = (body.get('stream_options') or {}).get('include_usage', False)
+
+        def chunk(delta: dict, finish: str | None = None, usage: dict | None = None) -> str:
+            payload = {
+                'id': completion_id,
+                'object': 'chat.completion.chunk',
+                'created': created,
+                'model': model,
+                'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish}] if usage is None else [],
+            }
+            if usage is not None:
+                payload['usage'] = usage
+            return f'data: {json.dumps(payload)}\n\n'
+
+        async def events():
+            async with fake.slot():
+                fake.in_flight += 1
+                try:
+                    await asyncio.sleep(fake.config.latency.sample())
+                    yield chunk({'role': 'assistant', 'content': ''})
+                    for i, call in enumerate(plan.get('tool_calls', [])):
+                        yield chunk({'tool_calls': [{'index': i, **call}]})
+                    for i, token in enumerate(tokens):
+                        if token_delay:
+                            await asyncio.sleep(token_delay)
+                        yield chunk({'content': token if i == 0 else f' {token}'})
+                    yield chunk({}, finish_reason)
+                    if include_usage:
+                        yield chunk({}, usage=_usage(prompt_tokens, max(len(tokens), 1)))
+                    yield 'data: [DONE]\n\n'
+                finally:
+                    fake.in_flight -= 1
+
+        return StreamingResponse(events(), media_type='text/event-stream')
+
+    async def models(request: Request):
+        return JSONResponse({'object': 'list', 'data': [{'id': 'fake-model', 'object': 'model', 'owned_by': 'local'}]})
+
+    async def stats(request: Request):
+        return JSONResponse({'requests': fake.requests, 'in_flight': fake.in_flight})
+
+    app = Starlette(routes=[
+        Route('/v1/chat/completions', chat_completions, methods=['POST']),
+        Route('/chat/completions', chat_completions, methods=['POST']),
+        Route('/v1/models', models),
+        Route('/stats', stats),
+    ])
+    app.state.fake = fake
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description='OpenAI-compatible chat completions stand-in for offline load tests')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--latency', choices=LATENCY_DISTRIBUTIONS, default='lognormal', help='time-to-first-token distribution')
+    parser.add_argument('--latency-mean', type=float, default=0.3, help='seconds (median for lognormal)')
+    parser.add_argument('--latency-spread', type=float, default=0.4, help='half-width, stddev or lognormal sigma')
+    parser.add_argument('--tokens-per-second', type=float, default=50.0, help='streaming rate; 0 for no delay')
+    parser.add_argument('--reply-words', type=int, default=120)
+    parser.add_argument('--capacity', type=int, default=0, help='concurrent completions served, 0 for unlimited')
+    parser.add_argument('--tool-script', help='JSON list of {"pattern", "tool_calls": [{"name", "arguments"}], "reply"} rules')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    config = FakeOpenAIConfig(
+        latency=LatencyModel(args.latency, args.latency_mean, args.latency_spread),
+        tokens_per_second=args.tokens_per_second,
+        reply_words=args.reply_words,
+        capacity=args.capacity,
+    )
+    if args.tool_script:
+        with open(args.tool_script) as f:
+            config.tool_script = json.load(f)
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level='warning')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import gc
+import resource
+import sqlite3
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from language_learning_academy.agent.checkpoint import BoundedCheckpointSaver
+from language_learning_academy.agent.executor import LanguageLearningAgent
+from stub_model import StubChatModel
+
+
+def rss_mb() -> float:
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+
+async def soak(args, checkpointer: BoundedCheckpointSaver) -> None:
+    agent = LanguageLearningAgent(
+        model=StubChatModel(latency=0),
+        checkpointer=checkpointer,
+        response_cache=False,
+    )
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def replay(i: int) -> None:
+        async with semaphore:
+            async for _ in agent.stream(f'Teach me Spanish word #{i}', f'soak-{i}'):
+                pass
+
+    samples = []
+    started = time.perf_counter()
+    for batch_start in range(0, args.contexts, args.sample_every):
+        batch_end = min(batch_start + args.sample_every, args.contexts)
+        await asyncio.gather(*(replay(i) for i in range(batch_start, batch_end)))
+        gc.collect()
+        samples.append(rss_mb())
+        print(
+            f"contexts={batch_end:>7} rss={samples[-1]:7.1f}MB "
+            f"hot_threads={checkpointer.hot_threads:>5} "
+            f"elapsed={time.perf_counter() - started:7.1f}s"
+        )
+
+    warm = samples[min(len(samples) - 1, args.warmup_samples)]
+    growth = max(samples) - warm
+    print(f"RSS growth after warm-up: {growth:.1f}MB (limit {args.max_growth_mb}MB)")
+    assert growth <= args.max_growth_mb, 'checkpointer memory is not flat'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay synthetic contexts and check checkpointer memory stays flat')
+    parser.add_argument('--contexts', type=int, default=100_000)
+    parser.add_argument('--sample-every', type=int, default=5_000)
+    parser.add_argument('--warmup-samples', type=int, default=2)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--max-threads', type=int, default=1000)
+    parser.add_argument('--max-growth-mb', type=float, default=25.0)
+    parser.add_argument('--memory-only', action='store_true', help='skip the SQLite backing store')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backing = None
+        if not args.memory_only:
+            from langgraph.checkpoint.sqlite import SqliteSaver
+
+            conn = sqlite3.connect(str(Path(tmp) / 'soak.sqlite'), check_same_thread=False)
+            backing = SqliteSaver(conn)
+        checkpointer = BoundedCheckpointSaver(backing=backing, max_threads=args.max_threads)
+        asyncio.run(soak(args, checkpointer))
+
+
+if __name__ == '__main__':
+    main()
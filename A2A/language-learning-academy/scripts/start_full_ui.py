@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
+import argparse
 import asyncio
-import subprocess
+import os
+import signal
 import sys
 import time
 import webbrowser
@@ -8,68 +10,164 @@ import webbrowser
 import httpx
 
 
-async def check_agent_health():
+AGENT_PORT = int(os.getenv('SERVER_PORT', '9999'))
+UI_PORT = int(os.getenv('UI_PORT', '8501'))
+AGENT_READY_URL = f'http://localhost:{AGENT_PORT}/.well-known/agent-card.json'
+UI_READY_URL = f'http://localhost:{UI_PORT}/_stcore/health'
+READY_TIMEOUT_SECONDS = 60.0
+INITIAL_BACKOFF_SECONDS = 0.05
+MAX_BACKOFF_SECONDS = 1.0
+
+
+LOG_READ_BYTES = 64 * 1024
+
+
+def print_log_line(name: str, line: bytes):
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get('http://localhost:9999/.well-known/agent-card.json')
-            return response.status_code == 200
-    except:
-        return False
+        print(f"[{name}] {line.decode(errors='replace').rstrip()}", flush=True)
+    except Exception as e:
+        # One line the console cannot take must not stop the draining
+        print(f"[{name}] <log line not shown: {e!r}>", flush=True)
 
-def main():
-    print("🎓 Language Learning Academy - Full UI Launcher")
-    print("=" * 60)
 
-    print("📋 Starting services...")
+async def pump_logs(name: str, stream: asyncio.StreamReader):
+    # Drain the child's output continuously so a full pipe never blocks it.
+    # Reads are chunked rather than line by line: StreamReader's line iterator
+    # raises ValueError on a line longer than its 64 KiB limit (a long
+    # traceback or JSON dump), which would stop the draining.
+    pending = b''
+    while True:
+        try:
+            chunk = await stream.read(LOG_READ_BYTES)
+        except Exception as e:
+            print(f"[{name}] log stream closed: {e!r}", flush=True)
+            break
+        if not chunk:
+            break
+        *lines, pending = (pending + chunk).split(b'\n')
+        for line in lines:
+            print_log_line(name, line)
+        if len(pending) > LOG_READ_BYTES:
+            print_log_line(name, pending)
+            pending = b''
+    if pending:
+        print_log_line(name, pending)
+
 
-    print("1️⃣ Starting Language Learning Academy Agent...")
-    agent_process = subprocess.Popen(
-        ['uv', 'run', 'python', '-m', 'language_learning_academy.server.main'],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        cwd='src'
+async def start_service(name: str, args: list[str], cwd: str | None = None, env: dict | None = None):
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        cwd=cwd,
+        env=env,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
     )
+    log_task = asyncio.create_task(pump_logs(name, process.stdout))
+    return process, log_task
 
-    print("⏳ Waiting for agent to start...")
-    for i in range(30):
-        time.sleep(1)
-        if asyncio.run(check_agent_health()):
-            print("✅ Agent is ready!")
-            break
-        print(f"   Checking... ({i+1}/30)")
-    else:
-        print("❌ Agent failed to start!")
-        agent_process.terminate()
-        sys.exit(1)
 
-    print("2️⃣ Starting Streamlit Web UI...")
-    streamlit_process = subprocess.Popen([
-        'uv', 'run', 'python', '-m', 'streamlit', 'run', 'src/language_learning_academy/ui/streamlit_app.py',
-        '--server.port', '8501',
-        '--server.headless', 'true'
-    ])
+async def wait_until_ready(client: httpx.AsyncClient, name: str, url: str, process, started: float) -> float:
+    delay = INITIAL_BACKOFF_SECONDS
+    deadline = started + READY_TIMEOUT_SECONDS
+    while time.perf_counter() < deadline:
+        if process.returncode is not None:
+            raise RuntimeError(f"{name} exited with code {process.returncode} before becoming ready")
+        try:
+            if (await client.get(url)).status_code == 200:
+                elapsed = time.perf_counter() - started
+                print(f"✅ {name} is ready after {elapsed:.2f}s")
+                return elapsed
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, MAX_BACKOFF_SECONDS)
+    raise RuntimeError(f"{name} was not ready within {READY_TIMEOUT_SECONDS:.0f}s")
+
 
-    print("⏳ Waiting for UI to start...")
-    time.sleep(5)
+async def stop(processes):
+    for process in processes:
+        if process.returncode is None:
+            process.terminate()
+    for process in processes:
+        try:
+            await asyncio.wait_for(process.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            process.kill()
 
-    print("🌐 Opening web browser...")
-    webbrowser.open('http://localhost:8501')
+
+async def run(open_browser: bool) -> int:
+    print("🎓 Language Learning Academy - Full UI Launcher")
+    print("=" * 60)
+
+    print("📋 Starting agent and web UI...")
+    started = time.perf_counter()
+    agent_process, agent_logs = await start_service(
+        'agent',
+        ['uv', 'run', 'python', '-m', 'language_learning_academy.server.main', '--port', str(AGENT_PORT)],
+        cwd='src',
+    )
+    ui_process, ui_logs = await start_service(
+        'ui',
+        [
+            'uv', 'run', 'python', '-m', 'streamlit', 'run', 'src/language_learning_academy/ui/streamlit_app.py',
+            '--server.port', str(UI_PORT),
+            '--server.headless', 'true',
+        ],
+        env={**os.environ, 'AGENT_URL': f'http://localhost:{AGENT_PORT}'},
+    )
+    processes = [agent_process, ui_process]
+
+    try:
+        async with httpx.AsyncClient(timeout=2.0) as client:
+            await asyncio.gather(
+                wait_until_ready(client, 'Agent', AGENT_READY_URL, agent_process, started),
+                wait_until_ready(client, 'Web UI', UI_READY_URL, ui_process, started),
+            )
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        await stop(processes)
+        return 1
+    startup = time.perf_counter() - started
+
+    if open_browser:
+        print("🌐 Opening web browser...")
+        webbrowser.open(f'http://localhost:{UI_PORT}')
 
     print("\n" + "=" * 60)
-    print("🎉 Language Learning Academy is now running!")
-    print("📊 Agent API: http://localhost:9999")
-    print("🎨 Web UI: http://localhost:8501")
+    print(f"🎉 Language Learning Academy is running (startup took {startup:.2f}s)")
+    print(f"📊 Agent API: http://localhost:{AGENT_PORT}")
+    print(f"🎨 Web UI: http://localhost:{UI_PORT}")
     print("=" * 60)
     print("Press Ctrl+C to stop all services")
 
+    waiters = [asyncio.create_task(process.wait()) for process in processes]
     try:
-        agent_process.wait()
-        streamlit_process.wait()
-    except KeyboardInterrupt:
+        done, _ = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        for process in processes:
+            if process.returncode is not None:
+                print(f"⚠️ A service exited with code {process.returncode}; stopping the other")
+                break
+    finally:
         print("\n🛑 Stopping services...")
-        agent_process.terminate()
-        streamlit_process.terminate()
+        await stop(processes)
+        await asyncio.gather(agent_logs, ui_logs, return_exceptions=True)
         print("✅ All services stopped!")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Start the agent server and Streamlit UI together')
+    parser.add_argument('--no-browser', action='store_true', help='do not open a browser once ready')
+    args = parser.parse_args()
+
+    if sys.platform != 'win32':
+        # Turn SIGTERM into KeyboardInterrupt so children are stopped as well.
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        sys.exit(asyncio.run(run(not args.no_browser)))
+    except KeyboardInterrupt:
+        pass
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,147 @@
+import asyncio
+import contextlib
+import functools
+import json
+import time
+
+from typing import Any
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+
+class StubChatModel(BaseChatModel):
+    """Offline chat model that mimics one tool-calling tutor turn.
+
+    The first call asks for `get_vocabulary_lesson`, the call after the tool
+    result answers in plain text, and the structured-output call returns a
+    `ResponseFormat` tool call. A call with no tools bound (history
+    summarization) returns `summary`. Every call sleeps for `latency` seconds
+    plus `prompt_latency` seconds per 1k prompt tokens before its first token,
+    and `token_latency` seconds per word of text output. With `capacity` set,
+    async calls beyond that many in flight queue as they would at a saturated
+    provider.
+    """
+
+    latency: float = 0.05
+    prompt_latency: float = 0.0
+    token_latency: float = 0.0
+    reply: str = 'Here are five beginner Spanish food words: pan, queso, leche, manzana, agua.'
+    summary: str = 'The learner is a Spanish beginner and has covered food vocabulary.'
+    capacity: int = 0
+    bound_tools: list[str] = []
+    calls: list[list[BaseMessage]] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return 'stub-chat'
+
+    def bind_tools(self, tools, **kwargs: Any):
+        names = [convert_to_openai_tool(t)['function']['name'] for t in tools]
+        return self.model_copy(update={'bound_tools': names})
+
+    def _respond(self, messages: list[BaseMessage]) -> AIMessage:
+        self.calls.append(list(messages))
+        message = self._reply(messages)
+        message.usage_metadata = {
+            'input_tokens': count_tokens(messages),
+            'output_tokens': len(message.content.split()) + len(message.tool_calls),
+            'total_tokens': 0,
+        }
+        message.usage_metadata['total_tokens'] = sum(message.usage_metadata.values())
+        return message
+
+    def _reply(self, messages: list[BaseMessage]) -> AIMessage:
+        if not self.bound_tools:
+            return AIMessage(content=self.summary)
+        if 'ResponseFormat' in self.bound_tools:
+            return AIMessage(
+                content='',
+                tool_calls=[{
+                    'name': 'ResponseFormat',
+                    'args': {'status': 'completed', 'message': self.reply},
+                    'id': 'call_response_format',
+                }],
+            )
+        if not isinstance(messages[-1], ToolMessage):
+            return AIMessage(
+                content='',
+                tool_calls=[{
+                    'name': 'get_vocabulary_lesson',
+                    'args': {'language': 'spanish', 'category': 'food'},
+                    'id': 'call_vocabulary',
+                }],
+            )
+        return AIMessage(content=self.reply)
+
+    def _chunks(self, message: AIMessage) -> list[AIMessageChunk]:
+        if message.tool_calls:
+            return [AIMessageChunk(
+                content='',
+                tool_call_chunks=[
+                    {'name': c['name'], 'args': json.dumps(c['args']), 'id': c['id'], 'index': i}
+                    for i, c in enumerate(message.tool_calls)
+                ],
+                usage_metadata=message.usage_metadata,
+            )]
+        words = message.content.split(' ')
+        chunks = [AIMessageChunk(content=w if i == 0 else f' {w}') for i, w in enumerate(words)]
+        chunks[-1].usage_metadata = message.usage_metadata
+        return chunks
+
+    def _first_token_delay(self, messages: list[BaseMessage]) -> float:
+        if not self.prompt_latency:
+            return self.latency
+        return self.latency + self.prompt_latency * count_tokens(messages) / 1000
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        message = self._respond(messages)
+        time.sleep(self._first_token_delay(messages) + self.token_latency * len(self._chunks(message)))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        async with _provider_slots(self.capacity):
+            message = self._respond(messages)
+            await asyncio.sleep(self._first_token_delay(messages) + self.token_latency * len(self._chunks(message)))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        time.sleep(self._first_token_delay(messages))
+        for chunk in self._chunks(self._respond(messages)):
+            time.sleep(self.token_latency)
+            yield ChatGenerationChunk(message=chunk)
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        async with _provider_slots(self.capacity):
+            await asyncio.sleep(self._first_token_delay(messages))
+            for chunk in self._chunks(self._respond(messages)):
+                await asyncio.sleep(self.token_latency)
+                yield ChatGenerationChunk(message=chunk)
+
+
+_semaphores: dict[int, asyncio.Semaphore] = {}
+
+
+def _provider_slots(capacity: int):
+    if not capacity:
+        return contextlib.nullcontext()
+    return _semaphores.setdefault(capacity, asyncio.Semaphore(capacity))
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding():
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding('o200k_base')
+    except Exception:
+        return None
+
+
+def count_tokens(messages: list[BaseMessage]) -> int:
+    """Prompt tokens with tiktoken when its encoding is available, else ~4 chars/token."""
+    text = '\n'.join(m.content if isinstance(m.content, str) else str(m.content) for m in messages)
+    encoding = _encoding()
+    return len(encoding.encode(text)) if encoding else len(text) // 4
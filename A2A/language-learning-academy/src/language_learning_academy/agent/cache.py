@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any
+
+from language_learning_academy.paths import data_path
+
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 24 * 3600.0
+DEFAULT_MAX_ROWS = 100_000
+PURGE_EVERY_WRITES = 256
+
+PROFILE_FIELDS = {
+    'native_language': 'English',
+    'learning_goal': 'Travel',
+    'tutor_persona': 'Friendly',
+    'correction_strictness': 'Standard',
+}
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return ' '.join(value.lower().split())
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def profile_fields(profile: dict | None) -> dict[str, str]:
+    profile = profile or {}
+    return {field: profile.get(field, default) for field, default in PROFILE_FIELDS.items()}
+
+
+def make_cache_key(kind: str, payload: Any, profile: dict | None, model_name: str) -> str:
+    material = json.dumps(
+        [kind, _normalize(payload), _normalize(profile_fields(profile)), model_name],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of final tutor responses with an optional SQLite tier.
+
+    Values are the JSON-serializable ``ResponseFormat`` payloads. Entries older
+    than ``ttl_seconds`` are treated as misses in both tiers. The SQLite tier
+    drops expired rows at startup and every ``PURGE_EVERY_WRITES`` writes, and
+    is then trimmed to the newest ``max_rows``. ``aget``/``aset`` are for the
+    event loop: memory hits stay on the loop, SQLite access runs in a thread.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+        path: str | None = None,
+        max_rows: int | None = DEFAULT_MAX_ROWS,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_rows = max_rows
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        if path:
+            self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._conn.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    created_at REAL NOT NULL,
+                    value TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at);
+                """
+            )
+            self._purge()
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, created_at: float, value: dict) -> None:
+        self._entries[key] = (created_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _purge(self) -> None:
+        if self.ttl_seconds is not None:
+            self._conn.execute('DELETE FROM responses WHERE created_at < ?', (time.time() - self.ttl_seconds,))
+        if self.max_rows:
+            self._conn.execute(
+                'DELETE FROM responses WHERE key NOT IN '
+                '(SELECT key FROM responses ORDER BY created_at DESC LIMIT ?)',
+                (self.max_rows,),
+            )
+
+    def _memory_get(self, key: str) -> dict | None:
+        entry = self._entries.get(key)
+        if entry and not self._expired(entry[0]):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self._entries.pop(key, None)
+        return None
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            if (value := self._memory_get(key)) is not None:
+                return value
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    'SELECT created_at, value FROM responses WHERE key = ?', (key,)
+                ).fetchone()
+                if row and not self._expired(row[0]):
+                    value = json.loads(row[1])
+                    self._remember(key, row[0], value)
+                    self.hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def _store(self, key: str, created_at: float, value: dict) -> None:
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (key, created_at, value) VALUES (?, ?, ?)',
+                (key, created_at, json.dumps(value)),
+            )
+            self._writes += 1
+            if self._writes % PURGE_EVERY_WRITES == 0:
+                self._purge()
+
+    def set(self, key: str, value: dict) -> None:
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, created_at, value)
+        if self._conn is not None:
+            self._store(key, created_at, value)
+
+    async def aget(self, key: str) -> dict | None:
+        if self._conn is None:
+            return self.get(key)
+        with self._lock:
+            if (value := self._memory_get(key)) is not None:
+                return value
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: dict) -> None:
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, created_at, value)
+        if self._conn is not None:
+            await asyncio.to_thread(self._store, key, created_at, value)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+        }
+
+
+def build_response_cache() -> ResponseCache | None:
+    if os.getenv('RESPONSE_CACHE', 'true').lower() == 'false':
+        return None
+    ttl = float(os.getenv('RESPONSE_CACHE_TTL_SECONDS', DEFAULT_TTL_SECONDS))
+    max_rows = int(os.getenv('RESPONSE_CACHE_MAX_ROWS', DEFAULT_MAX_ROWS))
+    path = os.getenv('RESPONSE_CACHE_PATH')
+    return ResponseCache(
+        max_entries=int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES)),
+        ttl_seconds=ttl if ttl > 0 else None,
+        # Same resolution as CHECKPOINT_PATH/TASK_STORE_PATH, so a relative path
+        # does not follow the working directory
+        path=data_path(path, '') if path else None,
+        max_rows=max_rows if max_rows > 0 else None,
+    )
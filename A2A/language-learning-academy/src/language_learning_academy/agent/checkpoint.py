@@ -0,0 +1,384 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+from language_learning_academy.paths import data_path
+
+
+DEFAULT_CHECKPOINT_PATH = 'checkpoints.sqlite'
+DEFAULT_MAX_THREADS = 1000
+DEFAULT_THREAD_TTL_SECONDS = 3600.0
+DEFAULT_MAX_MESSAGES = 200
+
+
+@dataclass
+class _HotEntry:
+    config: RunnableConfig
+    checkpoint: tuple[str, bytes]
+    metadata: CheckpointMetadata
+    parent_config: RunnableConfig | None
+    writes: dict[tuple[str, int], tuple[str, str, tuple[str, bytes]]] = field(default_factory=dict)
+
+
+class BoundedCheckpointSaver(BaseCheckpointSaver):
+    """Checkpointer keyed by A2A context id with a bounded in-memory tier.
+
+    The hot tier holds only the latest checkpoint of the most recently used
+    threads and evicts by LRU (``max_threads``) and idle time (``ttl_seconds``).
+    Every write goes through to ``backing`` (SQLite by default), which is also
+    the fallback for hot-tier misses. Without a backing saver evicted threads
+    are forgotten. Stored message histories are capped at ``max_messages``.
+
+    With ``shared`` (several server workers on one SQLite file) a cached
+    checkpoint is only served while it is still the latest one in the backing
+    store, so a turn written by another worker is never overwritten from a
+    stale copy.
+    """
+
+    def __init__(
+        self,
+        backing: BaseCheckpointSaver | None = None,
+        max_threads: int = DEFAULT_MAX_THREADS,
+        ttl_seconds: float | None = DEFAULT_THREAD_TTL_SECONDS,
+        max_messages: int | None = DEFAULT_MAX_MESSAGES,
+        shared: bool = False,
+    ):
+        if shared and not hasattr(backing, 'cursor'):
+            raise ValueError('shared=True needs a SqliteSaver backing store')
+        super().__init__(serde=backing.serde if backing else None)
+        self.backing = backing
+        self.shared = shared
+        self.max_threads = max_threads
+        self.ttl_seconds = ttl_seconds
+        self.max_messages = max_messages
+        self._hot: OrderedDict[str, tuple[float, dict[str, _HotEntry]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def hot_threads(self) -> int:
+        return len(self._hot)
+
+    def _evict(self, now: float) -> None:
+        while len(self._hot) > self.max_threads:
+            self._hot.popitem(last=False)
+        if self.ttl_seconds is None:
+            return
+        while self._hot:
+            touched, _ = next(iter(self._hot.values()))
+            if now - touched < self.ttl_seconds:
+                break
+            self._hot.popitem(last=False)
+
+    def _namespaces(self, thread_id: str, create: bool = False) -> dict[str, _HotEntry] | None:
+        now = time.monotonic()
+        slot = self._hot.pop(thread_id, None)
+        if slot is None:
+            if not create:
+                self._evict(now)
+                return None
+            slot = (now, {})
+        self._hot[thread_id] = (now, slot[1])
+        self._evict(now)
+        return slot[1]
+
+    def _trim(self, checkpoint: Checkpoint) -> Checkpoint:
+        messages = checkpoint['channel_values'].get('messages')
+        if not self.max_messages or not messages or len(messages) <= self.max_messages:
+            return checkpoint
+
+        kept = messages[-self.max_messages:]
+        start = next((i for i, m in enumerate(kept) if isinstance(m, HumanMessage)), None)
+        if start is None:
+            start = next((i for i, m in enumerate(kept) if not isinstance(m, ToolMessage)), len(kept))
+        kept = kept[start:]
+        # The learner profile is only sent once per context, so carry the most
+        # recent system message over the cut instead of dropping it.
+        dropped = messages[:len(messages) - len(kept)]
+        system = next((m for m in reversed(dropped) if isinstance(m, SystemMessage)), None)
+        if system is not None and not any(isinstance(m, SystemMessage) for m in kept):
+            kept = [system, *kept]
+        return {
+            **checkpoint,
+            'channel_values': {**checkpoint['channel_values'], 'messages': kept},
+        }
+
+    def _to_tuple(self, entry: _HotEntry) -> CheckpointTuple:
+        return CheckpointTuple(
+            config=entry.config,
+            checkpoint=self.serde.loads_typed(entry.checkpoint),
+            metadata=entry.metadata,
+            parent_config=entry.parent_config,
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed(value))
+                for task_id, channel, value in entry.writes.values()
+            ],
+        )
+
+    def _latest_backing_id(self, thread_id: str, checkpoint_ns: str) -> str | None:
+        # Only the id column, so validating a hot entry is far cheaper than a miss
+        with self.backing.cursor(transaction=False) as cur:
+            cur.execute(
+                'SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? '
+                'ORDER BY checkpoint_id DESC LIMIT 1',
+                (str(thread_id), checkpoint_ns),
+            )
+            row = cur.fetchone()
+        return row[0] if row else None
+
+    def _cached_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        thread_id = config['configurable']['thread_id']
+        checkpoint_ns = config['configurable'].get('checkpoint_ns', '')
+        checkpoint_id = get_checkpoint_id(config)
+        validate = self.shared and not checkpoint_id
+        latest_id = self._latest_backing_id(thread_id, checkpoint_ns) if validate else None
+        with self._lock:
+            namespaces = self._namespaces(thread_id)
+            entry = namespaces.get(checkpoint_ns) if namespaces else None
+            if entry is None:
+                return None
+            cached_id = entry.config['configurable']['checkpoint_id']
+            if checkpoint_id and checkpoint_id != cached_id:
+                return None
+            if validate and latest_id != cached_id:
+                # Another worker wrote a newer checkpoint; reload it from the backing store
+                return None
+            return self._to_tuple(entry)
+
+    def _fill(self, config: RunnableConfig, saved: CheckpointTuple | None) -> CheckpointTuple | None:
+        if saved is None or get_checkpoint_id(config):
+            return saved
+        entry = _HotEntry(
+            config=saved.config,
+            checkpoint=self.serde.dumps_typed(saved.checkpoint),
+            metadata=saved.metadata,
+            parent_config=saved.parent_config,
+        )
+        for idx, (task_id, channel, value) in enumerate(saved.pending_writes or []):
+            entry.writes[(task_id, idx)] = (task_id, channel, self.serde.dumps_typed(value))
+        with self._lock:
+            namespaces = self._namespaces(config['configurable']['thread_id'], create=True)
+            namespaces[config['configurable'].get('checkpoint_ns', '')] = entry
+        return saved
+
+    def _remember(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        next_config: RunnableConfig,
+    ) -> None:
+        thread_id = config['configurable']['thread_id']
+        checkpoint_ns = config['configurable'].get('checkpoint_ns', '')
+        parent_id = config['configurable'].get('checkpoint_id')
+        entry = _HotEntry(
+            config=next_config,
+            checkpoint=self.serde.dumps_typed(checkpoint),
+            metadata=get_checkpoint_metadata(config, metadata),
+            parent_config=(
+                {
+                    'configurable': {
+                        'thread_id': thread_id,
+                        'checkpoint_ns': checkpoint_ns,
+                        'checkpoint_id': parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+        )
+        with self._lock:
+            self._namespaces(thread_id, create=True)[checkpoint_ns] = entry
+
+    def _remember_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+    ) -> None:
+        thread_id = config['configurable']['thread_id']
+        checkpoint_ns = config['configurable'].get('checkpoint_ns', '')
+        with self._lock:
+            namespaces = self._namespaces(thread_id)
+            entry = namespaces.get(checkpoint_ns) if namespaces else None
+            if entry is None or entry.config['configurable']['checkpoint_id'] != config['configurable']['checkpoint_id']:
+                return
+            for idx, (channel, value) in enumerate(writes):
+                key = (task_id, WRITES_IDX_MAP.get(channel, idx))
+                if key[1] >= 0 and key in entry.writes:
+                    continue
+                entry.writes[key] = (task_id, channel, self.serde.dumps_typed(value))
+
+    def _local_config(self, config: RunnableConfig, checkpoint: Checkpoint) -> RunnableConfig:
+        return {
+            'configurable': {
+                'thread_id': config['configurable']['thread_id'],
+                'checkpoint_ns': config['configurable'].get('checkpoint_ns', ''),
+                'checkpoint_id': checkpoint['id'],
+            }
+        }
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        if (cached := self._cached_tuple(config)) is not None:
+            return cached
+        if self.backing is None:
+            return None
+        return self._fill(config, self.backing.get_tuple(config))
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        if self.backing is not None:
+            yield from self.backing.list(config, filter=filter, before=before, limit=limit)
+            return
+        if config and (cached := self._cached_tuple(config)) is not None:
+            yield cached
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        checkpoint = self._trim(checkpoint)
+        if self.backing is not None:
+            next_config = self.backing.put(config, checkpoint, metadata, new_versions)
+        else:
+            next_config = self._local_config(config, checkpoint)
+        self._remember(config, checkpoint, metadata, next_config)
+        return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = '',
+    ) -> None:
+        if self.backing is not None:
+            self.backing.put_writes(config, writes, task_id, task_path)
+        self._remember_writes(config, writes, task_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._hot.pop(thread_id, None)
+        if self.backing is not None:
+            self.backing.delete_thread(thread_id)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        if self.shared:
+            # Validating the hot entry reads SQLite, so keep it off the event loop
+            return await asyncio.to_thread(self.get_tuple, config)
+        if (cached := self._cached_tuple(config)) is not None:
+            return cached
+        if self.backing is None:
+            return None
+        return self._fill(config, await asyncio.to_thread(self.backing.get_tuple, config))
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        saved = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in saved:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        checkpoint = self._trim(checkpoint)
+        if self.backing is not None:
+            next_config = await asyncio.to_thread(
+                self.backing.put, config, checkpoint, metadata, new_versions
+            )
+        else:
+            next_config = self._local_config(config, checkpoint)
+        self._remember(config, checkpoint, metadata, next_config)
+        return next_config
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = '',
+    ) -> None:
+        if self.backing is not None:
+            await asyncio.to_thread(self.backing.put_writes, config, writes, task_id, task_path)
+        self._remember_writes(config, writes, task_id)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._hot.pop(thread_id, None)
+        if self.backing is not None:
+            await asyncio.to_thread(self.backing.delete_thread, thread_id)
+
+    def get_next_version(self, current: str | None, channel: None) -> str:
+        if self.backing is not None:
+            return self.backing.get_next_version(current, channel)
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split('.')[0])
+        return f'{current_v + 1:032}.0'
+
+
+def build_checkpointer() -> BaseCheckpointSaver:
+    backend = os.getenv('CHECKPOINT_BACKEND', 'sqlite').lower()
+    ttl = float(os.getenv('CHECKPOINT_TTL_SECONDS', DEFAULT_THREAD_TTL_SECONDS))
+    max_messages = int(os.getenv('CHECKPOINT_MAX_MESSAGES', DEFAULT_MAX_MESSAGES))
+
+    backing = None
+    if backend == 'sqlite':
+        from langgraph.checkpoint.sqlite import SqliteSaver
+
+        path = data_path(os.getenv('CHECKPOINT_PATH'), DEFAULT_CHECKPOINT_PATH)
+        backing = SqliteSaver(sqlite3.connect(path, check_same_thread=False))
+    elif backend != 'memory':
+        raise ValueError(f'Unknown CHECKPOINT_BACKEND: {backend}')
+
+    return BoundedCheckpointSaver(
+        backing=backing,
+        max_threads=int(os.getenv('CHECKPOINT_MAX_THREADS', DEFAULT_MAX_THREADS)),
+        ttl_seconds=ttl if ttl > 0 else None,
+        max_messages=max_messages if max_messages > 0 else None,
+        # Worker processes share the SQLite file, so each hot tier can go stale
+        shared=backing is not None and int(os.getenv('SERVER_WORKERS', '1')) > 1,
+    )
@@ -1,67 +1,111 @@
+import asyncio
+import functools
+import hashlib
 import logging
 import os
+import threading
+import time
+import uuid
 
 from collections.abc import AsyncIterable
+from contextlib import aclosing
 from typing import Any, Literal
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.server.tasks import TaskUpdater
 from a2a.types import (
+    DataPart,
     InternalError,
     InvalidParamsError,
     Part,
     TaskState,
     TextPart,
-    UnsupportedOperationError,
+    TaskNotCancelableError,
 )
 from a2a.utils import new_agent_text_message, new_task
 from a2a.utils.errors import ServerError
-from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, SystemMessage, ToolMessage
 from langchain_core.tools import tool
-from langchain_openai import ChatOpenAI
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.prebuilt import create_react_agent
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from pydantic import BaseModel
 
+from language_learning_academy.agent.cache import (
+    ResponseCache,
+    build_response_cache,
+    make_cache_key,
+)
+from language_learning_academy.agent.history import HistoryPolicy
+from language_learning_academy.agent.registry import (
+    get_chat_model,
+    get_compiled_graph,
+    get_default_checkpointer,
+)
+from language_learning_academy.agent.router import IntentRouter
+from language_learning_academy.agent.tracing import tracer
 
-memory = MemorySaver()
 
-def _build_profile_preamble(p: dict[str, str]) -> str:
-    native_lang = p.get('native_language', 'English')
-    goal = p.get('learning_goal', 'Travel')
-    persona = p.get('tutor_persona', 'Friendly')
-    strictness = p.get('correction_strictness', 'Standard')
-    
-    persona_style = {
-        'Friendly': 'Be warm, encouraging, and supportive. Use casual language and emoticons where appropriate.',
-        'Formal': 'Maintain a professional, academic tone. Be precise and structured.',
-        'Coach': 'Be motivating and goal-oriented. Push the learner to improve with constructive feedback.'
-    }.get(persona, 'Be warm and encouraging.')
-    
-    strictness_style = {
-        'Gentle': 'Point out errors softly, focus on communication over perfection.',
-        'Standard': 'Balance error correction with encouragement.',
-        'Strict': 'Correct all errors thoroughly with detailed explanations.'
-    }.get(strictness, 'Balance correction with encouragement.')
-    
-    goal_focus = {
-        'Travel': 'Focus on practical phrases, cultural etiquette, and survival vocabulary.',
-        'Business': 'Emphasize formal language, professional communication, and industry terms.',
-        'Exam prep': 'Focus on grammar rules, academic vocabulary, and test-taking strategies.'
-    }.get(goal, 'Focus on practical usage.')
-    
-    return (
+PERSONA_STYLES = {
+    'Friendly': 'Be warm, encouraging, and supportive. Use casual language and emoticons where appropriate.',
+    'Formal': 'Maintain a professional, academic tone. Be precise and structured.',
+    'Coach': 'Be motivating and goal-oriented. Push the learner to improve with constructive feedback.'
+}
+
+STRICTNESS_STYLES = {
+    'Gentle': 'Point out errors softly, focus on communication over perfection.',
+    'Standard': 'Balance error correction with encouragement.',
+    'Strict': 'Correct all errors thoroughly with detailed explanations.'
+}
+
+GOAL_FOCUS = {
+    'Travel': 'Focus on practical phrases, cultural etiquette, and survival vocabulary.',
+    'Business': 'Emphasize formal language, professional communication, and industry terms.',
+    'Exam prep': 'Focus on grammar rules, academic vocabulary, and test-taking strategies.'
+}
+
+SUPPORTED_LANGUAGES = ['Spanish', 'French', 'German', 'Italian', 'Portuguese', 'Japanese', 'Chinese', 'Korean']
+
+LEVELS = ['beginner', 'intermediate', 'advanced']
+
+PROFILE_MESSAGE_ID = 'learner-profile'
+
+@functools.lru_cache(maxsize=256)
+def _interned_preamble(native_lang: str, goal: str, persona: str, strictness: str) -> tuple[str, str]:
+    preamble = (
         f"LEARNER PROFILE:\n"
         f"Native language: {native_lang}\n"
         f"Learning goal: {goal}\n"
-        f"Preferred teaching style: {persona_style}\n"
-        f"Error correction approach: {strictness_style}\n"
-        f"Content focus: {goal_focus}\n\n"
+        f"Preferred teaching style: {PERSONA_STYLES.get(persona, 'Be warm and encouraging.')}\n"
+        f"Error correction approach: {STRICTNESS_STYLES.get(strictness, 'Balance correction with encouragement.')}\n"
+        f"Content focus: {GOAL_FOCUS.get(goal, 'Focus on practical usage.')}\n\n"
         f"IMPORTANT: Provide all explanations, clarifications, and meta-commentary in {native_lang} "
         f"while keeping target language examples, phrases, and vocabulary unchanged. "
         f"Adapt your response style and content to match the learner's preferences."
     )
+    return hashlib.sha256(preamble.encode()).hexdigest(), preamble
+
+def _profile_preamble(p: dict[str, str]) -> tuple[str, str]:
+    return _interned_preamble(
+        str(p.get('native_language', 'English')),
+        str(p.get('learning_goal', 'Travel')),
+        str(p.get('tutor_persona', 'Friendly')),
+        str(p.get('correction_strictness', 'Standard')),
+    )
+
+def _build_profile_preamble(p: dict[str, str]) -> str:
+    return _profile_preamble(p)[1]
+
+def _native_language(profile: dict | None) -> str | None:
+    return profile.get('native_language') if isinstance(profile, dict) else None
+
+def _stored_profile_digest(saved) -> str | None:
+    """Digest of the profile preamble already in a thread's checkpoint, if any."""
+    if saved is None:
+        return None
+    for message in saved.checkpoint['channel_values'].get('messages', ()):
+        if isinstance(message, SystemMessage) and message.id == PROFILE_MESSAGE_ID:
+            return hashlib.sha256(message.content.encode()).hexdigest()
+    return None
 
 @tool(description="Get vocabulary lesson for language learning")
 def get_vocabulary_lesson(
@@ -115,8 +159,8 @@ class LanguageLearningAgent:
         'You are an expert language learning tutor with deep knowledge of multiple languages and pedagogical methods. '
         'Use the available tools to provide vocabulary lessons, grammar explanations, conversation practice, quizzes, and translations. '
         'Always provide clear, structured responses with practical examples, cultural context, and pronunciation guidance when relevant. '
-        'Support these languages: Spanish, French, German, Italian, Portuguese, Japanese, Chinese, Korean. '
-        'Adapt your teaching style to beginner, intermediate, or advanced levels. '
+        f'Support these languages: {", ".join(SUPPORTED_LANGUAGES)}. '
+        f'Adapt your teaching style to {", ".join(LEVELS[:-1])}, or {LEVELS[-1]} levels. '
         'Format responses with proper markdown for readability. '
         'If users ask about anything other than language learning, politely redirect them to language-related topics.'
     )
@@ -127,12 +171,33 @@ class LanguageLearningAgent:
         'Set response status to completed if the request is complete and helpful.'
     )
 
-    def __init__(self):
-        self.model = ChatOpenAI(
-            model=os.getenv('OPENAI_MODEL', 'gpt-5-2025-08-07'),
-            openai_api_key=os.getenv('OPENAI_API_KEY'),
+    def __init__(
+        self,
+        model=None,
+        async_mode: bool | None = None,
+        checkpointer: BaseCheckpointSaver | None = None,
+        stream_tokens: bool | None = None,
+        response_cache: ResponseCache | Literal[False] | None = None,
+        history_policy: HistoryPolicy | None = None,
+    ):
+        self.model = model or get_chat_model(
+            os.getenv('OPENAI_MODEL', 'gpt-5-2025-08-07'),
             temperature=0.7,
+            api_key=os.getenv('OPENAI_API_KEY'),
+            base_url=os.getenv('OPENAI_BASE_URL') or None,
         )
+        if async_mode is None:
+            async_mode = os.getenv('AGENT_ASYNC_MODE', 'true').lower() != 'false'
+        self.async_mode = async_mode
+        if stream_tokens is None:
+            stream_tokens = os.getenv('AGENT_STREAM_TOKENS', 'false').lower() == 'true'
+        self.stream_tokens = stream_tokens
+        self.checkpointer = checkpointer if checkpointer is not None else get_default_checkpointer()
+        if response_cache is None:
+            response_cache = build_response_cache()
+        self.cache = response_cache or None
+        self.history_policy = history_policy or HistoryPolicy.from_env()
+        self.model_name = getattr(self.model, 'model_name', None) or type(self.model).__name__
         self.tools = [
             get_vocabulary_lesson,
             get_grammar_lesson,
@@ -140,48 +205,235 @@ class LanguageLearningAgent:
             create_language_quiz,
             translate_with_context
         ]
+        self.tools_by_name = {t.name: t for t in self.tools}
 
-        self.graph = create_react_agent(
+        self.graph = get_compiled_graph(
             self.model,
-            tools=self.tools,
-            checkpointer=memory,
-            prompt=self.SYSTEM_INSTRUCTION,
-            response_format=(self.FORMAT_INSTRUCTION, ResponseFormat),
+            self.tools,
+            self.SYSTEM_INSTRUCTION,
+            (self.FORMAT_INSTRUCTION, ResponseFormat),
+            self.checkpointer,
+            history_policy=self.history_policy,
         )
+        # An equivalent checkpointer may already back the shared graph; reading
+        # through another instance would miss writes held in its hot tier.
+        self.checkpointer = self.graph.checkpointer
 
-    async def stream(self, query, context_id, profile: dict | None = None) -> AsyncIterable[dict[str, Any]]:
+    def _turn_messages(self, query: str, profile: dict | None, saved) -> list:
+        messages = [('user', query)]
         if profile:
-            preamble = _build_profile_preamble(profile)
-            inputs = {'messages': [('system', preamble), ('user', query)]}
+            digest, preamble = _profile_preamble(profile)
+            # The preamble is sent on the first turn of a context and again only
+            # when the profile changes (or history trimming dropped it). Its fixed
+            # message id makes add_messages replace the previous profile in place
+            # instead of appending a copy.
+            if _stored_profile_digest(saved) != digest:
+                messages.insert(0, SystemMessage(content=preamble, id=PROFILE_MESSAGE_ID))
+        return messages
+
+    # With AGENT_ASYNC_MODE=false the checkpointer may be sync-only, so its
+    # blocking API is used from a worker thread instead of the async one.
+    async def _get_checkpoint(self, config: dict):
+        if self.async_mode:
+            return await self.checkpointer.aget_tuple(config)
+        return await asyncio.to_thread(self.checkpointer.get_tuple, config)
+
+    async def _update_state(self, config: dict, values: dict) -> None:
+        if self.async_mode:
+            await self.graph.aupdate_state(config, values, as_node='generate_structured_response')
         else:
-            inputs = {'messages': [('user', query)]}
+            await asyncio.to_thread(self.graph.update_state, config, values, as_node='generate_structured_response')
+
+    async def _append_turn(self, config: dict, messages: list, structured_response: ResponseFormat) -> None:
+        """Write a turn answered without running the graph into the thread."""
+        await self._update_state(
+            config,
+            {
+                'messages': [*messages, AIMessage(content=structured_response.message)],
+                'structured_response': structured_response,
+            },
+        )
+
+    async def has_history(self, context_id: str) -> bool:
+        return await self._get_checkpoint({'configurable': {'thread_id': context_id}}) is not None
+
+    async def record_answer(self, query: str, context_id: str, profile: dict | None, answer: str) -> None:
+        """Append a query answered outside the agent (e.g. by the intent router) to the conversation."""
         config = {'configurable': {'thread_id': context_id}}
+        saved = await self._get_checkpoint(config) if profile else None
+        await self._append_turn(
+            config,
+            self._turn_messages(query, profile, saved),
+            ResponseFormat(status='completed', message=answer),
+        )
 
-        for item in self.graph.stream(inputs, config, stream_mode='values'):
-            message = item['messages'][-1]
-            if (
-                isinstance(message, AIMessage)
-                and message.tool_calls
-                and len(message.tool_calls) > 0
-            ):
-                tool_name = message.tool_calls[0]['name']
-                yield {
-                    'is_task_complete': False,
-                    'require_user_input': False,
-                    'content': f'Preparing {tool_name.replace("_", " ")}...',
-                }
-            elif isinstance(message, ToolMessage):
-                yield {
-                    'is_task_complete': False,
-                    'require_user_input': False,
-                    'content': 'Creating personalized language lesson...',
-                }
+    async def stream(self, query, context_id, profile: dict | None = None) -> AsyncIterable[dict[str, Any]]:
+        config = {'configurable': {'thread_id': context_id}}
+        saved = await self._get_checkpoint(config) if profile or self.cache is not None else None
+        inputs = {'messages': self._turn_messages(query, profile, saved)}
+        if callbacks := tracer.callbacks():
+            config['callbacks'] = callbacks
+
+        cache_keys = []
+        if self.cache is not None and saved is None:
+            # Whole-query lookups are only safe on a fresh conversation; later
+            # turns may depend on history, so they rely on the tool-args key.
+            query_key = make_cache_key('query', query, profile, self.model_name)
+            if cached := await self.cache.aget(query_key):
+                structured_response = ResponseFormat(**cached)
+                await self._append_turn(config, inputs['messages'], structured_response)
+                yield self._response_from_structured(structured_response)
+                return
+            cache_keys.append(query_key)
+
+        tool_calls_seen = 0
+        cached_tool_call = None
+        structured_response = None
+        stream_mode = ['values', 'messages'] if self.stream_tokens else ['values']
+        async with aclosing(tracer.timed('graph_stream', self._stream_graph(inputs, config, stream_mode))) as events:
+            async for mode, item in events:
+                if mode == 'messages':
+                    chunk, metadata = item
+                    # Only the ReAct 'agent' node produces learner-facing text; the
+                    # structured-response node just re-encodes it as ResponseFormat.
+                    if (
+                        metadata.get('langgraph_node') == 'agent'
+                        and isinstance(chunk, AIMessageChunk)
+                        and isinstance(chunk.content, str)
+                        and chunk.content
+                    ):
+                        yield {
+                            'is_task_complete': False,
+                            'require_user_input': False,
+                            'is_token': True,
+                            'content': chunk.content,
+                        }
+                    continue
+
+                # The last 'values' snapshot already carries the structured
+                # response, so the checkpoint does not need to be read back.
+                structured_response = item.get('structured_response', structured_response)
+                message = item['messages'][-1]
+                if (
+                    isinstance(message, AIMessage)
+                    and message.tool_calls
+                    and len(message.tool_calls) > 0
+                ):
+                    tool_calls_seen += len(message.tool_calls)
+                    tool_call = message.tool_calls[0]
+                    tool_key = self._tool_cache_key(tool_call, profile) if tool_calls_seen == 1 else None
+                    if tool_key and self.async_mode and (cached := await self.cache.aget(tool_key)):
+                        cached_tool_call = (tool_call, ResponseFormat(**cached))
+                        break
+                    if tool_key:
+                        cache_keys.append(tool_key)
+
+                    tool_name = tool_call['name']
+                    yield {
+                        'is_task_complete': False,
+                        'require_user_input': False,
+                        'content': f'Preparing {tool_name.replace("_", " ")}...',
+                    }
+                elif isinstance(message, ToolMessage):
+                    yield {
+                        'is_task_complete': False,
+                        'require_user_input': False,
+                        'content': 'Creating personalized language lesson...',
+                    }
+
+        if cached_tool_call:
+            tool_call, structured_response = cached_tool_call
+            # Tools are pure and cheap; run it so the thread records a complete
+            # tool round-trip instead of a dangling tool call.
+            tool_output = await self.tools_by_name[tool_call['name']].ainvoke(tool_call['args'])
+            await self._update_state(
+                config,
+                {
+                    'messages': [
+                        ToolMessage(content=str(tool_output), tool_call_id=tool_call['id']),
+                        AIMessage(content=structured_response.message),
+                    ],
+                    'structured_response': structured_response,
+                },
+            )
+            yield self._response_from_structured(structured_response)
+            return
+
+        if structured_response is None:
+            with tracer.span('get_state'):
+                if self.async_mode:
+                    current_state = await self.graph.aget_state(config)
+                else:
+                    current_state = await asyncio.to_thread(self.graph.get_state, config)
+            structured_response = current_state.values.get('structured_response')
+        if (
+            cache_keys
+            and isinstance(structured_response, ResponseFormat)
+            and structured_response.status == 'completed'
+            and tool_calls_seen <= 1
+        ):
+            for key in cache_keys:
+                await self.cache.aset(key, structured_response.model_dump())
+        yield self._response_from_structured(structured_response)
+
+    def _tool_cache_key(self, tool_call: dict, profile: dict | None) -> str | None:
+        tool = self.tools_by_name.get(tool_call['name'])
+        if tool is None or self.cache is None:
+            return None
+        try:
+            args = tool.args_schema.model_validate(tool_call['args']).model_dump()
+        except Exception:
+            return None
+        return make_cache_key(f'tool:{tool.name}', args, profile, self.model_name)
+
+    async def _stream_graph(self, inputs, config, stream_mode) -> AsyncIterable[tuple[str, Any]]:
+        # Native async path: model calls run on the event loop and sync-only
+        # tools are offloaded to the default executor by LangChain itself.
+        if self.async_mode:
+            async with aclosing(self.graph.astream(inputs, config, stream_mode=stream_mode)) as items:
+                async for item in items:
+                    yield item
+            return
 
-        yield self.get_agent_response(config)
+        # Fallback for sync-only models/tools: drive the blocking generator
+        # from a worker thread so the event loop stays responsive.
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for item in self.graph.stream(inputs, config, stream_mode=stream_mode):
+                    if stop.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, item)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        loop.run_in_executor(None, produce)
+        try:
+            while (item := await queue.get()) is not done:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # On cancellation the worker thread finishes its current step and
+            # then abandons the graph run instead of holding the request open.
+            stop.set()
+
+    async def warm_up(self) -> None:
+        # Touch the checkpointer so its backing store is opened and migrated
+        # before the first real conversation arrives.
+        await self._get_checkpoint({'configurable': {'thread_id': '__warm_up__'}})
 
     def get_agent_response(self, config):
         current_state = self.graph.get_state(config)
-        structured_response = current_state.values.get('structured_response')
+        return self._response_from_structured(current_state.values.get('structured_response'))
+
+    def _response_from_structured(self, structured_response):
         if structured_response and isinstance(structured_response, ResponseFormat):
             if structured_response.status == 'input_required':
                 return {
@@ -213,38 +465,150 @@ class LanguageLearningAgent:
 
     SUPPORTED_CONTENT_TYPES = ['text', 'text/plain']
 
+TERMINAL_TASK_STATES = (
+    TaskState.completed,
+    TaskState.canceled,
+    TaskState.failed,
+    TaskState.rejected,
+)
+
+CANCEL_TIMEOUT_SECONDS = 5.0
+
+BATCH_MAX_ITEMS = int(os.getenv('BATCH_MAX_ITEMS', '100'))
+BATCH_MAX_CONCURRENCY = int(os.getenv('BATCH_MAX_CONCURRENCY', '8'))
+
+STREAM_FLUSH_INTERVAL_SECONDS = float(os.getenv('STREAM_FLUSH_INTERVAL_SECONDS', '0.05'))
+STREAM_FLUSH_CHARS = int(os.getenv('STREAM_FLUSH_CHARS', '512'))
+
+class TokenStream:
+    """Coalesces model tokens into ``language_learning_stream`` artifact chunks.
+
+    The task manager saves the whole task on every artifact event, so one
+    event per token costs a growing task-store write per token. Buffered
+    text is sent once ``interval`` seconds have passed since the previous
+    chunk or ``max_chars`` have accumulated; the first token goes out at once
+    so time to first token is unchanged.
+    """
+
+    def __init__(
+        self,
+        updater: TaskUpdater,
+        interval: float | None = None,
+        max_chars: int | None = None,
+    ):
+        self.updater = updater
+        self.interval = STREAM_FLUSH_INTERVAL_SECONDS if interval is None else interval
+        self.max_chars = STREAM_FLUSH_CHARS if max_chars is None else max_chars
+        self.artifact_id: str | None = None
+        self._buffer: list[str] = []
+        self._chars = 0
+        self._flushed_at = 0.0
+
+    async def add(self, text: str) -> None:
+        self._buffer.append(text)
+        self._chars += len(text)
+        if self._chars >= self.max_chars or time.monotonic() - self._flushed_at >= self.interval:
+            await self.flush()
+
+    async def flush(self, last_chunk: bool = False) -> None:
+        if not self._buffer and not (last_chunk and self.artifact_id):
+            return
+        append = self.artifact_id is not None
+        self.artifact_id = self.artifact_id or str(uuid.uuid4())
+        text = ''.join(self._buffer)
+        self._buffer.clear()
+        self._chars = 0
+        await self.updater.add_artifact(
+            [Part(root=TextPart(text=text))],
+            artifact_id=self.artifact_id,
+            name='language_learning_stream',
+            append=append,
+            last_chunk=last_chunk,
+        )
+        self._flushed_at = time.monotonic()
+
 class LLMLanguageLearningAgentExecutor(AgentExecutor):
-    def __init__(self):
-        self.agent = LanguageLearningAgent()
+    def __init__(self, agent: LanguageLearningAgent | None = None, router: IntentRouter | None = None):
+        self.agent = agent or LanguageLearningAgent()
+        self.router = router
+        self._running: dict[str, asyncio.Task] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._running)
+
+    async def warm_up(self) -> None:
+        await self.agent.warm_up()
 
     async def execute(
         self,
         context: RequestContext,
         event_queue: EventQueue,
     ) -> None:
-        error = self._validate_request(context)
-        if error:
-            raise ServerError(error=InvalidParamsError())
+        with tracer.trace('execute', context_id=context.context_id, task_id=context.task_id):
+            await self._execute(context, event_queue)
 
-        query = context.get_user_input()
-        profile = {}
-        try:
-            if hasattr(context.message, 'metadata') and context.message.metadata:
-                profile = context.message.metadata.get('profile', {})
-        except Exception:
+    async def _execute(
+        self,
+        context: RequestContext,
+        event_queue: EventQueue,
+    ) -> None:
+        with tracer.span('validate'):
+            error = self._validate_request(context)
+            if error:
+                raise ServerError(error=InvalidParamsError())
+
+            query = context.get_user_input()
             profile = {}
-        
+            try:
+                if hasattr(context.message, 'metadata') and context.message.metadata:
+                    profile = context.message.metadata.get('profile', {})
+            except Exception:
+                profile = {}
+            batch = self._batch_items(context, profile)
+
+        event_queue = tracer.timed_queue(event_queue)
         task = context.current_task
         if not task:
             task = new_task(context.message)
             await event_queue.enqueue_event(task)
         updater = TaskUpdater(event_queue, task.id, task.context_id)
+        self._running[task.id] = asyncio.current_task()
+        token_stream = TokenStream(updater)
 
         try:
+            if batch is not None:
+                await self._execute_batch(batch, task, updater)
+                return
+
+            # Only a conversation's opening message is routed: mid-conversation
+            # "help" is about the current exercise and needs the model.
+            if (
+                self.router is not None
+                and not await self.agent.has_history(task.context_id)
+                and (answer := self.router.route(query, _native_language(profile))) is not None
+            ):
+                # Recorded so the next turn's model call sees what was answered
+                await self.agent.record_answer(query, task.context_id, profile, answer)
+                await updater.add_artifact(
+                    [Part(root=TextPart(text=answer))],
+                    name='language_learning_result',
+                )
+                await updater.complete()
+                tracer.annotate(outcome='completed', route='local')
+                return
+
             async for item in self.agent.stream(query, task.context_id, profile):
                 is_task_complete = item['is_task_complete']
                 require_user_input = item['require_user_input']
 
+                if item.get('is_token'):
+                    await token_stream.add(item['content'])
+                    continue
+
+                # Buffered text goes out before any status so chunks stay in order
+                await token_stream.flush(last_chunk=is_task_complete or require_user_input)
+
                 if not is_task_complete and not require_user_input:
                     await updater.update_status(
                         TaskState.working,
@@ -264,6 +628,7 @@ class LLMLanguageLearningAgentExecutor(AgentExecutor):
                         ),
                         final=True,
                     )
+                    tracer.annotate(outcome='input_required')
                     break
                 else:
                     await updater.add_artifact(
@@ -271,17 +636,113 @@ class LLMLanguageLearningAgentExecutor(AgentExecutor):
                         name='language_learning_result',
                     )
                     await updater.complete()
+                    tracer.annotate(outcome='completed')
                     break
 
         except Exception as e:
             logger = logging.getLogger(__name__)
             logger.error(f'An error occurred while streaming the response: {e}')
             raise ServerError(error=InternalError()) from e
+        finally:
+            self._running.pop(task.id, None)
 
     def _validate_request(self, context: RequestContext) -> bool:
         return False
 
+    def _batch_items(self, context: RequestContext, profile: dict) -> list[tuple[str, dict]] | None:
+        """Read a ``{'batch': [...]}`` data part into (query, profile) pairs.
+
+        Items are either query strings or ``{'query': ..., 'profile': {...}}``
+        objects; items without a profile use the message-level one.
+        """
+        for part in context.message.parts if context.message else []:
+            if isinstance(part.root, DataPart) and 'batch' in part.root.data:
+                raw_items = part.root.data['batch']
+                break
+        else:
+            return None
+
+        if not isinstance(raw_items, list) or not 0 < len(raw_items) <= BATCH_MAX_ITEMS:
+            raise ServerError(error=InvalidParamsError(
+                message=f'batch must be a list of 1 to {BATCH_MAX_ITEMS} items'
+            ))
+        items = []
+        for raw in raw_items:
+            if isinstance(raw, str):
+                raw = {'query': raw}
+            if not isinstance(raw, dict) or not isinstance(raw.get('query'), str) or not raw['query'].strip():
+                raise ServerError(error=InvalidParamsError(message='each batch item needs a query'))
+            items.append((raw['query'], raw.get('profile') or profile))
+        return items
+
+    async def _execute_batch(self, items: list[tuple[str, dict]], task, updater: TaskUpdater) -> None:
+        # Identical (query, profile) pairs run once; their artifact lists
+        # every position they occupy in the request.
+        positions: dict[str, list[int]] = {}
+        for index, (query, profile) in enumerate(items):
+            key = make_cache_key('batch', query, profile, self.agent.model_name)
+            positions.setdefault(key, []).append(index)
+        slots = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+
+        async def run(key: str, indices: list[int]) -> None:
+            query, profile = items[indices[0]]
+            status, content = 'failed', 'An error occurred while preparing this lesson.'
+            thread_id = f'{task.context_id}:batch:{key[:16]}'
+            if self.router is not None and (answer := self.router.route(query, _native_language(profile))) is not None:
+                status, content = 'completed', answer
+                try:
+                    await self.agent.record_answer(query, thread_id, profile, answer)
+                except Exception as e:
+                    logging.getLogger(__name__).error(f'Batch item answer not recorded: {e}')
+            else:
+                async with slots:
+                    try:
+                        async for item in self.agent.stream(query, thread_id, profile):
+                            if item.get('is_token'):
+                                continue
+                            if item['require_user_input']:
+                                status, content = 'input_required', item['content']
+                            elif item['is_task_complete']:
+                                status, content = 'completed', item['content']
+                    except Exception as e:
+                        logging.getLogger(__name__).error(f'Batch item failed: {e}')
+            await updater.add_artifact(
+                [Part(root=TextPart(text=content))],
+                name='language_learning_batch_item',
+                metadata={'indices': indices, 'query': query, 'status': status},
+            )
+
+        # gather rather than TaskGroup keeps Python 3.10 support; one item
+        # failing to publish must not abandon the others.
+        results = await asyncio.gather(
+            *(run(key, indices) for key, indices in positions.items()),
+            return_exceptions=True,
+        )
+        for indices, result in zip(positions.values(), results):
+            if isinstance(result, Exception):
+                logging.getLogger(__name__).error(f'Batch item {indices} failed: {result}')
+
+        await updater.complete(new_agent_text_message(
+            f'Completed {len(items)} batch item(s), {len(positions)} unique.',
+            task.context_id,
+            task.id,
+        ))
+        tracer.annotate(outcome='completed', batch_items=len(items))
+
     async def cancel(
         self, context: RequestContext, event_queue: EventQueue
     ) -> None:
-        raise ServerError(error=UnsupportedOperationError())
+        task = context.current_task
+        if task and task.status.state in TERMINAL_TASK_STATES:
+            raise ServerError(error=TaskNotCancelableError())
+
+        task_id = context.task_id
+        running = self._running.get(task_id)
+        if running and not running.done():
+            running.cancel()
+            # Wait for the graph run to unwind so the model call and its
+            # connection are released before reporting the task as canceled.
+            await asyncio.wait({running}, timeout=CANCEL_TIMEOUT_SECONDS)
+
+        updater = TaskUpdater(event_queue, task_id, context.context_id)
+        await updater.cancel()
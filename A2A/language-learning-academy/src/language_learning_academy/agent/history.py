@@ -0,0 +1,156 @@
+import os
+
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.messages import (
+    AnyMessage,
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+)
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.runnables import RunnableLambda
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
+
+
+SUMMARY_MESSAGE_ID = 'conversation-summary'
+
+SUMMARY_INSTRUCTION = (
+    'You maintain a running summary of a language tutoring session. '
+    'Merge the previous summary with the new exchanges into one concise paragraph. '
+    'Keep the target language, the learner level, topics and vocabulary already covered, '
+    'recurring mistakes, and any open exercise. Reply with the summary only.'
+)
+
+
+@dataclass(frozen=True)
+class HistoryPolicy:
+    """How much conversation history is replayed to the model on each call.
+
+    ``max_turns`` keeps the last K learner turns verbatim and ``max_tokens``
+    drops further old turns until the prompt fits the budget. With
+    ``summarize`` the dropped turns are folded into a rolling summary message
+    that is written back into the checkpoint. The in-progress turn is never
+    dropped.
+    """
+
+    max_turns: int | None = 20
+    max_tokens: int | None = None
+    summarize: bool = False
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.max_turns or self.max_tokens)
+
+    @classmethod
+    def from_env(cls) -> 'HistoryPolicy':
+        max_turns = int(os.getenv('HISTORY_MAX_TURNS', '20'))
+        max_tokens = int(os.getenv('HISTORY_MAX_TOKENS', '0'))
+        return cls(
+            max_turns=max_turns if max_turns > 0 else None,
+            max_tokens=max_tokens if max_tokens > 0 else None,
+            summarize=os.getenv('HISTORY_SUMMARIZE', 'false').lower() == 'true',
+        )
+
+
+def _split_turns(messages: list[AnyMessage]) -> list[list[AnyMessage]]:
+    turns: list[list[AnyMessage]] = []
+    for message in messages:
+        if isinstance(message, HumanMessage) or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+class HistoryWindow:
+    """``pre_model_hook`` for ``create_react_agent`` that applies a HistoryPolicy."""
+
+    def __init__(self, policy: HistoryPolicy, model):
+        self.policy = policy
+        self.model = model
+
+    def _partition(self, messages: list[AnyMessage]):
+        summary = None
+        profile = None
+        conversation = []
+        for message in messages:
+            if isinstance(message, SystemMessage):
+                if message.id == SUMMARY_MESSAGE_ID:
+                    summary = message
+                else:
+                    profile = message
+            else:
+                conversation.append(message)
+        return profile, summary, _split_turns(conversation)
+
+    def _window(self, header: list[AnyMessage], turns: list[list[AnyMessage]]):
+        keep_from = 0
+        if self.policy.max_turns:
+            keep_from = max(0, len(turns) - self.policy.max_turns)
+        if self.policy.max_tokens:
+            tokens = [count_tokens_approximately(turn) for turn in turns]
+            budget = self.policy.max_tokens - count_tokens_approximately(header)
+            while keep_from < len(turns) - 1 and sum(tokens[keep_from:]) > budget:
+                keep_from += 1
+        return turns[:keep_from], turns[keep_from:]
+
+    def _summary_prompt(self, summary: SystemMessage | None, dropped: list[list[AnyMessage]]) -> list[AnyMessage]:
+        transcript = '\n'.join(
+            f'{message.type}: {message.content}'
+            for turn in dropped
+            for message in turn
+            if isinstance(message.content, str) and message.content
+        )
+        previous = summary.content if summary else '(none)'
+        return [
+            SystemMessage(content=SUMMARY_INSTRUCTION),
+            HumanMessage(content=f'Previous summary:\n{previous}\n\nNew exchanges:\n{transcript}'),
+        ]
+
+    def _update(self, profile, summary, kept) -> dict[str, Any]:
+        header = [m for m in (profile, summary) if m is not None]
+        return {
+            'messages': [
+                RemoveMessage(id=REMOVE_ALL_MESSAGES),
+                *header,
+                *(message for turn in kept for message in turn),
+            ]
+        }
+
+    def _plan(self, state: dict[str, Any]):
+        profile, summary, turns = self._partition(state['messages'])
+        header = [m for m in (profile, summary) if m is not None]
+        dropped, kept = self._window(header, turns)
+        return profile, summary, dropped, kept
+
+    # Both entry points only ever update 'messages': the 'llm_input_messages'
+    # channel would persist in the checkpoint and be replayed stale later.
+
+    def invoke(self, state: dict[str, Any]) -> dict[str, Any]:
+        profile, summary, dropped, kept = self._plan(state)
+        if not dropped:
+            return {'messages': []}
+        if self.policy.summarize:
+            response = self.model.invoke(self._summary_prompt(summary, dropped))
+            summary = _summary_message(response.content)
+        return self._update(profile, summary, kept)
+
+    async def ainvoke(self, state: dict[str, Any]) -> dict[str, Any]:
+        profile, summary, dropped, kept = self._plan(state)
+        if not dropped:
+            return {'messages': []}
+        if self.policy.summarize:
+            response = await self.model.ainvoke(self._summary_prompt(summary, dropped))
+            summary = _summary_message(response.content)
+        return self._update(profile, summary, kept)
+
+    def as_runnable(self) -> RunnableLambda:
+        return RunnableLambda(self.invoke, afunc=self.ainvoke, name='pre_model_hook')
+
+
+def _summary_message(content: Any) -> SystemMessage:
+    return SystemMessage(
+        content=f'Summary of the earlier conversation: {content}',
+        id=SUMMARY_MESSAGE_ID,
+    )
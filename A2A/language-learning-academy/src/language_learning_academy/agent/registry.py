@@ -0,0 +1,197 @@
+import hashlib
+import os
+import threading
+
+from collections import OrderedDict
+from typing import Any
+
+import httpx
+
+from langchain_openai import ChatOpenAI
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.prebuilt import create_react_agent
+
+from language_learning_academy.agent.checkpoint import BoundedCheckpointSaver, build_checkpointer
+from language_learning_academy.agent.history import HistoryPolicy, HistoryWindow
+
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+DEFAULT_TIMEOUT_SECONDS = 120.0
+MAX_COMPILED_GRAPHS = 32
+
+_lock = threading.Lock()
+_http_clients: dict[tuple, tuple[httpx.Client, httpx.AsyncClient]] = {}
+_models: dict[tuple, ChatOpenAI] = {}
+_graphs: OrderedDict[tuple, tuple[Any, BaseCheckpointSaver, Any]] = OrderedDict()
+_default_checkpointer: BaseCheckpointSaver | None = None
+
+
+def _pool_settings() -> tuple[int, int, float, float]:
+    return (
+        int(os.getenv('OPENAI_MAX_CONNECTIONS', DEFAULT_MAX_CONNECTIONS)),
+        int(os.getenv('OPENAI_MAX_KEEPALIVE_CONNECTIONS', DEFAULT_MAX_KEEPALIVE_CONNECTIONS)),
+        float(os.getenv('OPENAI_KEEPALIVE_EXPIRY', DEFAULT_KEEPALIVE_EXPIRY_SECONDS)),
+        float(os.getenv('OPENAI_TIMEOUT', DEFAULT_TIMEOUT_SECONDS)),
+    )
+
+
+def get_http_clients(base_url: str | None = None) -> tuple[httpx.Client, httpx.AsyncClient]:
+    """Return the process-wide sync/async HTTP clients for a model endpoint.
+
+    The async client is bound to the event loop that first opens a connection,
+    so share it only within one loop (one uvicorn worker).
+    """
+    settings = _pool_settings()
+    key = (base_url, settings)
+    with _lock:
+        if key not in _http_clients:
+            max_connections, max_keepalive, keepalive_expiry, timeout = settings
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=keepalive_expiry,
+            )
+            _http_clients[key] = (
+                httpx.Client(limits=limits, timeout=timeout),
+                httpx.AsyncClient(limits=limits, timeout=timeout),
+            )
+        return _http_clients[key]
+
+
+def get_chat_model(
+    model: str,
+    temperature: float = 0.7,
+    api_key: str | None = None,
+    base_url: str | None = None,
+) -> ChatOpenAI:
+    key_digest = hashlib.sha256((api_key or '').encode()).hexdigest()
+    key = (model, temperature, key_digest, base_url)
+    with _lock:
+        cached = _models.get(key)
+    if cached is not None:
+        return cached
+
+    http_client, http_async_client = get_http_clients(base_url)
+    chat_model = ChatOpenAI(
+        model=model,
+        openai_api_key=api_key,
+        base_url=base_url,
+        temperature=temperature,
+        http_client=http_client,
+        http_async_client=http_async_client,
+    )
+    with _lock:
+        return _models.setdefault(key, chat_model)
+
+
+def get_default_checkpointer() -> BaseCheckpointSaver:
+    global _default_checkpointer
+    with _lock:
+        if _default_checkpointer is None:
+            _default_checkpointer = build_checkpointer()
+        return _default_checkpointer
+
+
+def _model_key(model) -> tuple:
+    model_name = getattr(model, 'model_name', None)
+    if model_name is None:
+        return ('object', id(model))
+    api_key = getattr(model, 'openai_api_key', None)
+    api_key = api_key.get_secret_value() if hasattr(api_key, 'get_secret_value') else api_key
+    return (
+        f'{type(model).__module__}.{type(model).__qualname__}',
+        model_name,
+        getattr(model, 'openai_api_base', None),
+        getattr(model, 'temperature', None),
+        hashlib.sha256((api_key or '').encode()).hexdigest(),
+    )
+
+
+def _checkpointer_key(checkpointer: BaseCheckpointSaver) -> tuple:
+    conn = getattr(getattr(checkpointer, 'backing', None), 'conn', None)
+    if not isinstance(checkpointer, BoundedCheckpointSaver) or conn is None:
+        # Without a backing file the saver is its own store, so only the same object matches
+        return ('object', id(checkpointer))
+    path = next((row[2] for row in conn.execute('PRAGMA database_list') if row[1] == 'main'), '')
+    if not path:
+        return ('object', id(checkpointer))
+    return (
+        'sqlite',
+        path,
+        checkpointer.max_threads,
+        checkpointer.ttl_seconds,
+        checkpointer.max_messages,
+        checkpointer.shared,
+    )
+
+
+def get_compiled_graph(
+    model,
+    tools: list,
+    prompt: str,
+    response_format: tuple[str, type],
+    checkpointer: BaseCheckpointSaver,
+    history_policy: HistoryPolicy | None = None,
+):
+    """Return a compiled ReAct graph, shared by every caller with the same configuration.
+
+    Models and checkpointers are matched by their configuration (model name,
+    endpoint, temperature, API key; checkpoint file and tier settings), so
+    the returned graph may hold an equivalent checkpointer rather than the
+    one passed in; use ``graph.checkpointer``. Objects without a stable
+    configuration only match themselves. At most ``MAX_COMPILED_GRAPHS``
+    graphs are kept, least recently used first out.
+    """
+    model_key = _model_key(model)
+    checkpointer_key = _checkpointer_key(checkpointer)
+    key = (
+        model_key,
+        tuple(t.name for t in tools),
+        hashlib.sha256(prompt.encode()).hexdigest(),
+        response_format[0],
+        f'{response_format[1].__module__}.{response_format[1].__qualname__}',
+        checkpointer_key,
+        history_policy,
+    )
+    with _lock:
+        cached = _graphs.get(key)
+        # An identity key is only trusted while the entry still holds that
+        # exact object, which also keeps its id from being reused.
+        if (
+            cached is not None
+            and (model_key[0] != 'object' or cached[0] is model)
+            and (checkpointer_key[0] != 'object' or cached[1] is checkpointer)
+        ):
+            _graphs.move_to_end(key)
+            return cached[2]
+
+    pre_model_hook = None
+    if history_policy is not None and history_policy.enabled:
+        pre_model_hook = HistoryWindow(history_policy, model).as_runnable()
+    graph = create_react_agent(
+        model,
+        tools=tools,
+        checkpointer=checkpointer,
+        prompt=prompt,
+        response_format=response_format,
+        pre_model_hook=pre_model_hook,
+    )
+    with _lock:
+        _graphs[key] = _graphs.get(key) or (model, checkpointer, graph)
+        _graphs.move_to_end(key)
+        while len(_graphs) > MAX_COMPILED_GRAPHS:
+            _graphs.popitem(last=False)
+        return _graphs[key][2]
+
+
+def clear() -> None:
+    global _default_checkpointer
+    with _lock:
+        for http_client, _ in _http_clients.values():
+            http_client.close()
+        _http_clients.clear()
+        _models.clear()
+        _graphs.clear()
+        _default_checkpointer = None
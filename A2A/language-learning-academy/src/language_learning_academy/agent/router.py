@@ -0,0 +1,254 @@
+import importlib
+import json
+import os
+import re
+
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from a2a.types import AgentSkill
+
+
+@dataclass(frozen=True)
+class Intent:
+    name: str
+    patterns: tuple[str, ...]
+    response: str
+    # Response per learner native language; ``response`` (English) is the fallback
+    translations: dict[str, str] = field(default_factory=dict, hash=False)
+
+
+class IntentClassifier(Protocol):
+    def classify(self, query: str) -> str | None:
+        """Return the name of the matching intent, or None to use the LLM."""
+
+
+_PUNCTUATION = re.compile(r"[^\w\s']+")
+_FILLER = re.compile(r"^(?:(?:hi|hello|hey|please|ok|okay)\s+)+|\s+please$")
+
+
+def normalize_query(query: str) -> str:
+    text = ' '.join(_PUNCTUATION.sub(' ', query.lower()).split())
+    return _FILLER.sub('', text).strip()
+
+
+class KeywordClassifier:
+    """Matches the whole normalized query against each intent's regex patterns.
+
+    Patterns must match the entire query, so anything with extra content
+    ("What languages do you support for business?") still goes to the LLM.
+    """
+
+    def __init__(self, intents: list[Intent]):
+        self._patterns = [
+            (re.compile(f'(?:{"|".join(intent.patterns)})'), intent.name)
+            for intent in intents
+            if intent.patterns
+        ]
+
+    def classify(self, query: str) -> str | None:
+        text = normalize_query(query)
+        for pattern, name in self._patterns:
+            if pattern.fullmatch(text):
+                return name
+        return None
+
+
+class IntentRouter:
+    """Answers static FAQ queries locally instead of running the ReAct loop."""
+
+    def __init__(self, intents: list[Intent], classifier: IntentClassifier | None = None):
+        self.responses = {intent.name: intent.response for intent in intents}
+        self.translations = {intent.name: intent.translations for intent in intents}
+        self.classifier = classifier or KeywordClassifier(intents)
+        self.total = 0
+        self.routed: dict[str, int] = {name: 0 for name in self.responses}
+
+    def route(self, query: str, language: str | None = None) -> str | None:
+        """Answer ``query`` in the learner's native ``language`` if translated, else in English."""
+        self.total += 1
+        name = self.classifier.classify(query)
+        response = self.responses.get(name) if name else None
+        if response is not None:
+            self.routed[name] += 1
+            response = self.translations[name].get(language) or response
+        return response
+
+    @property
+    def short_circuit_fraction(self) -> float:
+        return sum(self.routed.values()) / self.total if self.total else 0.0
+
+    def stats(self) -> dict[str, float]:
+        return {
+            'total': self.total,
+            'short_circuited': sum(self.routed.values()),
+            'short_circuit_fraction': self.short_circuit_fraction,
+        }
+
+
+# Built-in FAQ answers in the native languages the UI offers besides English.
+# Language names, skill descriptions and example requests are filled in as-is.
+LOCALIZED_RESPONSES: dict[str, dict[str, str]] = {
+    'Hindi': {
+        'supported_languages': 'मैं आपको **{languages}** सीखने में मदद कर सकता हूँ।\n\nबस मुझे बताइए कि आप कौन-सी भाषा का अभ्यास करना चाहते हैं और आपका स्तर क्या है।',
+        'services': 'मैं आपके लिए यह कर सकता हूँ:\n\n{services}',
+        'levels': 'पाठ इन स्तरों पर उपलब्ध हैं: {levels}।',
+        'getting_started': 'स्वागत है! एक भाषा ({languages}) और एक स्तर ({levels}) चुनें, फिर बताइए कि आपको क्या चाहिए, उदाहरण के लिए:\n\n{examples}',
+    },
+    'French': {
+        'supported_languages': "Je peux vous aider à apprendre : **{languages}**.\n\nDites-moi simplement quelle langue vous voulez pratiquer et votre niveau.",
+        'services': 'Voici ce que je peux faire pour vous :\n\n{services}',
+        'levels': 'Les leçons sont disponibles aux niveaux suivants : {levels}.',
+        'getting_started': "Bienvenue ! Choisissez une langue ({languages}) et un niveau ({levels}), puis demandez ce dont vous avez besoin, par exemple :\n\n{examples}",
+    },
+    'Spanish': {
+        'supported_languages': 'Puedo ayudarte a aprender **{languages}**.\n\nSolo dime qué idioma quieres practicar y tu nivel.',
+        'services': 'Esto es lo que puedo hacer por ti:\n\n{services}',
+        'levels': 'Las lecciones están disponibles en los niveles: {levels}.',
+        'getting_started': '¡Bienvenido! Elige un idioma ({languages}) y un nivel ({levels}), y luego pide lo que necesites, por ejemplo:\n\n{examples}',
+    },
+    'German': {
+        'supported_languages': 'Ich kann dir helfen, **{languages}** zu lernen.\n\nSag mir einfach, welche Sprache du üben möchtest und auf welchem Niveau.',
+        'services': 'Das kann ich für dich tun:\n\n{services}',
+        'levels': 'Lektionen gibt es auf diesen Niveaus: {levels}.',
+        'getting_started': 'Willkommen! Wähle eine Sprache ({languages}) und ein Niveau ({levels}) und frag dann nach dem, was du brauchst, zum Beispiel:\n\n{examples}',
+    },
+    'Italian': {
+        'supported_languages': 'Posso aiutarti a imparare **{languages}**.\n\nDimmi solo quale lingua vuoi esercitare e il tuo livello.',
+        'services': 'Ecco cosa posso fare per te:\n\n{services}',
+        'levels': 'Le lezioni sono disponibili ai livelli: {levels}.',
+        'getting_started': 'Benvenuto! Scegli una lingua ({languages}) e un livello ({levels}), poi chiedi ciò che ti serve, ad esempio:\n\n{examples}',
+    },
+    'Portuguese': {
+        'supported_languages': 'Posso ajudar você a aprender **{languages}**.\n\nÉ só me dizer qual idioma quer praticar e o seu nível.',
+        'services': 'Veja o que posso fazer por você:\n\n{services}',
+        'levels': 'As lições estão disponíveis nos níveis: {levels}.',
+        'getting_started': 'Bem-vindo! Escolha um idioma ({languages}) e um nível ({levels}) e depois peça o que precisar, por exemplo:\n\n{examples}',
+    },
+    'Japanese': {
+        'supported_languages': '**{languages}** の学習をお手伝いできます。\n\n練習したい言語とレベルを教えてください。',
+        'services': '私にできることは次のとおりです：\n\n{services}',
+        'levels': 'レッスンは次のレベルで受けられます：{levels}。',
+        'getting_started': 'ようこそ！言語（{languages}）とレベル（{levels}）を選んで、必要なことを聞いてください。例：\n\n{examples}',
+    },
+    'Chinese': {
+        'supported_languages': '我可以帮助你学习 **{languages}**。\n\n告诉我你想练习哪种语言以及你的水平即可。',
+        'services': '以下是我可以为你做的：\n\n{services}',
+        'levels': '课程提供以下级别：{levels}。',
+        'getting_started': '欢迎！选择一种语言（{languages}）和一个级别（{levels}），然后告诉我你需要什么，例如：\n\n{examples}',
+    },
+    'Korean': {
+        'supported_languages': '**{languages}** 학습을 도와드릴 수 있어요.\n\n연습하고 싶은 언어와 수준을 알려 주세요.',
+        'services': '제가 도와드릴 수 있는 것은 다음과 같아요:\n\n{services}',
+        'levels': '레슨은 다음 수준으로 제공됩니다: {levels}.',
+        'getting_started': '환영합니다! 언어({languages})와 수준({levels})을 고르고 필요한 것을 요청하세요. 예를 들면:\n\n{examples}',
+    },
+}
+
+GETTING_STARTED_EXAMPLES = (
+    '- "Teach me Spanish vocabulary for beginners"\n'
+    '- "Explain French past tense rules"\n'
+    '- "Practice restaurant conversation in Italian"\n'
+    '- "Quiz me on German vocabulary"'
+)
+
+
+def default_intents(skills: list[AgentSkill], languages: list[str], levels: list[str]) -> list[Intent]:
+    language_list = ', '.join(languages)
+    services = '\n'.join(
+        f'- **{skill.name}**: {skill.description}' + (f' (e.g. "{skill.examples[0]}")' if skill.examples else '')
+        for skill in skills
+    )
+    values = {
+        'languages': language_list,
+        'levels': ', '.join(levels),
+        'services': services,
+        'examples': GETTING_STARTED_EXAMPLES,
+    }
+
+    def translations(name: str) -> dict[str, str]:
+        return {
+            language: responses[name].format(**values)
+            for language, responses in LOCALIZED_RESPONSES.items()
+        }
+
+    return [
+        Intent(
+            name='supported_languages',
+            patterns=(
+                r"(?:what|which) languages (?:do|can) you (?:support|teach|offer|help with)",
+                r"(?:what|which) languages are (?:supported|available|offered)",
+                r"(?:list|show)(?: me)?(?: the)? (?:supported |available )?languages",
+                r"supported languages",
+            ),
+            response=f'I can help you learn **{language_list}**.\n\nJust tell me which language you want to practise and your level.',
+            translations=translations('supported_languages'),
+        ),
+        Intent(
+            name='services',
+            patterns=(
+                r"(?:show|list|tell)(?: me)?(?: your| the)? (?:available )?(?:services|skills|features)",
+                r"what (?:services|skills|features) do you (?:offer|have|provide)",
+                r"what can you do",
+                r"available services",
+            ),
+            response=f'Here is what I can do for you:\n\n{services}',
+            translations=translations('services'),
+        ),
+        Intent(
+            name='levels',
+            patterns=(
+                r"(?:what|which) (?:levels|difficulty levels) (?:do you (?:support|offer|have)|are (?:available|supported))",
+            ),
+            response=f'Lessons are available at the {", ".join(levels[:-1])} and {levels[-1]} levels.',
+            translations=translations('levels'),
+        ),
+        Intent(
+            name='getting_started',
+            patterns=(
+                r"help(?: me)? (?:to )?get(?:ting)? started",
+                r"how (?:do|can) i (?:get started|start|begin)",
+                r"get(?:ting)? started",
+                r"help",
+            ),
+            response=(
+                f'Welcome! Pick a language ({language_list}) and a level ({", ".join(levels)}), then ask for '
+                f'what you need, for example:\n\n{GETTING_STARTED_EXAMPLES}'
+            ),
+            translations=translations('getting_started'),
+        ),
+    ]
+
+
+def _load_classifier(spec: str, intents: list[Intent]) -> IntentClassifier:
+    module_name, _, attribute = spec.partition(':')
+    factory = getattr(importlib.import_module(module_name), attribute)
+    return factory(intents)
+
+
+def build_intent_router(skills: list[AgentSkill], languages: list[str], levels: list[str]) -> IntentRouter | None:
+    """Build the router from the agent card skills plus any FAQ intents in ROUTER_INTENTS_PATH.
+
+    Each ROUTER_INTENTS_PATH item may add ``translations`` mapping a native
+    language (as sent in the learner profile) to its response. ROUTER_CLASSIFIER
+    may name a ``module:factory`` that is called with the intents and returns
+    an IntentClassifier, replacing the keyword matcher.
+    """
+    if os.getenv('ROUTER_ENABLED', 'true').lower() == 'false':
+        return None
+    intents = default_intents(skills, languages, levels)
+    if path := os.getenv('ROUTER_INTENTS_PATH'):
+        with open(path) as f:
+            intents.extend(
+                Intent(
+                    name=item['name'],
+                    patterns=tuple(item.get('patterns', ())),
+                    response=item['response'],
+                    translations=dict(item.get('translations', {})),
+                )
+                for item in json.load(f)
+            )
+    classifier = None
+    if spec := os.getenv('ROUTER_CLASSIFIER'):
+        classifier = _load_classifier(spec, intents)
+    return IntentRouter(intents, classifier)
@@ -0,0 +1,330 @@
+import asyncio
+import contextvars
+import math
+import os
+import threading
+import time
+
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+from uuid import UUID
+
+import structlog
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, math.inf)
+
+logger = structlog.get_logger()
+
+
+class Metrics:
+    """Process-wide counters, histograms and gauges in Prometheus text format."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, tuple], float] = {}
+        self._histograms: dict[tuple[str, tuple], list] = {}
+        self._gauges: dict[str, Callable[[], float]] = {}
+        self._help: dict[str, tuple[str, str]] = {}
+
+    def _describe(self, name: str, kind: str, help_text: str) -> None:
+        if help_text or name not in self._help:
+            self._help[name] = (kind, help_text)
+
+    def inc(self, name: str, value: float = 1.0, help_text: str = '', **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._describe(name, 'counter', help_text)
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, help_text: str = '', **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._describe(name, 'histogram', help_text)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * len(self.buckets), 0.0, 0]
+            counts = histogram[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            histogram[1] += value
+            histogram[2] += 1
+
+    def gauge(self, name: str, read: Callable[[], float], help_text: str = '', kind: str = 'gauge') -> None:
+        """Register a value read at scrape time; use ``kind='counter'`` for running totals."""
+        with self._lock:
+            self._describe(name, kind, help_text)
+            self._gauges[name] = read
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._gauges.clear()
+            self._help.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: (list(h[0]), h[1], h[2]) for key, h in self._histograms.items()}
+            gauges = dict(self._gauges)
+            described = dict(self._help)
+
+        lines = []
+        for name, (kind, help_text) in sorted(described.items()):
+            if help_text:
+                lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            if name in gauges:
+                lines.append(f'{name} {_number(gauges[name]())}')
+            elif kind == 'counter':
+                for (metric, labels), value in sorted(counters.items()):
+                    if metric == name:
+                        lines.append(f'{name}{_labels(labels)} {_number(value)}')
+            else:
+                for (metric, labels), (counts, total, count) in sorted(histograms.items()):
+                    if metric != name:
+                        continue
+                    cumulative = 0
+                    for bound, bucket_count in zip(self.buckets, counts):
+                        cumulative += bucket_count
+                        le = '+Inf' if bound == math.inf else repr(bound)
+                        lines.append(f'{name}_bucket{_labels(labels + (("le", le),))} {cumulative}')
+                    lines.append(f'{name}_sum{_labels(labels)} {_number(total)}')
+                    lines.append(f'{name}_count{_labels(labels)} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(labels: tuple) -> str:
+    if not labels:
+        return ''
+    escaped = (
+        f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for k, v in labels
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+metrics = Metrics()
+
+_current_trace: contextvars.ContextVar['Trace | None'] = contextvars.ContextVar('current_trace', default=None)
+
+
+class _NoopSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    def __init__(self, name: str, trace: 'Trace | None', labels: dict[str, str]):
+        self.name = name
+        self.trace = trace
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.started
+        metrics.observe('tutor_span_duration_seconds', elapsed, 'Time spent per tutor request stage', span=self.name, **self.labels)
+        if self.trace is not None:
+            self.trace.add(self.name, elapsed)
+        return False
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+
+class Trace(Span):
+    """Root span for one request; logs a single line with its stage breakdown."""
+
+    def __init__(self, name: str, attrs: dict[str, Any]):
+        super().__init__(name, None, {})
+        self.attrs = attrs
+        self.stages: dict[str, float] = {}
+        self.tools: list[str] = []
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self._token = _current_trace.set(self)
+        return super().__enter__()
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.started
+        _current_trace.reset(self._token)
+        super().__exit__(exc_type, exc, tb)
+        if exc_type is not None:
+            self.attrs.setdefault('outcome', 'canceled' if issubclass(exc_type, asyncio.CancelledError) else 'failed')
+        outcome = self.attrs.get('outcome', 'unknown')
+        metrics.inc('tutor_requests_total', help_text='Tutor requests by outcome', outcome=outcome)
+        logger.info(
+            'Request traced',
+            span=self.name,
+            duration_ms=round(elapsed * 1000, 2),
+            tools=self.tools,
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            **self.attrs,
+            **{f'{stage}_ms': round(seconds * 1000, 2) for stage, seconds in self.stages.items()},
+        )
+        return False
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+
+class TraceCallbackHandler(BaseCallbackHandler):
+    """Times tool and model runs and counts tokens for the trace it belongs to."""
+
+    run_inline = True
+
+    def __init__(self, trace: Trace):
+        self.trace = trace
+        self._started: dict[UUID, tuple[str, str, float]] = {}
+
+    def on_tool_start(self, serialized: dict[str, Any], input_str: str, *, run_id: UUID, **kwargs: Any) -> None:
+        name = kwargs.get('name') or (serialized or {}).get('name', 'unknown')
+        self._started[run_id] = ('tool', name, time.perf_counter())
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+
+    def on_chat_model_start(self, serialized: dict[str, Any], messages: list, *, run_id: UUID, **kwargs: Any) -> None:
+        self._started[run_id] = ('llm', '', time.perf_counter())
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+        prompt = completion = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, 'message', None), 'usage_metadata', None) or {}
+                prompt += usage.get('input_tokens', 0)
+                completion += usage.get('output_tokens', 0)
+        self.trace.prompt_tokens += prompt
+        self.trace.completion_tokens += completion
+        if prompt:
+            metrics.inc('tutor_tokens_total', prompt, 'Model tokens by kind', kind='prompt')
+        if completion:
+            metrics.inc('tutor_tokens_total', completion, 'Model tokens by kind', kind='completion')
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+
+    def _finish(self, run_id: UUID) -> None:
+        started = self._started.pop(run_id, None)
+        if started is None:
+            return
+        kind, name, at = started
+        elapsed = time.perf_counter() - at
+        if kind == 'tool':
+            self.trace.tools.append(name)
+            self.trace.add(f'tool_{name}', elapsed)
+            metrics.observe('tutor_span_duration_seconds', elapsed, span='tool', tool=name)
+        else:
+            self.trace.add('llm', elapsed)
+            metrics.observe('tutor_span_duration_seconds', elapsed, span='llm')
+
+
+class Tracer:
+    """Entry point for request tracing; every call is a no-op when disabled."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+
+    @classmethod
+    def from_env(cls) -> 'Tracer':
+        return cls(enabled=os.getenv('TRACING_ENABLED', 'false').lower() == 'true')
+
+    def trace(self, name: str, **attrs: Any):
+        if not self.enabled:
+            return NOOP_SPAN
+        return Trace(name, attrs)
+
+    def span(self, name: str, **labels: str):
+        if not self.enabled:
+            return NOOP_SPAN
+        return Span(name, _current_trace.get(), labels)
+
+    def annotate(self, **attrs: Any) -> None:
+        trace = _current_trace.get() if self.enabled else None
+        if trace is not None:
+            trace.set(**attrs)
+
+    def timed_queue(self, event_queue):
+        """Wrap an A2A EventQueue so time spent in ``enqueue_event`` is traced."""
+        if not self.enabled:
+            return event_queue
+        return _TimedEventQueue(event_queue, self)
+
+    def callbacks(self) -> list[BaseCallbackHandler]:
+        trace = _current_trace.get() if self.enabled else None
+        return [TraceCallbackHandler(trace)] if trace is not None else []
+
+    def timed(self, name: str, iterator: AsyncIterator) -> AsyncIterator:
+        """Time only the waits on ``iterator``, not the consumer's work between items."""
+        if not self.enabled:
+            return iterator
+        return self._timed(name, iterator, _current_trace.get())
+
+    async def _timed(self, name: str, iterator, trace: 'Trace | None'):
+        waited = 0.0
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    item = await anext(iterator)
+                except StopAsyncIteration:
+                    waited += time.perf_counter() - started
+                    return
+                waited += time.perf_counter() - started
+                yield item
+        finally:
+            await iterator.aclose()
+            metrics.observe('tutor_span_duration_seconds', waited, span=name)
+            if trace is not None:
+                trace.add(name, waited)
+
+
+class _TimedEventQueue:
+    def __init__(self, event_queue, tracer: Tracer):
+        self._event_queue = event_queue
+        self._tracer = tracer
+
+    async def enqueue_event(self, event) -> None:
+        with self._tracer.span('enqueue'):
+            await self._event_queue.enqueue_event(event)
+
+    def __getattr__(self, name: str):
+        return getattr(self._event_queue, name)
+
+
+tracer = Tracer.from_env()
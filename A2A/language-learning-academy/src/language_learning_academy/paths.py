@@ -0,0 +1,26 @@
+import os
+
+from pathlib import Path
+
+
+# Checkpoints and tasks must survive restarts, so they live in the XDG state
+# dir rather than the cache dir, which the OS or user may clear at any time.
+DEFAULT_DATA_DIR = Path(os.getenv('XDG_STATE_HOME') or Path.home() / '.local' / 'state') / 'language-learning-academy'
+
+
+def data_dir() -> Path:
+    """Absolute directory for the server's SQLite files (``ACADEMY_DATA_DIR`` or the user state dir)."""
+    path = Path(os.getenv('ACADEMY_DATA_DIR') or DEFAULT_DATA_DIR).expanduser().resolve()
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def data_path(configured: str | None, default_name: str) -> str:
+    """Resolve a configured file path, or ``default_name`` inside the data dir, to an absolute path.
+
+    Relative overrides are resolved once, against the directory the server
+    was started from, so later ``chdir`` calls cannot move the file.
+    """
+    if configured:
+        return str(Path(configured).expanduser().resolve())
+    return str(data_dir() / default_name)
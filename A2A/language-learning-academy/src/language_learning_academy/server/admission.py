@@ -0,0 +1,286 @@
+import asyncio
+import hashlib
+import json
+import math
+import os
+import time
+
+from collections import OrderedDict, deque
+
+import structlog
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# Only these JSON-RPC methods start model work; task reads and cancels are
+# never queued behind them.
+ADMITTED_METHODS = frozenset({'message/send', 'message/stream'})
+
+# Kept clear of -32001..-32007, which A2A reserves for its own errors
+# (TaskNotFoundError is -32001).
+SERVER_BUSY_CODE = -32000
+RATE_LIMITED_CODE = -32029
+
+logger = structlog.get_logger()
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, status_code: int, code: int, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.code = code
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Consume one token; return 0 on success, else seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class AdmissionController:
+    """Bounds model work admitted to this worker.
+
+    Each caller first draws from its own token bucket (``rate_per_second``
+    sustained, ``burst`` at once) and is rejected with 429 when it is empty.
+    At most ``max_concurrency`` slots are then in use at a time; up to
+    ``max_queue`` more requests wait, first come first served, for at most
+    ``queue_timeout`` seconds, and anything beyond that is shed immediately
+    with 503. A request that fans out (a batch) takes one slot per model run
+    it may have going at once.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 32,
+        max_queue: int = 64,
+        queue_timeout: float = 10.0,
+        rate_per_second: float | None = None,
+        burst: float = 10.0,
+        max_callers: int = 10_000,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_callers = max_callers
+        self._free = max_concurrency
+        self._waiters: deque[tuple[int, asyncio.Future]] = deque()
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.shed = 0
+        self.rate_limited = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'in_flight': self.in_flight,
+            'waiting': self.waiting,
+            'admitted': self.admitted,
+            'shed': self.shed,
+            'rate_limited': self.rate_limited,
+        }
+
+    def _check_rate(self, caller: str) -> None:
+        if not self.rate_per_second:
+            return
+        bucket = self._buckets.get(caller)
+        if bucket is None:
+            bucket = self._buckets[caller] = TokenBucket(self.rate_per_second, self.burst)
+            if len(self._buckets) > self.max_callers:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(caller)
+        wait = bucket.take()
+        if wait:
+            self.rate_limited += 1
+            raise AdmissionRejected(429, RATE_LIMITED_CODE, 'Rate limit exceeded for this caller', wait)
+
+    def _slots_for(self, weight: int) -> int:
+        return max(1, min(weight, self.max_concurrency))
+
+    async def acquire(self, caller: str, weight: int = 1) -> None:
+        """Take ``weight`` slots (clamped to 1..max_concurrency) for one request."""
+        self._check_rate(caller)
+        weight = self._slots_for(weight)
+        if self._waiters or self._free < weight:
+            if self.waiting >= self.max_queue:
+                self.shed += 1
+                raise AdmissionRejected(503, SERVER_BUSY_CODE, 'Server is at capacity', self.queue_timeout)
+            granted = asyncio.get_running_loop().create_future()
+            waiter = (weight, granted)
+            self._waiters.append(waiter)
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(asyncio.shield(granted), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._abandon(waiter)
+                self.shed += 1
+                raise AdmissionRejected(503, SERVER_BUSY_CODE, 'Timed out waiting for capacity', self.queue_timeout)
+            except asyncio.CancelledError:
+                self._abandon(waiter)
+                raise
+            finally:
+                self.waiting -= 1
+        else:
+            self._free -= weight
+        self.in_flight += 1
+        self.admitted += 1
+
+    def release(self, weight: int = 1) -> None:
+        self.in_flight -= 1
+        self._give_back(self._slots_for(weight))
+
+    def _abandon(self, waiter: tuple[int, asyncio.Future]) -> None:
+        weight, granted = waiter
+        if granted.done():
+            # The slots were handed over just as the wait gave up
+            self._give_back(weight)
+        else:
+            self._waiters.remove(waiter)
+            self._wake()
+
+    def _give_back(self, weight: int) -> None:
+        self._free += weight
+        self._wake()
+
+    def _wake(self) -> None:
+        # Strict FIFO: a wide request at the head is not overtaken by narrow ones
+        while self._waiters and self._free >= self._waiters[0][0]:
+            weight, granted = self._waiters.popleft()
+            self._free -= weight
+            granted.set_result(None)
+
+
+def build_admission_controller() -> AdmissionController | None:
+    max_concurrency = int(os.getenv('ADMISSION_MAX_CONCURRENCY', '32'))
+    if max_concurrency <= 0:
+        return None
+    rate = float(os.getenv('ADMISSION_RATE_PER_SECOND', '0'))
+    return AdmissionController(
+        max_concurrency=max_concurrency,
+        max_queue=int(os.getenv('ADMISSION_MAX_QUEUE', '64')),
+        queue_timeout=float(os.getenv('ADMISSION_QUEUE_TIMEOUT_SECONDS', '10')),
+        rate_per_second=rate if rate > 0 else None,
+        burst=float(os.getenv('ADMISSION_BURST', '10')),
+    )
+
+
+def _request_weight(request: dict, batch_concurrency: int) -> int:
+    """Model runs a ``message/*`` call may have going at once: one, or a batch's fan-out."""
+    params = request.get('params') if isinstance(request.get('params'), dict) else {}
+    message = params.get('message') if isinstance(params.get('message'), dict) else {}
+    for part in message.get('parts') or ():
+        data = part.get('data') if isinstance(part, dict) else None
+        if isinstance(data, dict) and isinstance(data.get('batch'), list):
+            return max(1, min(len(data['batch']), batch_concurrency))
+    return 1
+
+
+def _caller_identity(scope: Scope, request: dict) -> str:
+    headers = dict(scope.get('headers') or [])
+    authorization = headers.get(b'authorization')
+    if authorization:
+        return 'auth:' + hashlib.sha256(authorization).hexdigest()
+    params = request.get('params') if isinstance(request.get('params'), dict) else {}
+    message = params.get('message') if isinstance(params.get('message'), dict) else {}
+    context_id = message.get('contextId') or message.get('context_id')
+    if context_id:
+        return f'context:{context_id}'
+    client = scope.get('client')
+    return f'client:{client[0]}' if client else 'anonymous'
+
+
+class AdmissionMiddleware:
+    """ASGI middleware that runs A2A ``message/*`` calls through an AdmissionController.
+
+    The slots are held until the response has been fully sent, so a
+    ``message/stream`` call counts against the limit for its whole duration.
+    A ``{"batch": [...]}`` message is charged one slot per item, up to the
+    ``batch_concurrency`` items the executor runs at once.
+    """
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController, batch_concurrency: int = 1):
+        self.app = app
+        self.controller = controller
+        self.batch_concurrency = batch_concurrency
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['method'] != 'POST':
+            await self.app(scope, receive, send)
+            return
+
+        body = b''
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+            body += message.get('body', b'')
+            more_body = message.get('more_body', False)
+
+        try:
+            request = json.loads(body)
+        except ValueError:
+            request = None
+        if not isinstance(request, dict) or request.get('method') not in ADMITTED_METHODS:
+            await self.app(scope, _replay(body, receive), send)
+            return
+
+        weight = _request_weight(request, self.batch_concurrency)
+        try:
+            await self.controller.acquire(_caller_identity(scope, request), weight)
+        except AdmissionRejected as e:
+            logger.debug('Request rejected', reason=e.reason, status=e.status_code, **self.controller.stats())
+            await _reject(send, request.get('id'), e)
+            return
+        try:
+            await self.app(scope, _replay(body, receive), send)
+        finally:
+            self.controller.release(weight)
+
+
+def _replay(body: bytes, receive: Receive) -> Receive:
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+        return await receive()
+
+    return replay
+
+
+async def _reject(send: Send, request_id, error: AdmissionRejected) -> None:
+    payload = json.dumps({
+        'jsonrpc': '2.0',
+        'id': request_id,
+        'error': {'code': error.code, 'message': error.reason},
+    }).encode()
+    await send({
+        'type': 'http.response.start',
+        'status': error.status_code,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(payload)).encode()),
+            (b'retry-after', str(math.ceil(error.retry_after)).encode()),
+        ],
+    })
+    await send({'type': 'http.response.body', 'body': payload})
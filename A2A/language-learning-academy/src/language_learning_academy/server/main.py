@@ -1,22 +1,48 @@
+import contextlib
+import os
+
+import click
 import structlog
 import uvicorn
 
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import (
     AgentCapabilities,
     AgentCard,
     AgentSkill,
+    UnsupportedOperationError,
 )
+from a2a.utils.errors import ServerError
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
 from language_learning_academy.agent.executor import (
+    BATCH_MAX_CONCURRENCY,
+    LEVELS,
+    SUPPORTED_LANGUAGES,
     LLMLanguageLearningAgentExecutor,
 )
+from language_learning_academy.agent.router import build_intent_router
+from language_learning_academy.agent.tracing import metrics
+from language_learning_academy.server.admission import (
+    AdmissionController,
+    AdmissionMiddleware,
+    build_admission_controller,
+)
+from language_learning_academy.server.task_store import build_task_store
+
 
+SERVER_PORT = int(os.getenv('SERVER_PORT', '9999'))
+SERVER_HOST = os.getenv('SERVER_HOST', '0.0.0.0')
+SERVER_WORKERS = int(os.getenv('SERVER_WORKERS', '1'))
+SERVER_GRACEFUL_TIMEOUT = int(os.getenv('SERVER_GRACEFUL_TIMEOUT', '30'))
 
-SERVER_PORT = 9999
-SERVER_HOST = '0.0.0.0'
+WORKER_LOCAL_MESSAGE = (
+    'tasks/cancel and tasks/resubscribe are not supported when the server runs with more than one worker'
+)
 
 structlog.configure(
     processors=[
@@ -34,7 +60,21 @@ structlog.configure(
     cache_logger_on_first_use=True,
 )
 
-def main():
+def advertised_url() -> str:
+    """Base URL for the agent card, from the host and port this process was started with.
+
+    Read at call time rather than import time, because ``main()`` exports the
+    ``--host``/``--port`` options for the worker processes. Wildcard bind
+    addresses are advertised as localhost.
+    """
+    host = os.getenv('SERVER_HOST', SERVER_HOST)
+    if host in ('', '0.0.0.0', '::'):
+        host = 'localhost'
+    elif ':' in host:
+        host = f'[{host}]'
+    return f"http://{host}:{os.getenv('SERVER_PORT', str(SERVER_PORT))}/"
+
+def build_agent_cards(url: str | None = None) -> tuple[AgentCard, AgentCard]:
     vocabulary_skill = AgentSkill(
         id='vocabulary_lesson',
         name='Vocabulary Lessons',
@@ -95,10 +135,25 @@ def main():
         ],
     )
 
+    batch_skill = AgentSkill(
+        id='batch_tutoring',
+        name='Batch Tutoring',
+        description=(
+            'Answer many lesson requests in one message. Send a data part {"batch": [...]} whose items are '
+            'query strings or {"query": ..., "profile": {...}} objects; identical requests are answered once and '
+            'each result streams back as a language_learning_batch_item artifact listing its item indices'
+        ),
+        tags=['batch', 'classroom', 'vocabulary', 'bulk'],
+        examples=[
+            '{"batch": ["Teach me Spanish food words", "Teach me French greetings"]}',
+        ],
+        input_modes=['application/json'],
+    )
+
     public_agent_card = AgentCard(
         name='Language Learning Academy - LLM Edition',
         description='An intelligent AI-powered language learning assistant using real LLMs (gpt-5-2025-08-07) with LangGraph for advanced vocabulary, grammar, conversation practice, and personalized tutoring across multiple languages',
-        url=f'http://localhost:{SERVER_PORT}/',
+        url=url or advertised_url(),
         version='2.0.0',
         default_input_modes=['text'],
         default_output_modes=['text', 'application/json'],
@@ -108,7 +163,8 @@ def main():
             grammar_skill,
             conversation_skill,
             quiz_skill,
-            info_skill
+            info_skill,
+            batch_skill,
         ],
         supports_authenticated_extended_card=True,
     )
@@ -124,6 +180,7 @@ def main():
                 conversation_skill,
                 quiz_skill,
                 info_skill,
+                batch_skill,
                 AgentSkill(
                     id='personalized_learning',
                     name='Personalized Learning Path',
@@ -139,9 +196,41 @@ def main():
         }
     )
 
-    request_handler = DefaultRequestHandler(
-        agent_executor=LLMLanguageLearningAgentExecutor(),
-        task_store=InMemoryTaskStore(),
+    return public_agent_card, extended_agent_card
+
+class MultiWorkerRequestHandler(DefaultRequestHandler):
+    """Refuses calls that only the worker running the task can serve.
+
+    Cancellation goes through the executor's table of running tasks and
+    resubscription through the in-memory event queues, both local to the
+    worker process that started the task. uvicorn spreads connections across
+    workers, so such a call could land on a worker that would mark the task
+    canceled while the run carries on elsewhere and later completes it.
+    """
+
+    async def on_cancel_task(self, params, context=None):
+        raise ServerError(error=UnsupportedOperationError(message=WORKER_LOCAL_MESSAGE))
+
+    async def on_resubscribe_to_task(self, params, context=None):
+        raise ServerError(error=UnsupportedOperationError(message=WORKER_LOCAL_MESSAGE))
+        yield
+
+def create_app(
+    agent_executor: LLMLanguageLearningAgentExecutor | None = None,
+    admission: AdmissionController | None = None,
+) -> Starlette:
+    public_agent_card, extended_agent_card = build_agent_cards()
+    # Built here rather than at import time so every worker process compiles
+    # its own graph and model client before uvicorn starts accepting traffic.
+    agent_executor = agent_executor or LLMLanguageLearningAgentExecutor(
+        router=build_intent_router(public_agent_card.skills, SUPPORTED_LANGUAGES, LEVELS),
+    )
+
+    workers = int(os.getenv('SERVER_WORKERS', '1'))
+    handler_class = MultiWorkerRequestHandler if workers > 1 else DefaultRequestHandler
+    request_handler = handler_class(
+        agent_executor=agent_executor,
+        task_store=build_task_store(),
     )
 
     server = A2AStarletteApplication(
@@ -150,10 +239,75 @@ def main():
         extended_agent_card=extended_agent_card,
     )
 
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette):
+        logger = structlog.get_logger()
+        await agent_executor.warm_up()
+        logger.info('Worker warmed up', pid=os.getpid())
+        yield
+        logger.info('Worker drained', pid=os.getpid())
+
+    middleware = []
+    admission = admission or build_admission_controller()
+    if admission is not None:
+        middleware.append(
+            Middleware(AdmissionMiddleware, controller=admission, batch_concurrency=BATCH_MAX_CONCURRENCY)
+        )
+
+    app = server.build(lifespan=lifespan, middleware=middleware)
+    # Gauges read live state and cost nothing until scraped, so /metrics is
+    # always served; only per-request spans and traces need TRACING_ENABLED.
+    metrics.gauge('tutor_tasks_in_flight', lambda: agent_executor.in_flight, 'Tasks currently executing')
+    if (router := agent_executor.router) is not None:
+        metrics.gauge('tutor_router_requests_total', lambda: router.total, 'Requests seen by the intent router', kind='counter')
+        metrics.gauge(
+            'tutor_router_short_circuit_ratio',
+            lambda: router.short_circuit_fraction,
+            'Fraction of requests answered locally without the LLM',
+        )
+    if admission is not None:
+        metrics.gauge('tutor_admission_waiting', lambda: admission.waiting, 'Requests waiting for an admission slot')
+        metrics.gauge('tutor_admission_shed_total', lambda: admission.shed, 'Requests shed with 503', kind='counter')
+        metrics.gauge('tutor_admission_rate_limited_total', lambda: admission.rate_limited, 'Requests rejected with 429', kind='counter')
+
+    async def metrics_endpoint(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(metrics.render(), media_type='text/plain; version=0.0.4')
+
+    app.add_route('/metrics', metrics_endpoint, methods=['GET'])
+    return app
+
+@click.command()
+@click.option('--host', default=SERVER_HOST, show_default=True)
+@click.option('--port', default=SERVER_PORT, show_default=True)
+@click.option('--workers', default=SERVER_WORKERS, show_default=True, help='Number of worker processes.')
+@click.option('--loop', type=click.Choice(['auto', 'asyncio', 'uvloop']), default='auto', show_default=True)
+@click.option('--http', type=click.Choice(['auto', 'h11', 'httptools']), default='auto', show_default=True)
+@click.option(
+    '--graceful-timeout',
+    default=SERVER_GRACEFUL_TIMEOUT,
+    show_default=True,
+    help='Seconds to drain in-flight requests after SIGTERM.',
+)
+def main(host, port, workers, loop, http, graceful_timeout):
     logger = structlog.get_logger()
-    logger.info(f"Starting Language Learning Academy server on {SERVER_HOST}:{SERVER_PORT}")
+    logger.info(f"Starting Language Learning Academy server on {host}:{port} with {workers} worker(s)")
+    if workers > 1:
+        logger.warning(WORKER_LOCAL_MESSAGE)
+    # Worker processes read these in create_app() and build_checkpointer()
+    os.environ['SERVER_WORKERS'] = str(workers)
+    os.environ['SERVER_HOST'] = host
+    os.environ['SERVER_PORT'] = str(port)
 
-    uvicorn.run(server.build(), host=SERVER_HOST, port=SERVER_PORT)
+    uvicorn.run(
+        'language_learning_academy.server.main:create_app',
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        timeout_graceful_shutdown=graceful_timeout,
+    )
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,137 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+
+import structlog
+
+from a2a.server.tasks import InMemoryTaskStore, TaskStore
+from a2a.types import Task, TaskState
+
+from language_learning_academy.paths import data_path
+
+
+DEFAULT_TASK_STORE_PATH = 'tasks.sqlite'
+DEFAULT_COMPLETED_TASK_TTL_SECONDS = 24 * 3600.0
+DEFAULT_SWEEP_INTERVAL_SECONDS = 60.0
+
+TERMINAL_STATES = (
+    TaskState.completed.value,
+    TaskState.canceled.value,
+    TaskState.failed.value,
+    TaskState.rejected.value,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class SqliteTaskStore(TaskStore):
+    """Durable A2A task store on a SQLite database in WAL mode.
+
+    Tasks are stored as JSON keyed by task id with a secondary index on
+    context id, so several uvicorn workers can share one file. Tasks in a
+    terminal state are evicted once they are older than ``completed_ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        completed_ttl_seconds: float | None = DEFAULT_COMPLETED_TASK_TTL_SECONDS,
+        sweep_interval_seconds: float = DEFAULT_SWEEP_INTERVAL_SECONDS,
+    ):
+        self.path = path or data_path(None, DEFAULT_TASK_STORE_PATH)
+        self.completed_ttl_seconds = completed_ttl_seconds
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._last_sweep = time.monotonic()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0, isolation_level=None)
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS tasks (
+                id TEXT PRIMARY KEY,
+                context_id TEXT NOT NULL,
+                state TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS tasks_context_id ON tasks (context_id);
+            CREATE INDEX IF NOT EXISTS tasks_state_updated_at ON tasks (state, updated_at);
+            """
+        )
+
+    def _save(self, task: Task) -> None:
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO tasks (id, context_id, state, updated_at, data) VALUES (?, ?, ?, ?, ?)',
+                (task.id, task.context_id, task.status.state.value, time.time(), task.model_dump_json()),
+            )
+
+    def _get(self, task_id: str) -> Task | None:
+        with self._lock:
+            row = self._conn.execute('SELECT data FROM tasks WHERE id = ?', (task_id,)).fetchone()
+        return Task.model_validate_json(row[0]) if row else None
+
+    def _list_by_context(self, context_id: str) -> list[Task]:
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT data FROM tasks WHERE context_id = ? ORDER BY updated_at', (context_id,)
+            ).fetchall()
+        return [Task.model_validate_json(row[0]) for row in rows]
+
+    def _delete(self, task_id: str) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM tasks WHERE id = ?', (task_id,))
+
+    def _evict_expired(self) -> int:
+        if self.completed_ttl_seconds is None:
+            return 0
+        cutoff = time.time() - self.completed_ttl_seconds
+        placeholders = ', '.join('?' for _ in TERMINAL_STATES)
+        with self._lock:
+            cursor = self._conn.execute(
+                f'DELETE FROM tasks WHERE state IN ({placeholders}) AND updated_at < ?',
+                (*TERMINAL_STATES, cutoff),
+            )
+        return cursor.rowcount
+
+    async def save(self, task: Task) -> None:
+        await asyncio.to_thread(self._save, task)
+        now = time.monotonic()
+        if now - self._last_sweep >= self.sweep_interval_seconds:
+            self._last_sweep = now
+            evicted = await self.evict_expired()
+            if evicted:
+                logger.info('Evicted expired tasks', count=evicted)
+
+    async def get(self, task_id: str) -> Task | None:
+        return await asyncio.to_thread(self._get, task_id)
+
+    async def delete(self, task_id: str) -> None:
+        await asyncio.to_thread(self._delete, task_id)
+
+    async def list_by_context(self, context_id: str) -> list[Task]:
+        return await asyncio.to_thread(self._list_by_context, context_id)
+
+    async def evict_expired(self) -> int:
+        return await asyncio.to_thread(self._evict_expired)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def build_task_store() -> TaskStore:
+    backend = os.getenv('TASK_STORE_BACKEND', 'sqlite').lower()
+    if backend == 'memory':
+        return InMemoryTaskStore()
+    if backend != 'sqlite':
+        raise ValueError(f'Unknown TASK_STORE_BACKEND: {backend}')
+
+    ttl = float(os.getenv('TASK_STORE_TTL_SECONDS', DEFAULT_COMPLETED_TASK_TTL_SECONDS))
+    return SqliteTaskStore(
+        path=data_path(os.getenv('TASK_STORE_PATH'), DEFAULT_TASK_STORE_PATH),
+        completed_ttl_seconds=ttl if ttl > 0 else None,
+    )
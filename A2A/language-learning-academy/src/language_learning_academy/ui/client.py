@@ -0,0 +1,190 @@
+import asyncio
+import importlib.util
+import threading
+import time
+
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+from uuid import uuid4
+
+import httpx
+
+from a2a.client import A2ACardResolver, A2AClient
+from a2a.types import (
+    AgentCard,
+    MessageSendParams,
+    SendMessageRequest,
+    SendStreamingMessageRequest,
+)
+
+
+CARD_TTL_SECONDS = 300.0
+REQUEST_TIMEOUT_SECONDS = 200.0
+
+
+class AgentClient:
+    """Long-lived A2A client for one agent URL.
+
+    Owns a pooled keep-alive ``httpx.AsyncClient`` (HTTP/2 when the optional
+    ``h2`` package is installed), a resolved AgentCard reused for
+    ``card_ttl`` seconds, and a background event loop thread. Streamlit
+    reruns submit coroutines to that loop with ``run()`` instead of creating
+    a loop, a client and a TCP connection per message.
+    """
+
+    def __init__(self, base_url: str, card_ttl: float = CARD_TTL_SECONDS, timeout: float = REQUEST_TIMEOUT_SECONDS):
+        self.base_url = base_url
+        self.card_ttl = card_ttl
+        self.timeout = timeout
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name='a2a-client-loop', daemon=True)
+        self._thread.start()
+        self._httpx_client = self.run(self._create_httpx_client())
+        self._card: AgentCard | None = None
+        self._card_fetched_at = 0.0
+        self._a2a_client: A2AClient | None = None
+        self._card_lock = asyncio.Lock()
+
+    async def _create_httpx_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=importlib.util.find_spec('h2') is not None,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0),
+        )
+
+    def run(self, coroutine, timeout: float | None = None):
+        """Run a coroutine on the client's loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def invalidate_card(self) -> None:
+        self._card_fetched_at = 0.0
+
+    async def get_agent_card(self) -> AgentCard:
+        async with self._card_lock:
+            if self._card is None or time.monotonic() - self._card_fetched_at > self.card_ttl:
+                resolver = A2ACardResolver(httpx_client=self._httpx_client, base_url=self.base_url)
+                card = await resolver.get_agent_card()
+                if self._card is None or card != self._card:
+                    self._a2a_client = A2AClient(httpx_client=self._httpx_client, agent_card=card)
+                self._card = card
+                self._card_fetched_at = time.monotonic()
+            return self._card
+
+    async def send_message(self, message_text: str, use_streaming: bool = False, profile: dict | None = None) -> dict[str, Any]:
+        if use_streaming:
+            response_chunks = []
+            async for chunk in self.stream_message(message_text, profile):
+                response_chunks.append(chunk)
+
+            return {"streaming_response": response_chunks}
+
+        await self.get_agent_card()
+        request = SendMessageRequest(
+            id=str(uuid4()),
+            params=MessageSendParams(**_message_payload(message_text, profile))
+        )
+
+        response = await self._a2a_client.send_message(request)
+        return response.model_dump(mode='json', exclude_none=True)
+
+    async def stream_message(self, message_text: str, profile: dict | None = None) -> AsyncIterator[dict[str, Any]]:
+        """Yield each streamed A2A event as a JSON dict as soon as it arrives."""
+        await self.get_agent_card()
+        request = SendStreamingMessageRequest(
+            id=str(uuid4()),
+            params=MessageSendParams(**_message_payload(message_text, profile))
+        )
+        async for chunk in self._a2a_client.send_message_streaming(request):
+            yield chunk.model_dump(mode='json', exclude_none=True)
+
+    def iter_stream(self, message_text: str, profile: dict | None = None) -> Iterator[dict[str, Any]]:
+        """Synchronous view of ``stream_message`` for the Streamlit script thread.
+
+        Events are pulled one at a time from the client loop, so at most one
+        event is buffered between the network and the caller.
+        """
+        events = self.stream_message(message_text, profile)
+        try:
+            while True:
+                try:
+                    yield self.run(anext(events))
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.run(events.aclose())
+
+    def close(self) -> None:
+        self.run(self._httpx_client.aclose())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+
+
+def _message_payload(message_text: str, profile: dict | None) -> dict[str, Any]:
+    message_metadata = {}
+    if profile:
+        message_metadata['profile'] = profile
+
+    return {
+        'message': {
+            'role': 'user',
+            'parts': [
+                {'kind': 'text', 'text': message_text}
+            ],
+            'message_id': uuid4().hex,
+            'metadata': message_metadata,
+        },
+    }
+
+
+def _parts_text(parts: list[dict]) -> str:
+    return ''.join(part.get('text', '') for part in parts if part.get('kind') == 'text')
+
+
+class StreamState:
+    """What the UI shows for one streamed reply, folded from A2A events.
+
+    Only the latest status line and the reply text are kept, never the raw
+    events, so memory stays proportional to the answer itself.
+    """
+
+    def __init__(self):
+        self.status = ''
+        self.text = ''
+        self.error = ''
+        self.done = False
+
+    def apply(self, event: dict[str, Any]) -> bool:
+        """Fold one event in; return True if anything visible changed."""
+        if 'error' in event:
+            self.error = event['error'].get('message', str(event['error']))
+            self.done = True
+            return True
+        result = event.get('result', {})
+        kind = result.get('kind')
+        if kind == 'status-update':
+            status = result.get('status', {})
+            message = _parts_text(status.get('message', {}).get('parts', []))
+            if status.get('state') == 'input-required':
+                self.text = message or self.text
+            elif message:
+                self.status = message
+            if result.get('final') or status.get('state') in ('completed', 'failed', 'canceled', 'input-required'):
+                self.done = True
+                self.status = ''
+            return True
+        if kind == 'artifact-update':
+            artifact = result.get('artifact', {})
+            chunk = _parts_text(artifact.get('parts', []))
+            name = artifact.get('name')
+            if name == 'language_learning_stream':
+                self.text = self.text + chunk if result.get('append') else chunk
+            elif name == 'language_learning_batch_item':
+                self.text = f'{self.text}\n\n{chunk}' if self.text else chunk
+            else:
+                self.text = chunk
+            return bool(chunk)
+        if kind == 'message':
+            self.text = _parts_text(result.get('parts', []))
+            self.done = True
+            return True
+        return False
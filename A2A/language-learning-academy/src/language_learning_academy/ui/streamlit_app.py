@@ -1,21 +1,21 @@
-import asyncio
 import os
+import time
 
-from typing import Any
-from uuid import uuid4
+from typing import TYPE_CHECKING, Any
 
-import httpx
 import streamlit as st
 
-from a2a.client import A2ACardResolver, A2AClient
-from a2a.types import (
-    MessageSendParams,
-    SendMessageRequest,
-    SendStreamingMessageRequest,
-)
+# Plain imports are cached in sys.modules, so unlike literals in this script
+# (re-executed on every rerun) these tables are built once per process.
+from language_learning_academy.ui.styles import page_css
+from language_learning_academy.ui.translations import translations_for
+
+
+if TYPE_CHECKING:
+    from language_learning_academy.ui.client import AgentClient
 
 
-AGENT_URL = 'http://localhost:9999'
+AGENT_URL = os.getenv('AGENT_URL') or f"http://localhost:{os.getenv('SERVER_PORT', '9999')}"
 SUPPORTED_LANGUAGES = ['spanish', 'french', 'german', 'italian', 'portuguese', 'japanese', 'chinese', 'korean']
 LEVELS = ['beginner', 'intermediate', 'advanced']
 
@@ -26,271 +26,8 @@ LEARNING_GOALS = ["Travel", "Business", "Exam prep"]
 TUTOR_PERSONAS = ["Friendly", "Formal", "Coach"]
 CORRECTION_LEVELS = ["Gentle", "Standard", "Strict"]
 
-TRANSLATIONS = {
-    "en": {
-        "profile": "Profile",
-        "personalization": "Personalization",
-        "native_language": "Native Language",
-        "ui_language": "UI Language",
-        "learning_goal": "Learning Goal",
-        "tutor_persona": "Tutor Persona",
-        "correction_strictness": "Correction Strictness",
-        "performance_settings": "Performance Settings",
-        "learning_preferences": "Learning Preferences",
-        "target_language": "Target Language",
-        "proficiency_level": "Proficiency Level",
-        "title": "Polyglot Academy",
-        "subtitle": "Multi-Agent Language Learning Platform",
-        "tagline": "Master any language with AI-powered tutors, real-time feedback, and personalized learning paths",
-        "ai_tutors": "AI Tutors",
-        "personalized": "Personalized",
-        "real_time": "Real-time",
-        "languages_count": "8 Languages",
-        "powered_by": "gpt-5-2025-08-07 Powered",
-        "supported_languages": "Supported Languages",
-        "skill_levels": "Skill Levels",
-        "learning_modes": "Learning Modes",
-        "ai_possibilities": "AI Possibilities",
-        "system_online": "Multi-Agent System Online",
-        "system_offline": "Multi-Agent System Offline",
-        "all_tutors_ready": "All AI tutors are ready to assist with your language learning journey!",
-        "ensure_running": "Please ensure the agent is running on localhost:9999 with proper LLM API keys configured",
-        "learning_hub": "Learning Hub",
-        "customize_experience": "Customize your learning experience",
-        "enable_streaming": "Enable Real-time Streaming",
-        "streaming_help": "Get real-time responses from the LLM for immediate feedback",
-        "choose_language": "Choose the language you want to learn",
-        "select_skill": "Select your current skill level",
-        "ai_engine_status": "AI Engine Status",
-        "model_source": "Model Source",
-        "ai_model": "AI Model",
-        "quick_actions": "Quick Actions",
-        "languages_btn": "Languages",
-        "refresh_btn": "Refresh",
-        "show_languages": "Show available languages",
-        "refresh_connection": "Refresh connection",
-        "currently_learning": "Currently learning",
-        "at_level": "at",
-        "level": "level",
-        "vocabulary": "Vocabulary",
-        "grammar": "Grammar",
-        "conversation": "Conversation",
-        "quiz": "Quiz",
-        "translation": "Translation",
-        "custom_query": "Custom Query",
-        "vocab_academy": "AI-Powered Vocabulary Academy",
-        "vocab_desc": "Expand your vocabulary with our intelligent tutoring system. Get personalized lessons with pronunciation guides, cultural context, and real-world usage examples.",
-        "select_category": "Select vocabulary category:",
-        "generate_lesson": "Generate Vocabulary Lesson",
-        "create_lesson": "Create a personalized lesson",
-        "pro_tips": "Pro Tips for Vocabulary Learning",
-        "grammar_center": "AI Grammar Mastery Center",
-        "grammar_desc": "Master grammar through intelligent explanations, pattern recognition, and practical exercises. Our AI tutors break down complex rules into digestible lessons.",
-        "choose_focus": "Choose grammar focus:",
-        "start_lesson": "Start Grammar Lesson",
-        "convo_academy": "AI Conversation Academy",
-        "convo_desc": "Practice real-world conversations with our intelligent coaching system. Build confidence through immersive scenarios with cultural insights and pronunciation guidance.",
-        "select_scenario": "Select conversation scenario:",
-        "start_practice": "Start Conversation Practice",
-        "quiz_generator": "AI Quiz Generator",
-        "quiz_desc": "Test and reinforce your knowledge with intelligent, adaptive quizzes. Our AI creates personalized assessments with detailed explanations to accelerate your learning.",
-        "quiz_category": "Quiz category:",
-        "challenge_level": "Challenge level:",
-        "generate_quiz": "Generate Smart Quiz",
-        "translation_studio": "AI Translation Studio",
-        "translation_desc": "Experience intelligent translation that goes beyond words. Our AI provides cultural context, alternative expressions, and nuanced interpretations for professional-quality translations.",
-        "from_language": "From language:",
-        "to_language": "To language:",
-        "enter_text": "Enter text to translate:",
-        "smart_translate": "Smart Translate",
-        "personal_tutor": "Personal AI Language Tutor",
-        "tutor_desc": "Your dedicated AI language consultant is here to answer any question, solve learning challenges, and provide personalized guidance for your journey.",
-        "what_to_learn": "What would you like to learn or explore?",
-        "expert_mode": "Expert Mode",
-        "include_examples": "Include Examples",
-        "consult_tutor": "Consult AI Tutor",
-        "technology": "AI Technology",
-        "features": "Features",
-        "built_with": "Built with ❤️ using Streamlit & A2A Protocol • Advanced AI for Language Excellence"
-    },
-    "hi": {
-        "profile": "प्रोफ़ाइल",
-        "personalization": "वैयक्तिकरण",
-        "native_language": "मातृभाषा",
-        "ui_language": "UI भाषा",
-        "learning_goal": "सीखने का लक्ष्य",
-        "tutor_persona": "शिक्षक व्यक्तित्व",
-        "correction_strictness": "सुधार सख्ती",
-        "performance_settings": "प्रदर्शन सेटिंग्स",
-        "learning_preferences": "सीखने की प्राथमिकताएं",
-        "target_language": "लक्ष्य भाषा",
-        "proficiency_level": "दक्षता स्तर",
-        "title": "पॉलीग्लॉट अकादमी",
-        "subtitle": "मल्टी-एजेंट भाषा सीखने का मंच",
-        "tagline": "AI-संचालित ट्यूटर्स, रीयल-टाइम फीडबैक और व्यक्तिगत सीखने के मार्गों के साथ किसी भी भाषा में महारत हासिल करें",
-        "ai_tutors": "AI ट्यूटर्स",
-        "personalized": "व्यक्तिगत",
-        "real_time": "रीयल-टाइम",
-        "languages_count": "8 भाषाएं",
-        "powered_by": "gpt-5-2025-08-07 संचालित",
-        "supported_languages": "समर्थित भाषाएं",
-        "skill_levels": "कौशल स्तर",
-        "learning_modes": "सीखने के मोड",
-        "ai_possibilities": "AI संभावनाएं",
-        "system_online": "मल्टी-एजेंट सिस्टम ऑनलाइन",
-        "system_offline": "मल्टी-एजेंट सिस्टम ऑफलाइन",
-        "all_tutors_ready": "सभी AI ट्यूटर आपकी भाषा सीखने की यात्रा में सहायता के लिए तैयार हैं!",
-        "ensure_running": "कृपया सुनिश्चित करें कि एजेंट localhost:9999 पर उचित LLM API कुंजियों के साथ चल रहा है",
-        "learning_hub": "लर्निंग हब",
-        "customize_experience": "अपना सीखने का अनुभव अनुकूलित करें",
-        "enable_streaming": "रीयल-टाइम स्ट्रीमिंग सक्षम करें",
-        "streaming_help": "तत्काल फीडबैक के लिए LLM से रीयल-टाइम प्रतिक्रियाएं प्राप्त करें",
-        "choose_language": "वह भाषा चुनें जो आप सीखना चाहते हैं",
-        "select_skill": "अपना वर्तमान कौशल स्तर चुनें",
-        "ai_engine_status": "AI इंजन स्थिति",
-        "model_source": "मॉडल स्रोत",
-        "ai_model": "AI मॉडल",
-        "quick_actions": "त्वरित कार्रवाइयां",
-        "languages_btn": "भाषाएं",
-        "refresh_btn": "रीफ्रेश",
-        "show_languages": "उपलब्ध भाषाएं दिखाएं",
-        "refresh_connection": "कनेक्शन रीफ्रेश करें",
-        "currently_learning": "वर्तमान में सीख रहे हैं",
-        "at_level": "स्तर पर",
-        "level": "स्तर",
-        "vocabulary": "शब्दावली",
-        "grammar": "व्याकरण",
-        "conversation": "बातचीत",
-        "quiz": "प्रश्नोत्तरी",
-        "translation": "अनुवाद",
-        "custom_query": "कस्टम प्रश्न",
-        "vocab_academy": "AI-संचालित शब्दावली अकादमी",
-        "vocab_desc": "हमारी बुद्धिमान ट्यूटरिंग प्रणाली के साथ अपनी शब्दावली का विस्तार करें। उच्चारण गाइड, सांस्कृतिक संदर्भ और वास्तविक उपयोग उदाहरणों के साथ व्यक्तिगत पाठ प्राप्त करें।",
-        "select_category": "शब्दावली श्रेणी चुनें:",
-        "generate_lesson": "शब्दावली पाठ जेनरेट करें",
-        "create_lesson": "व्यक्तिगत पाठ बनाएं",
-        "pro_tips": "शब्दावली सीखने के लिए प्रो टिप्स",
-        "grammar_center": "AI व्याकरण महारत केंद्र",
-        "grammar_desc": "बुद्धिमान स्पष्टीकरण, पैटर्न पहचान और व्यावहारिक अभ्यासों के माध्यम से व्याकरण में महारत हासिल करें। हमारे AI ट्यूटर जटिल नियमों को पचने योग्य पाठों में तोड़ देते हैं।",
-        "choose_focus": "व्याकरण फोकस चुनें:",
-        "start_lesson": "व्याकरण पाठ शुरू करें",
-        "convo_academy": "AI बातचीत अकादमी",
-        "convo_desc": "हमारी बुद्धिमान कोचिंग प्रणाली के साथ वास्तविक दुनिया की बातचीत का अभ्यास करें। सांस्कृतिक अंतर्दृष्टि और उच्चारण मार्गदर्शन के साथ immersive परिदृश्यों के माध्यम से आत्मविश्वास बनाएं।",
-        "select_scenario": "बातचीत परिदृश्य चुनें:",
-        "start_practice": "बातचीत अभ्यास शुरू करें",
-        "quiz_generator": "AI प्रश्नोत्तरी जेनरेटर",
-        "quiz_desc": "बुद्धिमान, अनुकूली प्रश्नोत्तरी के साथ अपने ज्ञान का परीक्षण और मजबूत करें। हमारा AI आपके सीखने को तेज करने के लिए विस्तृत स्पष्टीकरण के साथ व्यक्तिगत मूल्यांकन बनाता है।",
-        "quiz_category": "प्रश्नोत्तरी श्रेणी:",
-        "challenge_level": "चुनौती स्तर:",
-        "generate_quiz": "स्मार्ट प्रश्नोत्तरी जेनरेट करें",
-        "translation_studio": "AI अनुवाद स्टूडियो",
-        "translation_desc": "बुद्धिमान अनुवाद का अनुभव करें जो शब्दों से परे जाता है। हमारा AI पेशेवर-गुणवत्ता अनुवादों के लिए सांस्कृतिक संदर्भ, वैकल्पिक अभिव्यक्तियां और सूक्ष्म व्याख्याएं प्रदान करता है।",
-        "from_language": "किस भाषा से:",
-        "to_language": "किस भाषा में:",
-        "enter_text": "अनुवाद करने के लिए टेक्स्ट दर्ज करें:",
-        "smart_translate": "स्मार्ट अनुवाद",
-        "personal_tutor": "व्यक्तिगत AI भाषा ट्यूटर",
-        "tutor_desc": "आपका समर्पित AI भाषा सलाहकार किसी भी प्रश्न का उत्तर देने, सीखने की चुनौतियों को हल करने और आपकी यात्रा के लिए व्यक्तिगत मार्गदर्शन प्रदान करने के लिए यहां है।",
-        "what_to_learn": "आप क्या सीखना या खोजना चाहेंगे?",
-        "expert_mode": "विशेषज्ञ मोड",
-        "include_examples": "उदाहरण शामिल करें",
-        "consult_tutor": "AI ट्यूटर से परामर्श करें",
-        "technology": "AI प्रौद्योगिकी",
-        "features": "विशेषताएं",
-        "built_with": "❤️ के साथ Streamlit और A2A प्रोटोकॉल का उपयोग करके बनाया गया • भाषा उत्कृष्टता के लिए उन्नत AI"
-    },
-    "fr": {
-        "profile": "Profil",
-        "personalization": "Personnalisation",
-        "native_language": "Langue maternelle",
-        "ui_language": "Langue de l'interface",
-        "learning_goal": "Objectif d'apprentissage",
-        "tutor_persona": "Personnalité du tuteur",
-        "correction_strictness": "Niveau de correction",
-        "performance_settings": "Paramètres de performance",
-        "learning_preferences": "Préférences d'apprentissage",
-        "target_language": "Langue cible",
-        "proficiency_level": "Niveau de compétence",
-        "title": "Académie Polyglotte",
-        "subtitle": "Plateforme d'apprentissage des langues multi-agents",
-        "tagline": "Maîtrisez n'importe quelle langue avec des tuteurs alimentés par l'IA, des retours en temps réel et des parcours d'apprentissage personnalisés",
-        "ai_tutors": "Tuteurs IA",
-        "personalized": "Personnalisé",
-        "real_time": "Temps réel",
-        "languages_count": "8 Langues",
-        "powered_by": "Alimenté par gpt-5-2025-08-07",
-        "supported_languages": "Langues prises en charge",
-        "skill_levels": "Niveaux de compétence",
-        "learning_modes": "Modes d'apprentissage",
-        "ai_possibilities": "Possibilités IA",
-        "system_online": "Système multi-agents en ligne",
-        "system_offline": "Système multi-agents hors ligne",
-        "all_tutors_ready": "Tous les tuteurs IA sont prêts à vous aider dans votre parcours d'apprentissage des langues!",
-        "ensure_running": "Veuillez vous assurer que l'agent fonctionne sur localhost:9999 avec les clés API LLM appropriées configurées",
-        "learning_hub": "Centre d'apprentissage",
-        "customize_experience": "Personnalisez votre expérience d'apprentissage",
-        "enable_streaming": "Activer le streaming en temps réel",
-        "streaming_help": "Obtenez des réponses en temps réel du LLM pour un retour immédiat",
-        "choose_language": "Choisissez la langue que vous voulez apprendre",
-        "select_skill": "Sélectionnez votre niveau de compétence actuel",
-        "ai_engine_status": "État du moteur IA",
-        "model_source": "Source du modèle",
-        "ai_model": "Modèle IA",
-        "quick_actions": "Actions rapides",
-        "languages_btn": "Langues",
-        "refresh_btn": "Actualiser",
-        "show_languages": "Afficher les langues disponibles",
-        "refresh_connection": "Actualiser la connexion",
-        "currently_learning": "Apprend actuellement",
-        "at_level": "au niveau",
-        "level": "niveau",
-        "vocabulary": "Vocabulaire",
-        "grammar": "Grammaire",
-        "conversation": "Conversation",
-        "quiz": "Quiz",
-        "translation": "Traduction",
-        "custom_query": "Requête personnalisée",
-        "vocab_academy": "Académie de vocabulaire alimentée par l'IA",
-        "vocab_desc": "Élargissez votre vocabulaire avec notre système de tutorat intelligent. Obtenez des leçons personnalisées avec des guides de prononciation, un contexte culturel et des exemples d'utilisation réels.",
-        "select_category": "Sélectionnez la catégorie de vocabulaire:",
-        "generate_lesson": "Générer une leçon de vocabulaire",
-        "create_lesson": "Créer une leçon personnalisée",
-        "pro_tips": "Conseils pro pour l'apprentissage du vocabulaire",
-        "grammar_center": "Centre de maîtrise de la grammaire IA",
-        "grammar_desc": "Maîtrisez la grammaire grâce à des explications intelligentes, à la reconnaissance de modèles et à des exercices pratiques. Nos tuteurs IA décomposent les règles complexes en leçons digestes.",
-        "choose_focus": "Choisissez le focus grammatical:",
-        "start_lesson": "Commencer la leçon de grammaire",
-        "convo_academy": "Académie de conversation IA",
-        "convo_desc": "Pratiquez des conversations du monde réel avec notre système de coaching intelligent. Développez votre confiance grâce à des scénarios immersifs avec des informations culturelles et des conseils de prononciation.",
-        "select_scenario": "Sélectionnez le scénario de conversation:",
-        "start_practice": "Commencer la pratique de conversation",
-        "quiz_generator": "Générateur de quiz IA",
-        "quiz_desc": "Testez et renforcez vos connaissances avec des quiz intelligents et adaptatifs. Notre IA crée des évaluations personnalisées avec des explications détaillées pour accélérer votre apprentissage.",
-        "quiz_category": "Catégorie de quiz:",
-        "challenge_level": "Niveau de défi:",
-        "generate_quiz": "Générer un quiz intelligent",
-        "translation_studio": "Studio de traduction IA",
-        "translation_desc": "Découvrez une traduction intelligente qui va au-delà des mots. Notre IA fournit un contexte culturel, des expressions alternatives et des interprétations nuancées pour des traductions de qualité professionnelle.",
-        "from_language": "De la langue:",
-        "to_language": "Vers la langue:",
-        "enter_text": "Entrez le texte à traduire:",
-        "smart_translate": "Traduction intelligente",
-        "personal_tutor": "Tuteur personnel de langue IA",
-        "tutor_desc": "Votre consultant linguistique IA dédié est là pour répondre à toute question, résoudre les défis d'apprentissage et fournir des conseils personnalisés pour votre parcours.",
-        "what_to_learn": "Qu'aimeriez-vous apprendre ou explorer?",
-        "expert_mode": "Mode expert",
-        "include_examples": "Inclure des exemples",
-        "consult_tutor": "Consulter le tuteur IA",
-        "technology": "Technologie IA",
-        "features": "Fonctionnalités",
-        "built_with": "Construit avec ❤️ en utilisant Streamlit et le protocole A2A • IA avancée pour l'excellence linguistique"
-    }
-}
-
 def t(key: str) -> str:
-    ui_lang = st.session_state.get('ui_language', 'English')
-    lang_code = {'English': 'en', 'Hindi': 'hi', 'French': 'fr'}.get(ui_lang, 'en')
-    return TRANSLATIONS.get(lang_code, TRANSLATIONS['en']).get(key, key)
+    return translations_for(st.session_state.get('ui_language', 'English')).get(key, key)
 
 def build_profile_prompt(text: str) -> str:
     p = st.session_state.get('profile', {})
@@ -335,396 +72,81 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    .main {
-        padding-top: 2rem;
-    }
-    
-    .block-container {
-        padding-top: 1rem;
-        padding-bottom: 0rem;
-        max-width: 100%;
-    }
-    
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #667eea 0%, #764ba2 100%);
-        color: white;
-    }
-    
-    [data-testid="stSidebar"] .sidebar-content {
-        background: transparent;
-    }
-    
-    [data-testid="stSidebar"] h1, [data-testid="stSidebar"] h2, [data-testid="stSidebar"] h3 {
-        color: white !important;
-    }
-    
-    [data-testid="stSidebar"] .stSelectbox label {
-        color: white !important;
-        font-weight: 500;
-    }
-    
-    [data-testid="stSidebar"] .stCheckbox label {
-        color: white !important;
-        font-weight: 500;
-    }
-    
-    .hero-section {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 50%, #667eea 100%);
-        padding: 3rem 2rem;
-        border-radius: 20px;
-        text-align: center;
-        margin-bottom: 2rem;
-        color: white;
-        box-shadow: 0 20px 40px rgba(102, 126, 234, 0.3);
-        animation: gradient 15s ease infinite;
-        background-size: 400% 400%;
-    }
-    
-    @keyframes gradient {
-        0% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-        100% { background-position: 0% 50%; }
-    }
-    
-    .hero-title {
-        font-size: 3.5rem;
-        font-weight: 700;
-        margin-bottom: 1rem;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        font-family: 'Inter', sans-serif;
-    }
-    
-    .hero-subtitle {
-        font-size: 1.3rem;
-        font-weight: 400;
-        opacity: 0.95;
-        margin-bottom: 1.5rem;
-    }
-    
-    .hero-badges {
-        display: flex;
-        justify-content: center;
-        gap: 1rem;
-        flex-wrap: wrap;
-        margin-top: 1.5rem;
-    }
-    
-    .badge {
-        background: rgba(255,255,255,0.2);
-        backdrop-filter: blur(10px);
-        padding: 0.5rem 1rem;
-        border-radius: 25px;
-        font-weight: 500;
-        border: 1px solid rgba(255,255,255,0.3);
-    }
-    
-    .status-card {
-        background: linear-gradient(145deg, #f8f9fa, #e9ecef);
-        border-radius: 15px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        border: none;
-        box-shadow: 0 8px 25px rgba(0,0,0,0.1);
-    }
-    
-    .status-success {
-        background: linear-gradient(145deg, #d4edda, #c3e6cb);
-        border-left: 4px solid #28a745;
-    }
-    
-    .status-error {
-        background: linear-gradient(145deg, #f8d7da, #f5c6cb);
-        border-left: 4px solid #dc3545;
-    }
-    
-    .feature-card {
-        background: linear-gradient(145deg, #ffffff, #f8f9fa);
-        border-radius: 20px;
-        padding: 2rem;
-        margin: 1rem 0;
-        border: 1px solid rgba(0,0,0,0.05);
-        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .feature-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, #667eea, #764ba2);
-    }
-    
-    .feature-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 20px 40px rgba(0,0,0,0.15);
-    }
-    
-    .feature-header {
-        font-size: 1.8rem;
-        font-weight: 600;
-        color: #2c3e50;
-        margin-bottom: 1rem;
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-    }
-    
-    .custom-button {
-        background: linear-gradient(135deg, #667eea, #764ba2) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 25px !important;
-        padding: 0.75rem 2rem !important;
-        font-weight: 600 !important;
-        font-size: 1rem !important;
-        transition: all 0.3s ease !important;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4) !important;
-        text-transform: none !important;
-        width: 100% !important;
-    }
-    
-    .custom-button:hover {
-        transform: translateY(-2px) !important;
-        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.6) !important;
-    }
-    
-    .metric-container {
-        display: flex;
-        justify-content: space-around;
-        margin: 2rem 0;
-        gap: 1rem;
-    }
-    
-    .metric-card {
-        background: linear-gradient(145deg, #ffffff, #f8f9fa);
-        border-radius: 15px;
-        padding: 1.5rem;
-        text-align: center;
-        flex: 1;
-        box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-        border-top: 3px solid #667eea;
-    }
-    
-    .metric-number {
-        font-size: 2rem;
-        font-weight: 700;
-        color: #667eea;
-        display: block;
-    }
-    
-    .metric-label {
-        font-size: 0.9rem;
-        color: #6c757d;
-        font-weight: 500;
-    }
-    
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 0.5rem;
-        background: linear-gradient(90deg, #f8f9fa, #e9ecef);
-        padding: 0.5rem;
-        border-radius: 15px;
-        border: none;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        height: 3rem;
-        padding: 0 2rem;
-        background: transparent;
-        border: none;
-        border-radius: 10px;
-        color: #495057;
-        font-weight: 500;
-        transition: all 0.3s ease;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #667eea, #764ba2) !important;
-        color: white !important;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4);
-    }
-    
-    .agent-card {
-        background: linear-gradient(135deg, #667eea, #764ba2);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-        text-align: center;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .agent-card::before {
-        content: '🤖';
-        font-size: 3rem;
-        position: absolute;
-        top: -1rem;
-        right: -1rem;
-        opacity: 0.3;
-    }
-    
-    .footer {
-        background: linear-gradient(135deg, #2c3e50, #34495e);
-        color: white;
-        padding: 2rem;
-        border-radius: 20px;
-        margin-top: 3rem;
-        text-align: center;
-    }
-    
-    .stTextInput > div > div > input {
-        border-radius: 10px;
-        border: 2px solid #e9ecef;
-        transition: all 0.3s ease;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #667eea;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-    }
-    
-    .stTextArea > div > div > textarea {
-        border-radius: 10px;
-        border: 2px solid #e9ecef;
-        transition: all 0.3s ease;
-    }
-    
-    .stTextArea > div > div > textarea:focus {
-        border-color: #667eea;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-    }
-    
-    .stSelectbox > div > div {
-        border-radius: 10px;
-        border: 2px solid #e9ecef;
-    }
-    
-    .language-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(120px, 1fr));
-        gap: 1rem;
-        margin: 1rem 0;
-    }
-    
-    .language-badge {
-        background: linear-gradient(135deg, #667eea, #764ba2);
-        color: white;
-        padding: 1rem;
-        border-radius: 15px;
-        text-align: center;
-        font-weight: 500;
-        font-size: 0.9rem;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-        transition: all 0.3s ease;
-    }
-    
-    .language-badge:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.5);
-    }
-    
-    .loading-container {
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        padding: 2rem;
-    }
-    
-    .pulse-animation {
-        animation: pulse 2s infinite;
-    }
-    
-    @keyframes pulse {
-        0% { transform: scale(1); }
-        50% { transform: scale(1.05); }
-        100% { transform: scale(1); }
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(page_css(), unsafe_allow_html=True)
+
+@st.cache_resource
+def get_agent_client() -> 'AgentClient':
+    """One pooled A2A client and event loop thread per Streamlit process"""
+    # Deferred so the a2a/httpx stack loads on the first agent call, not before the page paints.
+    from language_learning_academy.ui.client import AgentClient
+
+    return AgentClient(AGENT_URL)
 
-@st.cache_data(ttl=300)
 def get_agent_card():
-    """Cache the agent card for 5 minutes"""
+    """Resolved agent card, reused by the shared client for 5 minutes"""
+    client = get_agent_client()
     try:
-        return asyncio.run(_fetch_agent_card())
+        return client.run(client.get_agent_card())
     except Exception as e:
         st.error(f"Failed to fetch agent card: {e}")
         return None
 
-async def _fetch_agent_card():
-    async with httpx.AsyncClient() as httpx_client:
-        resolver = A2ACardResolver(
-            httpx_client=httpx_client,
-            base_url=AGENT_URL,
-        )
-        return await resolver.get_agent_card()
-
-async def send_message_to_agent(message_text: str, use_streaming: bool = False, profile: dict | None = None) -> dict[str, Any]:
+async def send_message_to_agent(message_text: str, profile: dict | None = None) -> dict[str, Any]:
     try:
-        agent_card = get_agent_card()
-        if not agent_card:
-            return {"error": "Could not connect to agent"}
-
-        async with httpx.AsyncClient(timeout=200.0) as httpx_client:
-            client = A2AClient(
-                httpx_client=httpx_client,
-                agent_card=agent_card
-            )
-
-            message_metadata = {}
-            if profile:
-                message_metadata['profile'] = profile
-            
-            message_payload = {
-                'message': {
-                    'role': 'user',
-                    'parts': [
-                        {'kind': 'text', 'text': message_text}
-                    ],
-                    'message_id': uuid4().hex,
-                    'metadata': message_metadata,
-                },
-            }
-
-            if use_streaming:
-                request = SendStreamingMessageRequest(
-                    id=str(uuid4()),
-                    params=MessageSendParams(**message_payload)
-                )
-
-                response_chunks = []
-                async for chunk in client.send_message_streaming(request):
-                    response_chunks.append(chunk.model_dump(mode='json', exclude_none=True))
-
-                return {"streaming_response": response_chunks}
-            request = SendMessageRequest(
-                id=str(uuid4()),
-                params=MessageSendParams(**message_payload)
-            )
-
-            response = await client.send_message(request)
-            return response.model_dump(mode='json', exclude_none=True)
-
+        return await get_agent_client().send_message(message_text, profile=profile)
     except Exception as e:
         return {"error": str(e)}
 
 def run_async(coroutine):
+    return get_agent_client().run(coroutine)
+
+STREAM_RENDER_INTERVAL_SECONDS = 0.05
+
+def stream_agent_response(message_text: str, profile: dict | None = None):
+    """Render a streamed reply progressively, repainting at most every 50ms"""
+    st.markdown("### 🔄 Real-time Response from LLM:")
+    status_placeholder = st.empty()
+    body_placeholder = st.empty()
+    status_placeholder.info("🤖 Waiting for the AI tutor...")
+    from language_learning_academy.ui.client import StreamState
+
+    state = StreamState()
+    last_paint = 0.0
     try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        for event in get_agent_client().iter_stream(message_text, profile):
+            if not state.apply(event):
+                continue
+            now = time.monotonic()
+            if state.done or now - last_paint >= STREAM_RENDER_INTERVAL_SECONDS:
+                if state.status:
+                    status_placeholder.info(f"🤖 {state.status}")
+                if state.text:
+                    body_placeholder.markdown(state.text)
+                last_paint = now
+    except Exception as e:
+        status_placeholder.empty()
+        display_agent_response({"error": str(e)})
+        return
 
-    return loop.run_until_complete(coroutine)
+    status_placeholder.empty()
+    if state.error:
+        display_agent_response({"error": state.error})
+    elif state.text:
+        body_placeholder.markdown(state.text)
+    else:
+        st.warning("⚠️ No content found in response")
+
+def respond_to(prompt: str, spinner_text: str, placeholder):
+    if streaming_enabled:
+        with placeholder.container():
+            stream_agent_response(prompt, profile=st.session_state.profile)
+        return
+
+    with st.spinner(spinner_text):
+        response = run_async(send_message_to_agent(prompt, profile=st.session_state.profile))
+
+    with placeholder.container():
+        display_agent_response(response)
 
 def display_agent_response(response_data):
     if 'error' in response_data:
@@ -737,17 +159,6 @@ export OPENAI_MODEL=gpt-5-2025-08-07
         """)
         return
 
-    if 'streaming_response' in response_data:
-        st.markdown("### 🔄 Real-time Response from LLM:")
-        response_container = st.container()
-        with response_container:
-            for chunk in response_data['streaming_response']:
-                if 'content' in chunk:
-                    content = str(chunk['content']).strip()
-                    if content:
-                        st.markdown(content)
-        return
-
     try:
         content_found = False
         content_text = ""
@@ -861,7 +272,7 @@ elif st.session_state.agent_status == "offline":
     st.markdown(f"""
     <div class="status-card status-error">
         <h3 style="margin: 0; color: #721c24;">❌ {t('system_offline')}</h3>
-        <p style="margin: 0.5rem 0 0 0; color: #721c24;">{t('ensure_running')}</p>
+        <p style="margin: 0.5rem 0 0 0; color: #721c24;">{t('ensure_running').format(agent_url=AGENT_URL)}</p>
     </div>
     """, unsafe_allow_html=True)
 
@@ -986,16 +397,13 @@ with col1:
 with col2:
     if st.button(f"🔄 {t('refresh_btn')}", key="refresh_conn", help=t('refresh_connection')):
         st.session_state.agent_status = "checking"
+        get_agent_client().invalidate_card()
         st.rerun()
 
 if lang_info_clicked:
-    with st.spinner("🤖 Querying AI tutors..."):
-        prompt = build_profile_prompt("What languages do you support and what can you help me learn? Give me a comprehensive overview with your capabilities for each language.")
-        response = run_async(send_message_to_agent(prompt, streaming_enabled, profile=st.session_state.profile))
-
-    with st.container():
-        st.markdown("---")
-        display_agent_response(response)
+    prompt = build_profile_prompt("What languages do you support and what can you help me learn? Give me a comprehensive overview with your capabilities for each language.")
+    st.markdown("---")
+    respond_to(prompt, "🤖 Querying AI tutors...", st.empty())
 
 st.sidebar.markdown("---")
 
@@ -1045,11 +453,7 @@ with tab1:
     if vocab_clicked:
         query = f"Create a comprehensive {selected_language} vocabulary lesson for {vocab_type} words at {selected_level} level. Include: 1) 10-15 essential words with pronunciation, 2) Example sentences with translations, 3) Cultural context and usage tips, 4) Memory techniques or mnemonics, 5) Practice exercises. Make it engaging and educational."
         prompt = build_profile_prompt(query)
-        with st.spinner("🤖 AI tutors crafting your personalized vocabulary lesson..."):
-            response = run_async(send_message_to_agent(prompt, streaming_enabled, profile=st.session_state.profile))
-
-        with response_placeholder.container():
-            display_agent_response(response)
+        respond_to(prompt, "🤖 AI tutors crafting your personalized vocabulary lesson...", response_placeholder)
 
     st.markdown("""
     <div style="background: linear-gradient(135deg, #e3f2fd, #f3e5f5); padding: 1.5rem; border-radius: 15px; margin: 1.5rem 0; border-left: 4px solid #2196f3;">
@@ -1100,11 +504,7 @@ with tab2:
     if grammar_clicked:
         query = f"Create an in-depth {selected_language} grammar lesson on {grammar_topic} for {selected_level} learners. Include: 1) Clear rule explanations with visual patterns, 2) Common exceptions and irregularities, 3) Step-by-step conjugation guides, 4) 10+ practical examples with translations, 5) Common mistakes to avoid, 6) Practice exercises with solutions. Make it comprehensive yet easy to understand."
         prompt = build_profile_prompt(query)
-        with st.spinner("🤖 AI grammar experts preparing your personalized lesson..."):
-            response = run_async(send_message_to_agent(prompt, streaming_enabled, profile=st.session_state.profile))
-
-        with grammar_response_placeholder.container():
-            display_agent_response(response)
+        respond_to(prompt, "🤖 AI grammar experts preparing your personalized lesson...", grammar_response_placeholder)
 
     st.markdown("""
     <div style="background: linear-gradient(135deg, #fff3e0, #fce4ec); padding: 1.5rem; border-radius: 15px; margin: 1.5rem 0; border-left: 4px solid #ff9800;">
@@ -1155,11 +555,7 @@ with tab3:
     if convo_clicked:
         query = f"Create an immersive {scenario} conversation practice session in {selected_language} for {selected_level} level. Include: 1) Realistic dialogue with multiple turns, 2) Essential phrases and vocabulary, 3) Cultural etiquette and social cues, 4) Pronunciation tips for key expressions, 5) Alternative responses for different situations, 6) Common mistakes to avoid. Make it interactive and engaging like a real conversation coach."
         prompt = build_profile_prompt(query)
-        with st.spinner("🤖 AI conversation coaches setting up your practice session..."):
-            response = run_async(send_message_to_agent(prompt, streaming_enabled, profile=st.session_state.profile))
-
-        with convo_response_placeholder.container():
-            display_agent_response(response)
+        respond_to(prompt, "🤖 AI conversation coaches setting up your practice session...", convo_response_placeholder)
 
     st.markdown("""
     <div style="background: linear-gradient(135deg, #e8f5e8, #f0f8ff); padding: 1.5rem; border-radius: 15px; margin: 1.5rem 0; border-left: 4px solid #4caf50;">
@@ -1217,11 +613,7 @@ with tab4:
     if quiz_clicked:
         query = f"Create an engaging {quiz_type} quiz for {selected_language} at {quiz_difficulty} level. Include: 1) 8-10 well-crafted questions with multiple choice options, 2) Detailed explanations for both correct and incorrect answers, 3) Progressive difficulty within the quiz, 4) Cultural context where relevant, 5) Tips for improvement, 6) Score interpretation guide. Make it educational and motivating."
         prompt = build_profile_prompt(query)
-        with st.spinner("🤖 AI assessment specialists generating your personalized quiz..."):
-            response = run_async(send_message_to_agent(prompt, streaming_enabled, profile=st.session_state.profile))
-
-        with quiz_response_placeholder.container():
-            display_agent_response(response)
+        respond_to(prompt, "🤖 AI assessment specialists generating your personalized quiz...", quiz_response_placeholder)
 
     st.markdown("""
     <div style="background: linear-gradient(135deg, #fff9c4, #ffe0b3); padding: 1.5rem; border-radius: 15px; margin: 1.5rem 0; border-left: 4px solid #ffc107;">
@@ -1282,11 +674,7 @@ with tab5:
             target = target_lang.lower()
             query = f"Provide an intelligent translation from {source} to {target} for: '{text_to_translate}'. Include: 1) Primary translation, 2) Alternative expressions, 3) Cultural context and nuances, 4) Formality level analysis, 5) Usage tips, 6) Common variations. Make it comprehensive and culturally aware."
             prompt = build_profile_prompt(query)
-            with st.spinner("🤖 AI linguists analyzing and translating with cultural intelligence..."):
-                response = run_async(send_message_to_agent(prompt, streaming_enabled, profile=st.session_state.profile))
-
-            with translate_response_placeholder.container():
-                display_agent_response(response)
+            respond_to(prompt, "🤖 AI linguists analyzing and translating with cultural intelligence...", translate_response_placeholder)
         else:
             st.warning("⚠️ Please enter text to translate!")
 
@@ -1355,11 +743,7 @@ with tab6:
                 enhanced_query = f"Help a {selected_level} level {selected_language} learner with this question: {custom_query}"
 
             prompt = build_profile_prompt(enhanced_query)
-            with st.spinner("🤖 AI tutors collaborating to craft your personalized response..."):
-                response = run_async(send_message_to_agent(prompt, streaming_enabled, profile=st.session_state.profile))
-
-            with custom_response_placeholder.container():
-                display_agent_response(response)
+            respond_to(prompt, "🤖 AI tutors collaborating to craft your personalized response...", custom_response_placeholder)
         else:
             st.warning("⚠️ Please enter your question or learning request!")
 
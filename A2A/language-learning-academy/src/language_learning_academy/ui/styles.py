@@ -0,0 +1,11 @@
+from functools import cache
+from pathlib import Path
+
+
+STYLESHEET_PATH = Path(__file__).with_name('styles.css')
+
+
+@cache
+def page_css() -> str:
+    """The app stylesheet as a ``<style>`` block, read from disk once per process."""
+    return f'<style>\n{STYLESHEET_PATH.read_text(encoding="utf-8")}</style>'
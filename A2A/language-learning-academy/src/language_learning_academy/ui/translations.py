@@ -0,0 +1,266 @@
+TRANSLATIONS = {
+    "en": {
+        "profile": "Profile",
+        "personalization": "Personalization",
+        "native_language": "Native Language",
+        "ui_language": "UI Language",
+        "learning_goal": "Learning Goal",
+        "tutor_persona": "Tutor Persona",
+        "correction_strictness": "Correction Strictness",
+        "performance_settings": "Performance Settings",
+        "learning_preferences": "Learning Preferences",
+        "target_language": "Target Language",
+        "proficiency_level": "Proficiency Level",
+        "title": "Polyglot Academy",
+        "subtitle": "Multi-Agent Language Learning Platform",
+        "tagline": "Master any language with AI-powered tutors, real-time feedback, and personalized learning paths",
+        "ai_tutors": "AI Tutors",
+        "personalized": "Personalized",
+        "real_time": "Real-time",
+        "languages_count": "8 Languages",
+        "powered_by": "gpt-5-2025-08-07 Powered",
+        "supported_languages": "Supported Languages",
+        "skill_levels": "Skill Levels",
+        "learning_modes": "Learning Modes",
+        "ai_possibilities": "AI Possibilities",
+        "system_online": "Multi-Agent System Online",
+        "system_offline": "Multi-Agent System Offline",
+        "all_tutors_ready": "All AI tutors are ready to assist with your language learning journey!",
+        "ensure_running": "Please ensure the agent is running on {agent_url} with proper LLM API keys configured",
+        "learning_hub": "Learning Hub",
+        "customize_experience": "Customize your learning experience",
+        "enable_streaming": "Enable Real-time Streaming",
+        "streaming_help": "Get real-time responses from the LLM for immediate feedback",
+        "choose_language": "Choose the language you want to learn",
+        "select_skill": "Select your current skill level",
+        "ai_engine_status": "AI Engine Status",
+        "model_source": "Model Source",
+        "ai_model": "AI Model",
+        "quick_actions": "Quick Actions",
+        "languages_btn": "Languages",
+        "refresh_btn": "Refresh",
+        "show_languages": "Show available languages",
+        "refresh_connection": "Refresh connection",
+        "currently_learning": "Currently learning",
+        "at_level": "at",
+        "level": "level",
+        "vocabulary": "Vocabulary",
+        "grammar": "Grammar",
+        "conversation": "Conversation",
+        "quiz": "Quiz",
+        "translation": "Translation",
+        "custom_query": "Custom Query",
+        "vocab_academy": "AI-Powered Vocabulary Academy",
+        "vocab_desc": "Expand your vocabulary with our intelligent tutoring system. Get personalized lessons with pronunciation guides, cultural context, and real-world usage examples.",
+        "select_category": "Select vocabulary category:",
+        "generate_lesson": "Generate Vocabulary Lesson",
+        "create_lesson": "Create a personalized lesson",
+        "pro_tips": "Pro Tips for Vocabulary Learning",
+        "grammar_center": "AI Grammar Mastery Center",
+        "grammar_desc": "Master grammar through intelligent explanations, pattern recognition, and practical exercises. Our AI tutors break down complex rules into digestible lessons.",
+        "choose_focus": "Choose grammar focus:",
+        "start_lesson": "Start Grammar Lesson",
+        "convo_academy": "AI Conversation Academy",
+        "convo_desc": "Practice real-world conversations with our intelligent coaching system. Build confidence through immersive scenarios with cultural insights and pronunciation guidance.",
+        "select_scenario": "Select conversation scenario:",
+        "start_practice": "Start Conversation Practice",
+        "quiz_generator": "AI Quiz Generator",
+        "quiz_desc": "Test and reinforce your knowledge with intelligent, adaptive quizzes. Our AI creates personalized assessments with detailed explanations to accelerate your learning.",
+        "quiz_category": "Quiz category:",
+        "challenge_level": "Challenge level:",
+        "generate_quiz": "Generate Smart Quiz",
+        "translation_studio": "AI Translation Studio",
+        "translation_desc": "Experience intelligent translation that goes beyond words. Our AI provides cultural context, alternative expressions, and nuanced interpretations for professional-quality translations.",
+        "from_language": "From language:",
+        "to_language": "To language:",
+        "enter_text": "Enter text to translate:",
+        "smart_translate": "Smart Translate",
+        "personal_tutor": "Personal AI Language Tutor",
+        "tutor_desc": "Your dedicated AI language consultant is here to answer any question, solve learning challenges, and provide personalized guidance for your journey.",
+        "what_to_learn": "What would you like to learn or explore?",
+        "expert_mode": "Expert Mode",
+        "include_examples": "Include Examples",
+        "consult_tutor": "Consult AI Tutor",
+        "technology": "AI Technology",
+        "features": "Features",
+        "built_with": "Built with ❤️ using Streamlit & A2A Protocol • Advanced AI for Language Excellence"
+    },
+    "hi": {
+        "profile": "प्रोफ़ाइल",
+        "personalization": "वैयक्तिकरण",
+        "native_language": "मातृभाषा",
+        "ui_language": "UI भाषा",
+        "learning_goal": "सीखने का लक्ष्य",
+        "tutor_persona": "शिक्षक व्यक्तित्व",
+        "correction_strictness": "सुधार सख्ती",
+        "performance_settings": "प्रदर्शन सेटिंग्स",
+        "learning_preferences": "सीखने की प्राथमिकताएं",
+        "target_language": "लक्ष्य भाषा",
+        "proficiency_level": "दक्षता स्तर",
+        "title": "पॉलीग्लॉट अकादमी",
+        "subtitle": "मल्टी-एजेंट भाषा सीखने का मंच",
+        "tagline": "AI-संचालित ट्यूटर्स, रीयल-टाइम फीडबैक और व्यक्तिगत सीखने के मार्गों के साथ किसी भी भाषा में महारत हासिल करें",
+        "ai_tutors": "AI ट्यूटर्स",
+        "personalized": "व्यक्तिगत",
+        "real_time": "रीयल-टाइम",
+        "languages_count": "8 भाषाएं",
+        "powered_by": "gpt-5-2025-08-07 संचालित",
+        "supported_languages": "समर्थित भाषाएं",
+        "skill_levels": "कौशल स्तर",
+        "learning_modes": "सीखने के मोड",
+        "ai_possibilities": "AI संभावनाएं",
+        "system_online": "मल्टी-एजेंट सिस्टम ऑनलाइन",
+        "system_offline": "मल्टी-एजेंट सिस्टम ऑफलाइन",
+        "all_tutors_ready": "सभी AI ट्यूटर आपकी भाषा सीखने की यात्रा में सहायता के लिए तैयार हैं!",
+        "ensure_running": "कृपया सुनिश्चित करें कि एजेंट {agent_url} पर उचित LLM API कुंजियों के साथ चल रहा है",
+        "learning_hub": "लर्निंग हब",
+        "customize_experience": "अपना सीखने का अनुभव अनुकूलित करें",
+        "enable_streaming": "रीयल-टाइम स्ट्रीमिंग सक्षम करें",
+        "streaming_help": "तत्काल फीडबैक के लिए LLM से रीयल-टाइम प्रतिक्रियाएं प्राप्त करें",
+        "choose_language": "वह भाषा चुनें जो आप सीखना चाहते हैं",
+        "select_skill": "अपना वर्तमान कौशल स्तर चुनें",
+        "ai_engine_status": "AI इंजन स्थिति",
+        "model_source": "मॉडल स्रोत",
+        "ai_model": "AI मॉडल",
+        "quick_actions": "त्वरित कार्रवाइयां",
+        "languages_btn": "भाषाएं",
+        "refresh_btn": "रीफ्रेश",
+        "show_languages": "उपलब्ध भाषाएं दिखाएं",
+        "refresh_connection": "कनेक्शन रीफ्रेश करें",
+        "currently_learning": "वर्तमान में सीख रहे हैं",
+        "at_level": "स्तर पर",
+        "level": "स्तर",
+        "vocabulary": "शब्दावली",
+        "grammar": "व्याकरण",
+        "conversation": "बातचीत",
+        "quiz": "प्रश्नोत्तरी",
+        "translation": "अनुवाद",
+        "custom_query": "कस्टम प्रश्न",
+        "vocab_academy": "AI-संचालित शब्दावली अकादमी",
+        "vocab_desc": "हमारी बुद्धिमान ट्यूटरिंग प्रणाली के साथ अपनी शब्दावली का विस्तार करें। उच्चारण गाइड, सांस्कृतिक संदर्भ और वास्तविक उपयोग उदाहरणों के साथ व्यक्तिगत पाठ प्राप्त करें।",
+        "select_category": "शब्दावली श्रेणी चुनें:",
+        "generate_lesson": "शब्दावली पाठ जेनरेट करें",
+        "create_lesson": "व्यक्तिगत पाठ बनाएं",
+        "pro_tips": "शब्दावली सीखने के लिए प्रो टिप्स",
+        "grammar_center": "AI व्याकरण महारत केंद्र",
+        "grammar_desc": "बुद्धिमान स्पष्टीकरण, पैटर्न पहचान और व्यावहारिक अभ्यासों के माध्यम से व्याकरण में महारत हासिल करें। हमारे AI ट्यूटर जटिल नियमों को पचने योग्य पाठों में तोड़ देते हैं।",
+        "choose_focus": "व्याकरण फोकस चुनें:",
+        "start_lesson": "व्याकरण पाठ शुरू करें",
+        "convo_academy": "AI बातचीत अकादमी",
+        "convo_desc": "हमारी बुद्धिमान कोचिंग प्रणाली के साथ वास्तविक दुनिया की बातचीत का अभ्यास करें। सांस्कृतिक अंतर्दृष्टि और उच्चारण मार्गदर्शन के साथ immersive परिदृश्यों के माध्यम से आत्मविश्वास बनाएं।",
+        "select_scenario": "बातचीत परिदृश्य चुनें:",
+        "start_practice": "बातचीत अभ्यास शुरू करें",
+        "quiz_generator": "AI प्रश्नोत्तरी जेनरेटर",
+        "quiz_desc": "बुद्धिमान, अनुकूली प्रश्नोत्तरी के साथ अपने ज्ञान का परीक्षण और मजबूत करें। हमारा AI आपके सीखने को तेज करने के लिए विस्तृत स्पष्टीकरण के साथ व्यक्तिगत मूल्यांकन बनाता है।",
+        "quiz_category": "प्रश्नोत्तरी श्रेणी:",
+        "challenge_level": "चुनौती स्तर:",
+        "generate_quiz": "स्मार्ट प्रश्नोत्तरी जेनरेट करें",
+        "translation_studio": "AI अनुवाद स्टूडियो",
+        "translation_desc": "बुद्धिमान अनुवाद का अनुभव करें जो शब्दों से परे जाता है। हमारा AI पेशेवर-गुणवत्ता अनुवादों के लिए सांस्कृतिक संदर्भ, वैकल्पिक अभिव्यक्तियां और सूक्ष्म व्याख्याएं प्रदान करता है।",
+        "from_language": "किस भाषा से:",
+        "to_language": "किस भाषा में:",
+        "enter_text": "अनुवाद करने के लिए टेक्स्ट दर्ज करें:",
+        "smart_translate": "स्मार्ट अनुवाद",
+        "personal_tutor": "व्यक्तिगत AI भाषा ट्यूटर",
+        "tutor_desc": "आपका समर्पित AI भाषा सलाहकार किसी भी प्रश्न का उत्तर देने, सीखने की चुनौतियों को हल करने और आपकी यात्रा के लिए व्यक्तिगत मार्गदर्शन प्रदान करने के लिए यहां है।",
+        "what_to_learn": "आप क्या सीखना या खोजना चाहेंगे?",
+        "expert_mode": "विशेषज्ञ मोड",
+        "include_examples": "उदाहरण शामिल करें",
+        "consult_tutor": "AI ट्यूटर से परामर्श करें",
+        "technology": "AI प्रौद्योगिकी",
+        "features": "विशेषताएं",
+        "built_with": "❤️ के साथ Streamlit और A2A प्रोटोकॉल का उपयोग करके बनाया गया • भाषा उत्कृष्टता के लिए उन्नत AI"
+    },
+    "fr": {
+        "profile": "Profil",
+        "personalization": "Personnalisation",
+        "native_language": "Langue maternelle",
+        "ui_language": "Langue de l'interface",
+        "learning_goal": "Objectif d'apprentissage",
+        "tutor_persona": "Personnalité du tuteur",
+        "correction_strictness": "Niveau de correction",
+        "performance_settings": "Paramètres de performance",
+        "learning_preferences": "Préférences d'apprentissage",
+        "target_language": "Langue cible",
+        "proficiency_level": "Niveau de compétence",
+        "title": "Académie Polyglotte",
+        "subtitle": "Plateforme d'apprentissage des langues multi-agents",
+        "tagline": "Maîtrisez n'importe quelle langue avec des tuteurs alimentés par l'IA, des retours en temps réel et des parcours d'apprentissage personnalisés",
+        "ai_tutors": "Tuteurs IA",
+        "personalized": "Personnalisé",
+        "real_time": "Temps réel",
+        "languages_count": "8 Langues",
+        "powered_by": "Alimenté par gpt-5-2025-08-07",
+        "supported_languages": "Langues prises en charge",
+        "skill_levels": "Niveaux de compétence",
+        "learning_modes": "Modes d'apprentissage",
+        "ai_possibilities": "Possibilités IA",
+        "system_online": "Système multi-agents en ligne",
+        "system_offline": "Système multi-agents hors ligne",
+        "all_tutors_ready": "Tous les tuteurs IA sont prêts à vous aider dans votre parcours d'apprentissage des langues!",
+        "ensure_running": "Veuillez vous assurer que l'agent fonctionne sur {agent_url} avec les clés API LLM appropriées configurées",
+        "learning_hub": "Centre d'apprentissage",
+        "customize_experience": "Personnalisez votre expérience d'apprentissage",
+        "enable_streaming": "Activer le streaming en temps réel",
+        "streaming_help": "Obtenez des réponses en temps réel du LLM pour un retour immédiat",
+        "choose_language": "Choisissez la langue que vous voulez apprendre",
+        "select_skill": "Sélectionnez votre niveau de compétence actuel",
+        "ai_engine_status": "État du moteur IA",
+        "model_source": "Source du modèle",
+        "ai_model": "Modèle IA",
+        "quick_actions": "Actions rapides",
+        "languages_btn": "Langues",
+        "refresh_btn": "Actualiser",
+        "show_languages": "Afficher les langues disponibles",
+        "refresh_connection": "Actualiser la connexion",
+        "currently_learning": "Apprend actuellement",
+        "at_level": "au niveau",
+        "level": "niveau",
+        "vocabulary": "Vocabulaire",
+        "grammar": "Grammaire",
+        "conversation": "Conversation",
+        "quiz": "Quiz",
+        "translation": "Traduction",
+        "custom_query": "Requête personnalisée",
+        "vocab_academy": "Académie de vocabulaire alimentée par l'IA",
+        "vocab_desc": "Élargissez votre vocabulaire avec notre système de tutorat intelligent. Obtenez des leçons personnalisées avec des guides de prononciation, un contexte culturel et des exemples d'utilisation réels.",
+        "select_category": "Sélectionnez la catégorie de vocabulaire:",
+        "generate_lesson": "Générer une leçon de vocabulaire",
+        "create_lesson": "Créer une leçon personnalisée",
+        "pro_tips": "Conseils pro pour l'apprentissage du vocabulaire",
+        "grammar_center": "Centre de maîtrise de la grammaire IA",
+        "grammar_desc": "Maîtrisez la grammaire grâce à des explications intelligentes, à la reconnaissance de modèles et à des exercices pratiques. Nos tuteurs IA décomposent les règles complexes en leçons digestes.",
+        "choose_focus": "Choisissez le focus grammatical:",
+        "start_lesson": "Commencer la leçon de grammaire",
+        "convo_academy": "Académie de conversation IA",
+        "convo_desc": "Pratiquez des conversations du monde réel avec notre système de coaching intelligent. Développez votre confiance grâce à des scénarios immersifs avec des informations culturelles et des conseils de prononciation.",
+        "select_scenario": "Sélectionnez le scénario de conversation:",
+        "start_practice": "Commencer la pratique de conversation",
+        "quiz_generator": "Générateur de quiz IA",
+        "quiz_desc": "Testez et renforcez vos connaissances avec des quiz intelligents et adaptatifs. Notre IA crée des évaluations personnalisées avec des explications détaillées pour accélérer votre apprentissage.",
+        "quiz_category": "Catégorie de quiz:",
+        "challenge_level": "Niveau de défi:",
+        "generate_quiz": "Générer un quiz intelligent",
+        "translation_studio": "Studio de traduction IA",
+        "translation_desc": "Découvrez une traduction intelligente qui va au-delà des mots. Notre IA fournit un contexte culturel, des expressions alternatives et des interprétations nuancées pour des traductions de qualité professionnelle.",
+        "from_language": "De la langue:",
+        "to_language": "Vers la langue:",
+        "enter_text": "Entrez le texte à traduire:",
+        "smart_translate": "Traduction intelligente",
+        "personal_tutor": "Tuteur personnel de langue IA",
+        "tutor_desc": "Votre consultant linguistique IA dédié est là pour répondre à toute question, résoudre les défis d'apprentissage et fournir des conseils personnalisés pour votre parcours.",
+        "what_to_learn": "Qu'aimeriez-vous apprendre ou explorer?",
+        "expert_mode": "Mode expert",
+        "include_examples": "Inclure des exemples",
+        "consult_tutor": "Consulter le tuteur IA",
+        "technology": "Technologie IA",
+        "features": "Fonctionnalités",
+        "built_with": "Construit avec ❤️ en utilisant Streamlit et le protocole A2A • IA avancée pour l'excellence linguistique"
+    }
+}
+
+UI_LANGUAGE_CODES = {'English': 'en', 'Hindi': 'hi', 'French': 'fr'}
+
+
+def translations_for(ui_language: str) -> dict[str, str]:
+    return TRANSLATIONS.get(UI_LANGUAGE_CODES.get(ui_language, 'en'), TRANSLATIONS['en'])
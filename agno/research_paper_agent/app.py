@@ -9,7 +9,8 @@ from agent import (
     analyze_paper,
 )
 from utils import (
-    extract_text_from_pdf,
+    MAX_CONTENT_LENGTH,
+    extract_text_cached,
     extract_arxiv_id,
     fetch_arxiv_metadata,
     fetch_arxiv_pdf_content,
@@ -246,7 +247,7 @@ def handle_pdf_upload(uploaded_file, agent_team) -> tuple:
     logger.info("handling_pdf_upload", filename=uploaded_file.name)
     
     with st.spinner("📄 Extracting text from PDF..."):
-        content = extract_text_from_pdf(uploaded_file)
+        content = extract_text_cached(uploaded_file.getvalue(), max_chars=MAX_CONTENT_LENGTH)
         
         if not content:
             st.error("Failed to extract text from PDF")
@@ -285,7 +286,7 @@ def handle_arxiv_url(paper_url: str) -> tuple:
             
         st.success(f"✅ Found: {metadata.title}")
         
-        content = fetch_arxiv_pdf_content(arxiv_id)
+        content = fetch_arxiv_pdf_content(arxiv_id, max_chars=MAX_CONTENT_LENGTH)
         
         if not content:
             st.error("Could not fetch PDF content")
@@ -0,0 +1,91 @@
+"""Incremental parser for arXiv API Atom feeds"""
+
+from typing import Iterable, Iterator, Optional, Union
+from xml.etree.ElementTree import Element, XMLPullParser
+
+import structlog
+
+from data_models import PaperMetadata
+
+# Initialize logger
+logger = structlog.get_logger()
+
+# Constants
+ATOM = "{http://www.w3.org/2005/Atom}"
+ARXIV = "{http://arxiv.org/schemas/atom}"
+ABS_URL_MARKER = "/abs/"
+FEED_CHUNK_SIZE = 64 * 1024
+
+
+def _text(element: Element, tag: str) -> str:
+    # Titles and abstracts are hard-wrapped in the feed; collapse the wrapping
+    return " ".join((element.findtext(tag) or "").split())
+
+
+def _entry_metadata(entry: Element) -> Optional[PaperMetadata]:
+    entry_url = (entry.findtext(f"{ATOM}id") or "").strip()
+    if ABS_URL_MARKER not in entry_url:
+        # arXiv reports malformed ids as an entry under /api/errors
+        logger.warning("arxiv_feed_error_entry", id=entry_url, summary=_text(entry, f"{ATOM}summary"))
+        return None
+
+    primary = entry.find(f"{ARXIV}primary_category")
+    categories = [primary.get("term")] if primary is not None else []
+    categories += [
+        category.get("term")
+        for category in entry.iterfind(f"{ATOM}category")
+        if category.get("term") not in categories
+    ]
+    published = (entry.findtext(f"{ATOM}published") or "").strip()
+
+    return PaperMetadata(
+        title=_text(entry, f"{ATOM}title") or "Unknown Title",
+        authors=[_text(author, f"{ATOM}name") for author in entry.iterfind(f"{ATOM}author")],
+        abstract=_text(entry, f"{ATOM}summary"),
+        publication_date=published[:10] or None,
+        venue="arXiv",
+        doi=(entry.findtext(f"{ARXIV}doi") or "").strip() or None,
+        arxiv_id=entry_url.split(ABS_URL_MARKER, 1)[1],
+        categories=categories,
+    )
+
+
+def parse_arxiv_feed(source: Union[str, bytes, Iterable[bytes]]) -> Iterator[PaperMetadata]:
+    """
+    Yield PaperMetadata for each entry of an arXiv Atom feed as it is parsed
+
+    Feed-level elements such as the query ``<title>`` are ignored. Each entry
+    is detached from the tree once converted, so memory stays bounded by one
+    entry plus the parser's buffer when fed from a streamed response.
+
+    Args:
+        source: Feed text, or an iterable of byte chunks such as
+            ``response.iter_content()``
+
+    Yields:
+        PaperMetadata for every paper entry, in feed order
+    """
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    if isinstance(source, bytes):
+        # Feeding the whole body at once would build the full tree before any event is read
+        body = source
+        source = (body[offset:offset + FEED_CHUNK_SIZE] for offset in range(0, len(body), FEED_CHUNK_SIZE))
+
+    parser = XMLPullParser(events=("start", "end"))
+    root = None
+    for chunk in source:
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == "start":
+                if root is None:
+                    root = element
+                continue
+            if element.tag != f"{ATOM}entry":
+                continue
+            metadata = _entry_metadata(element)
+            if root is not None:
+                root.remove(element)
+            if metadata is not None:
+                yield metadata
+    parser.close()
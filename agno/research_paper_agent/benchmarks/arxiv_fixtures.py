@@ -0,0 +1,81 @@
+"""Synthetic arXiv Atom feeds shaped like real export.arxiv.org responses"""
+
+import re
+from xml.sax.saxutils import escape
+
+FEED_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <link href="http://arxiv.org/api/query?id_list={query}" rel="self" type="application/atom+xml"/>
+  <title type="html">ArXiv Query: search_query=&amp;id_list={query}&amp;start=0&amp;max_results={count}</title>
+  <id>http://arxiv.org/api/feed-id</id>
+  <updated>2024-01-01T00:00:00-05:00</updated>
+  <opensearch:totalResults xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">{count}</opensearch:totalResults>
+  <opensearch:startIndex xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">0</opensearch:startIndex>
+  <opensearch:itemsPerPage xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">{count}</opensearch:itemsPerPage>
+"""
+
+ENTRY = """  <entry>
+    <id>http://arxiv.org/abs/{arxiv_id}</id>
+    <updated>2023-02-01T18:00:00Z</updated>
+    <published>2023-01-{day:02d}T18:00:00Z</published>
+    <title>{title}</title>
+    <summary>  {summary}
+</summary>
+{authors}    <arxiv:doi xmlns:arxiv="http://arxiv.org/schemas/atom">10.1000/paper.{index}</arxiv:doi>
+    <link title="doi" href="http://dx.doi.org/10.1000/paper.{index}" rel="related"/>
+    <arxiv:comment xmlns:arxiv="http://arxiv.org/schemas/atom">12 pages, 4 figures</arxiv:comment>
+    <arxiv:journal_ref xmlns:arxiv="http://arxiv.org/schemas/atom">Journal of Examples {index} (2023)</arxiv:journal_ref>
+    <link href="http://arxiv.org/abs/{arxiv_id}" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/{arxiv_id}" rel="related" type="application/pdf"/>
+    <arxiv:primary_category xmlns:arxiv="http://arxiv.org/schemas/atom" term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.CL" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="stat.ML" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+"""
+
+AUTHOR = """    <author>
+      <name>{name}</name>
+      <arxiv:affiliation xmlns:arxiv="http://arxiv.org/schemas/atom">University {index}</arxiv:affiliation>
+    </author>
+"""
+
+SUMMARY = (
+    "We study attention & memory in large language models, showing that <b>sparse</b> routing "
+    "reduces compute while preserving accuracy across benchmarks. "
+)
+
+
+def synthetic_ids(count: int, version: bool = True) -> list:
+    suffix = "v1" if version else ""
+    return [f"2301.{index:05d}{suffix}" for index in range(1, count + 1)]
+
+
+def make_entry(arxiv_id: str, index: int, authors: int = 4) -> str:
+    author_xml = "".join(AUTHOR.format(name=f"Author {index}-{n} Example", index=n) for n in range(authors))
+    return ENTRY.format(
+        arxiv_id=arxiv_id,
+        index=index,
+        day=index % 28 + 1,
+        title=escape(f"Paper {index}: Attention & Memory\n      in Language Models"),
+        summary=escape(SUMMARY * 6),
+        authors=author_xml,
+    )
+
+
+def _with_version(arxiv_id: str) -> str:
+    # arXiv always answers with the versioned id, even for unversioned lookups
+    return arxiv_id if re.search(r"v\d+$", arxiv_id) else f"{arxiv_id}v1"
+
+
+def entry_index(arxiv_id: str) -> int:
+    """Number embedded in a synthetic id, so each id always gets the same entry content"""
+    return int(re.sub(r"v\d+$", "", arxiv_id).rsplit(".", 1)[-1])
+
+
+def make_feed(arxiv_ids: list, authors: int = 4) -> str:
+    """Atom feed with one entry per id, in the given order"""
+    parts = [FEED_HEADER.format(query=escape(",".join(arxiv_ids[:3])), count=len(arxiv_ids))]
+    parts.extend(make_entry(_with_version(arxiv_id), entry_index(arxiv_id), authors) for arxiv_id in arxiv_ids)
+    parts.append("</feed>\n")
+    return "".join(parts)
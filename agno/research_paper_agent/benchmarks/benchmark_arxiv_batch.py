@@ -0,0 +1,105 @@
+"""Compare per-id and batched arXiv metadata fetches against a local stand-in
+
+Counts outbound requests and wall time for one-request-per-id lookups, the
+id_list batch API, and concurrent single-id lookups coalesced by the
+MetadataBatcher, and checks that results come back in input order.
+
+Usage:
+    python benchmarks/benchmark_arxiv_batch.py --ids 500 --latency 0.05
+"""
+
+import argparse
+import http.server
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+# Measure the request pattern itself, not the on-disk cache or arXiv's politeness spacing
+os.environ["PAPER_CACHE_ENABLED"] = "false"
+os.environ["ARXIV_MIN_REQUEST_INTERVAL"] = "0"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import structlog
+
+import utils
+from arxiv_fixtures import entry_index, make_feed, synthetic_ids
+
+ARXIV_POLITENESS_SECONDS = 3.0
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.0
+    requests = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        cls = type(self)
+        cls.requests += 1
+        time.sleep(cls.latency)
+        ids = parse_qs(urlsplit(self.path).query).get("id_list", [""])[0].split(",")
+        body = make_feed([arxiv_id for arxiv_id in ids if arxiv_id]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/atom+xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def in_order(ids: list, results: list) -> bool:
+    return all(
+        metadata is not None and metadata.arxiv_id == arxiv_id and f"Paper {entry_index(arxiv_id)}:" in metadata.title
+        for arxiv_id, metadata in zip(ids, results)
+    ) and len(ids) == len(results)
+
+
+def measure(name: str, ids: list, run) -> None:
+    StandInHandler.requests = 0
+    started = time.perf_counter()
+    results = run(ids)
+    elapsed = time.perf_counter() - started
+    requests = StandInHandler.requests
+    print(
+        f"{name:<22} requests={requests:<5} {elapsed:7.2f}s "
+        f"(>= {requests * ARXIV_POLITENESS_SECONDS:6.0f}s at arXiv's 3s spacing) in_order={in_order(ids, results)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ids", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05, help="stand-in seconds per request")
+    parser.add_argument("--threads", type=int, default=32, help="callers for the coalesced single-id lookups")
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    StandInHandler.latency = args.latency
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    utils.ARXIV_API_URL = f"http://127.0.0.1:{server.server_address[1]}/api/query"
+
+    # Mix versioned and unversioned ids, with a few repeats
+    ids = synthetic_ids(args.ids, version=False)
+    ids = [arxiv_id + "v1" if n % 3 == 0 else arxiv_id for n, arxiv_id in enumerate(ids)]
+    ids += ids[:10]
+
+    per_id = utils.MetadataBatcher(window_seconds=0)
+    measure("one request per id", ids, lambda ids: [per_id.lookup(arxiv_id) for arxiv_id in ids])
+    measure("batch id_list", ids, utils.fetch_arxiv_metadata_batch)
+
+    coalescing = utils.MetadataBatcher()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        measure("coalesced concurrent", ids, lambda ids: list(pool.map(coalescing.lookup, ids)))
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Exercise ArxivClient against a local HTTP stand-in for arXiv
+
+Shows connection reuse versus bare ``requests.get``, retries on 503/429,
+the Retry-After ceiling, per-host politeness spacing and the streaming PDF size guard. Exits non-zero
+if any check fails.
+
+Usage:
+    python benchmarks/benchmark_arxiv_client.py --requests 50
+"""
+
+import argparse
+import http.server
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+import structlog
+
+from utils import ArxivClient, PdfTooLargeError
+
+FEED = b"<feed xmlns='http://www.w3.org/2005/Atom'><entry><title>Paper</title></entry></feed>"
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    """Keep-alive server whose /flaky path fails a set number of times before succeeding"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without this, Nagle plus delayed ACKs add ~40ms per keep-alive reply
+    disable_nagle_algorithm = True
+    connections = 0
+    failures_left = 0
+    failure_status = 503
+    retry_after = None
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b"", headers: dict = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        cls = type(self)
+        if self.path.startswith("/flaky") and cls.failures_left > 0:
+            cls.failures_left -= 1
+            headers = {"Retry-After": cls.retry_after} if cls.retry_after else {}
+            self._send(cls.failure_status, b"busy", headers)
+        elif self.path.startswith("/big.pdf"):
+            # Chunked with no Content-Length, so only the streaming guard can stop it
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            block = b"%PDF" + b"0" * (256 * 1024 - 4)
+            try:
+                for _ in range(40):
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(block), block))
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            self.close_connection = True
+        else:
+            self._send(200, FEED, {"Content-Type": "application/atom+xml"})
+
+
+def reset(failures: int = 0, status: int = 503, retry_after: str = None) -> None:
+    StandInHandler.connections = 0
+    StandInHandler.failures_left = failures
+    StandInHandler.failure_status = status
+    StandInHandler.retry_after = retry_after
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    failures = []
+
+    def check(name: str, ok: bool, detail: str) -> None:
+        print(f"{'ok  ' if ok else 'FAIL'} {name}: {detail}")
+        if not ok:
+            failures.append(name)
+
+    reset()
+    started = time.perf_counter()
+    for _ in range(args.requests):
+        requests.get(f"{base_url}/api/query", timeout=10)
+    bare_ms = (time.perf_counter() - started) * 1000 / args.requests
+    bare_connections = StandInHandler.connections
+
+    reset()
+    client = ArxivClient(min_interval=0, backoff_seconds=0.05)
+    started = time.perf_counter()
+    for _ in range(args.requests):
+        client.get(f"{base_url}/api/query", timeout=10)
+    pooled_ms = (time.perf_counter() - started) * 1000 / args.requests
+    check(
+        "connection reuse",
+        StandInHandler.connections == 1,
+        f"{args.requests} requests: bare requests.get opened {bare_connections} connections "
+        f"({bare_ms:.2f}ms/request), "
+        f"pooled client opened {StandInHandler.connections} ({pooled_ms:.2f}ms/request)",
+    )
+
+    reset(failures=2)
+    response = client.get(f"{base_url}/flaky", timeout=10)
+    check(
+        "retry on 503",
+        response.status_code == 200 and client.retries == 2,
+        f"status {response.status_code} after {client.retries} retries",
+    )
+
+    reset(failures=1, status=429, retry_after="1")
+    retries_before = client.retries
+    started = time.perf_counter()
+    response = client.get(f"{base_url}/flaky", timeout=10)
+    waited = time.perf_counter() - started
+    check(
+        "Retry-After on 429",
+        response.status_code == 200 and client.retries == retries_before + 1 and waited >= 1.0,
+        f"status {response.status_code} after waiting {waited:.2f}s",
+    )
+
+    reset(failures=1, status=429, retry_after="3600")
+    retries_before = client.retries
+    started = time.perf_counter()
+    response = client.get(f"{base_url}/flaky", timeout=10)
+    waited = time.perf_counter() - started
+    check(
+        "Retry-After ceiling",
+        response.status_code == 429 and client.retries == retries_before and waited < 1.0,
+        f"Retry-After: 3600 over the {client.max_retry_delay:.0f}s ceiling returned status "
+        f"{response.status_code} after {waited:.2f}s without retrying",
+    )
+
+    reset(failures=10)
+    response = client.get(f"{base_url}/flaky", timeout=10)
+    check(
+        "retries are bounded",
+        response.status_code == 503,
+        f"gave up with status {response.status_code} after {client.max_retries} retries",
+    )
+
+    reset()
+    polite = ArxivClient(min_interval=0.2)
+    started = time.perf_counter()
+    for _ in range(5):
+        polite.get(f"{base_url}/api/query", timeout=10)
+    elapsed = time.perf_counter() - started
+    check("politeness spacing", elapsed >= 0.8, f"5 requests with a 0.2s interval took {elapsed:.2f}s")
+
+    reset()
+    guarded = ArxivClient(min_interval=0, max_pdf_bytes=1024 * 1024)
+    started = time.perf_counter()
+    try:
+        guarded.download_pdf(f"{base_url}/big.pdf")
+        check("PDF size guard", False, "10MB download was not stopped")
+    except PdfTooLargeError as e:
+        check("PDF size guard", True, f"{e} after {(time.perf_counter() - started) * 1000:.0f}ms")
+
+    server.shutdown()
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
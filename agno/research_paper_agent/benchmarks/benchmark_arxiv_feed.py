@@ -0,0 +1,137 @@
+"""Benchmark arXiv Atom feed parsing on a synthetic feed
+
+Compares the previous regex extraction with the incremental pull parser, fed
+either the whole response or 64KB chunks as ``iter_content`` would deliver
+them. Peak memory is traced allocation during parsing, with entries counted
+and discarded as a streaming consumer would. Exits non-zero if the parser
+gets any field wrong.
+
+Usage:
+    python benchmarks/benchmark_arxiv_feed.py --entries 2000
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+import tracemalloc
+from xml.sax.saxutils import unescape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import structlog
+
+from arxiv_feed import parse_arxiv_feed
+from arxiv_fixtures import entry_index, make_feed, synthetic_ids
+from data_models import PaperMetadata
+
+CHUNK_SIZE = 64 * 1024
+
+
+def regex_entries(feed: bytes):
+    """The previous implementation: decode the whole body, then regex each <entry>"""
+    content = feed.decode("utf-8")
+    for entry in re.findall(r"<entry>(.*?)</entry>", content, re.DOTALL):
+        id_match = re.search(r"<id>(.*?)</id>", entry)
+        if not id_match or "/abs/" not in id_match.group(1):
+            continue
+        entry_id = id_match.group(1).strip().split("/abs/")[-1]
+        title_match = re.search(r"<title>(.*?)</title>", entry, re.DOTALL)
+        abstract_match = re.search(r"<summary>(.*?)</summary>", entry, re.DOTALL)
+        published_match = re.search(r"<published>(.*?)</published>", entry)
+        yield PaperMetadata(
+            title=title_match.group(1).strip() if title_match else "Unknown Title",
+            authors=re.findall(r"<name>(.*?)</name>", entry),
+            abstract=abstract_match.group(1).strip() if abstract_match else "",
+            publication_date=published_match.group(1)[:10] if published_match else None,
+            venue="arXiv",
+            arxiv_id=entry_id,
+            doi=None,
+        )
+
+
+def chunks(feed: bytes):
+    for offset in range(0, len(feed), CHUNK_SIZE):
+        yield feed[offset:offset + CHUNK_SIZE]
+
+
+PARSERS = {
+    "regex": regex_entries,
+    "pull_whole": parse_arxiv_feed,
+    "pull_chunked": lambda feed: parse_arxiv_feed(chunks(feed)),
+}
+
+
+def expected_title(arxiv_id: str) -> str:
+    return f"Paper {entry_index(arxiv_id)}: Attention & Memory in Language Models"
+
+
+def field_errors(papers: list, arxiv_ids: list) -> list:
+    """Describe every way the parsed papers differ from what the fixture encodes"""
+    errors = []
+    if [paper.arxiv_id for paper in papers] != arxiv_ids:
+        errors.append(f"ids or order differ ({len(papers)} of {len(arxiv_ids)} entries)")
+    for paper in papers[:len(arxiv_ids)]:
+        index = entry_index(paper.arxiv_id)
+        checks = {
+            "title": paper.title == expected_title(paper.arxiv_id),
+            "doi": paper.doi == f"10.1000/paper.{index}",
+            "categories": paper.categories == ["cs.LG", "cs.CL", "stat.ML"],
+            "authors": paper.authors == [f"Author {index}-{n} Example" for n in range(4)],
+            "abstract": "attention & memory" in paper.abstract and "<b>sparse</b>" in paper.abstract,
+        }
+        errors.extend(f"{name} wrong for {paper.arxiv_id}" for name, ok in checks.items() if not ok)
+    return errors
+
+
+def measure(name: str, feed: bytes, repeat: int) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = sum(1 for _ in PARSERS[name](feed))
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    sum(1 for _ in PARSERS[name](feed))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(
+        f"{name:<13} {best * 1000:8.1f}ms {count / best:9.0f} entries/s "
+        f"{len(feed) / best / 1e6:6.1f}MB/s peak_alloc={peak / 1e6:6.2f}MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    arxiv_ids = synthetic_ids(args.entries)
+    feed = make_feed(arxiv_ids).encode("utf-8")
+    print(f"entries={args.entries} feed={len(feed) / 1e6:.2f}MB")
+    for name in PARSERS:
+        measure(name, feed, args.repeat)
+
+    failed = False
+    for name in PARSERS:
+        errors = field_errors(list(PARSERS[name](feed)), arxiv_ids)
+        kinds = sorted({error.split(" wrong")[0] for error in errors})
+        print(f"{'ok  ' if not errors else 'diff'} {name}: {', '.join(kinds) + ' wrong' if errors else 'all fields match'}")
+        failed |= name != "regex" and bool(errors)
+
+    # Single-id lookups used to regex the whole body, so the first <title> won
+    single = make_feed(arxiv_ids[:1])
+    first_title = unescape(re.search(r"<title[^>]*>(.*?)</title>", single, re.DOTALL).group(1))
+    parsed = next(parse_arxiv_feed(single))
+    print(f"feed-level title: first <title> in body is {first_title[:40]!r}..., parser gives {parsed.title!r}")
+    failed |= parsed.title != expected_title(arxiv_ids[0])
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Benchmark PDF text extraction on synthetic documents
+
+Each configuration runs in a fresh interpreter so peak RSS is per run.
+
+Usage:
+    python benchmarks/benchmark_pdf_extraction.py --pages 10 100 1000
+"""
+
+import argparse
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import PyPDF2
+import structlog
+
+from utils import MAX_CONTENT_LENGTH, extract_text_from_pdf, iter_pdf_pages
+
+MODES = ("baseline", "serial", "parallel", "stream", "early_stop")
+LINE = "Transformer attention scales quadratically with the sequence length of the input tokens."
+
+
+def make_pdf(pages: int, lines_per_page: int = 45) -> bytes:
+    """Build a minimal text PDF with one Helvetica content stream per page"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for page in range(pages):
+        lines = [f"(Page {page + 1}) Tj"] + [f"0 -15 Td ({LINE}) Tj" for _ in range(lines_per_page)]
+        stream = f"BT /F1 10 Tf 40 770 Td {' '.join(lines)} ET".encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_ref = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_ref
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>".encode()
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def baseline_extract(pdf_file) -> str:
+    """The previous implementation: serial pages and repeated string concatenation"""
+    pdf_reader = PyPDF2.PdfReader(pdf_file)
+    text = ""
+    for page_num in range(len(pdf_reader.pages)):
+        text += pdf_reader.pages[page_num].extract_text()
+    return text
+
+
+def run_once(pages: int, mode: str, workers: int) -> dict:
+    pdf_bytes = make_pdf(pages)
+    started = time.perf_counter()
+    if mode == "baseline":
+        chars = len(baseline_extract(io.BytesIO(pdf_bytes)))
+    elif mode == "serial":
+        chars = len(extract_text_from_pdf(io.BytesIO(pdf_bytes), workers=1))
+    elif mode == "parallel":
+        chars = len(extract_text_from_pdf(io.BytesIO(pdf_bytes), workers=workers))
+    elif mode == "stream":
+        chars = sum(len(text) for text in iter_pdf_pages(pdf_bytes, workers=workers))
+    else:
+        chars = len(extract_text_from_pdf(pdf_bytes, max_chars=MAX_CONTENT_LENGTH, workers=workers))
+    elapsed = time.perf_counter() - started
+    return {
+        "seconds": elapsed,
+        "pages_per_second": pages / elapsed,
+        "chars": chars,
+        # ru_maxrss is in KiB on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "peak_worker_rss_mb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--child", nargs=2, metavar=("PAGES", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(30))
+        print(json.dumps(run_once(int(args.child[0]), args.child[1], args.workers)))
+        return
+
+    print(f"workers={args.workers}")
+    for pages in args.pages:
+        for mode in args.modes:
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", str(pages), mode, "--workers", str(args.workers)],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"pages={pages:<5} mode={mode:<10} {result['seconds'] * 1000:8.0f}ms "
+                f"{result['pages_per_second']:7.1f} pages/s "
+                f"peak_rss={result['peak_rss_mb']:6.1f}MB worker_rss={result['peak_worker_rss_mb']:6.1f}MB "
+                f"chars={result['chars']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
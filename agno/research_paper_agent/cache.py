@@ -0,0 +1,209 @@
+"""Content-addressed on-disk cache for arXiv metadata, PDFs and extracted text"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+# Initialize logger
+logger = structlog.get_logger()
+
+# Constants
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "research_paper_agent"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
+VERSIONED_ARXIV_ID = re.compile(r"v\d+$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    immutable INTEGER NOT NULL DEFAULT 0,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest);
+"""
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def is_versioned_arxiv_id(arxiv_id: str) -> bool:
+    """A versioned id such as 2301.00001v2 always names the same content"""
+    return bool(VERSIONED_ARXIV_ID.search(arxiv_id))
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """Index row for one cached value; the bytes live in a blob named by their SHA-256"""
+    key: str
+    digest: str
+    size: int
+    etag: Optional[str]
+    last_modified: Optional[str]
+    immutable: bool
+    fetched_at: float
+    path: Path
+
+    def read(self) -> bytes:
+        return self.path.read_bytes()
+
+    def conditional_headers(self) -> dict:
+        """Headers for revalidating this entry with a conditional GET"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PaperCache:
+    """
+    Blob store plus SQLite index, with size-based LRU eviction
+
+    Values are written once under ``blobs/<sha256>``, so keys that hold the
+    same bytes share a blob. Entries older than ``max_age_seconds`` are stale
+    and should be revalidated, except immutable ones (versioned arXiv ids and
+    text keyed by PDF hash).
+    """
+
+    def __init__(
+        self,
+        root: Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.blob_dir = self.root / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.root / "index.sqlite3", check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["PaperCache"]:
+        if os.getenv("PAPER_CACHE_ENABLED", "true").lower() == "false":
+            return None
+        return cls(
+            root=Path(os.getenv("PAPER_CACHE_DIR", DEFAULT_CACHE_DIR)),
+            max_bytes=int(os.getenv("PAPER_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+            max_age_seconds=float(os.getenv("PAPER_CACHE_MAX_AGE_SECONDS", DEFAULT_MAX_AGE_SECONDS)),
+        )
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / digest
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Look up an entry and mark it recently used; stale entries are still returned"""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT key, digest, size, etag, last_modified, immutable, fetched_at FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or not self._blob_path(row[1]).exists():
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self.hits += 1
+        return CacheEntry(*row[:5], bool(row[5]), row[6], self._blob_path(row[1]))
+
+    def put(
+        self,
+        key: str,
+        data: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        immutable: bool = False,
+    ) -> CacheEntry:
+        digest = sha256_hex(data)
+        path = self._blob_path(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, digest, len(data), etag, last_modified, int(immutable), now, now),
+            )
+            self._db.commit()
+            self._evict()
+        logger.debug("paper_cache_stored", key=key, size=len(data))
+        return CacheEntry(key, digest, len(data), etag, last_modified, immutable, now, path)
+
+    def touch(self, key: str) -> None:
+        """Record a successful revalidation (e.g. HTTP 304) so the entry is fresh again"""
+        with self._lock:
+            self._db.execute("UPDATE entries SET fetched_at = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return entry.immutable or time.time() - entry.fetched_at < self.max_age_seconds
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes()
+
+    def _total_bytes(self) -> int:
+        row = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM entries)").fetchone()
+        return row[0]
+
+    def _evict(self) -> None:
+        total = self._total_bytes()
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute("SELECT key, digest FROM entries ORDER BY accessed_at").fetchall()
+        for key, digest in rows:
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            shared = self._db.execute("SELECT size FROM entries WHERE digest = ? LIMIT 1", (digest,)).fetchone()
+            if shared is None:
+                path = self._blob_path(digest)
+                total -= path.stat().st_size if path.exists() else 0
+                path.unlink(missing_ok=True)
+            logger.debug("paper_cache_evicted", key=key)
+        self._db.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            return {"entries": entries, "bytes": self._total_bytes(), "hits": self.hits, "misses": self.misses}
+
+
+_paper_cache: Optional[PaperCache] = None
+_paper_cache_loaded = False
+_paper_cache_lock = threading.Lock()
+
+
+def get_paper_cache() -> Optional[PaperCache]:
+    """Process-wide cache configured from PAPER_CACHE_* env vars, or None when disabled"""
+    global _paper_cache, _paper_cache_loaded
+    with _paper_cache_lock:
+        if not _paper_cache_loaded:
+            _paper_cache = PaperCache.from_env()
+            _paper_cache_loaded = True
+        return _paper_cache
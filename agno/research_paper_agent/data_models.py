@@ -13,6 +13,9 @@ class PaperMetadata(BaseModel):
     venue: Optional[str] = Field(description="Publication venue/journal")
     doi: Optional[str] = Field(description="DOI if available")
     arxiv_id: Optional[str] = Field(description="arXiv ID if available")
+    categories: List[str] = Field(
+        default_factory=list, description="arXiv subject categories, primary first"
+    )
 
 
 class PaperAnalysis(BaseModel):
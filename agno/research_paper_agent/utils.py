@@ -2,12 +2,24 @@
 
 import re
 import io
+import os
+import itertools
+import multiprocessing
+import random
+import threading
+import time
 import requests
-from typing import Optional
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
 import PyPDF2
 import structlog
 
+from arxiv_feed import parse_arxiv_feed
+from cache import get_paper_cache, is_versioned_arxiv_id, sha256_hex
 from data_models import PaperMetadata
 
 # Initialize logger
@@ -16,15 +28,278 @@ logger = structlog.get_logger()
 # Constants
 ARXIV_API_URL = "http://export.arxiv.org/api/query"
 ARXIV_PDF_URL = "https://arxiv.org/pdf/{}.pdf"
+ARXIV_ABS_URL = "http://arxiv.org/abs/{}"
 MAX_CONTENT_LENGTH = 10000
+PDF_EXTRACTION_WORKERS = int(os.getenv("PDF_EXTRACTION_WORKERS", os.cpu_count() or 1))
+PDF_PARALLEL_MIN_PAGES = 64  # Below this, process start-up costs more than it saves
+PDF_PAGES_PER_CHUNK = 16
+# arXiv asks API clients for no more than one request every three seconds
+ARXIV_MIN_REQUEST_INTERVAL = float(os.getenv("ARXIV_MIN_REQUEST_INTERVAL", "3.0"))
+ARXIV_MAX_RETRIES = int(os.getenv("ARXIV_MAX_RETRIES", "3"))
+ARXIV_BACKOFF_SECONDS = float(os.getenv("ARXIV_BACKOFF_SECONDS", "1.0"))
+# Longest single wait between retries; a longer Retry-After ends retrying
+ARXIV_MAX_RETRY_DELAY = float(os.getenv("ARXIV_MAX_RETRY_DELAY", "60"))
+ARXIV_MAX_PDF_BYTES = int(os.getenv("ARXIV_MAX_PDF_BYTES", str(50 * 1024 * 1024)))
+ARXIV_BATCH_SIZE = int(os.getenv("ARXIV_BATCH_SIZE", "100"))
+ARXIV_COALESCE_WINDOW_SECONDS = float(os.getenv("ARXIV_COALESCE_WINDOW_SECONDS", "0.05"))
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+PDF_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+FEED_CHUNK_SIZE = 64 * 1024
 
 
-def extract_text_from_pdf(pdf_file) -> str:
+class PdfTooLargeError(Exception):
+    """Raised when a PDF download exceeds the configured size limit"""
+
+
+class ArxivClient:
+    """
+    Shared HTTP client for the arXiv API and PDF server
+
+    Keeps one pooled keep-alive session, spaces requests to each host by
+    ``min_interval`` seconds, and retries connection errors, 429 and 5xx
+    responses with jittered exponential backoff (honouring Retry-After up to
+    ``max_retry_delay`` seconds; a server asking for longer gets no retry).
+    """
+
+    def __init__(
+        self,
+        min_interval: float = ARXIV_MIN_REQUEST_INTERVAL,
+        max_retries: int = ARXIV_MAX_RETRIES,
+        backoff_seconds: float = ARXIV_BACKOFF_SECONDS,
+        max_pdf_bytes: int = ARXIV_MAX_PDF_BYTES,
+        pool_size: int = 10,
+        max_retry_delay: float = ARXIV_MAX_RETRY_DELAY,
+    ):
+        self.min_interval = min_interval
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_retry_delay = max_retry_delay
+        self.max_pdf_bytes = max_pdf_bytes
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "research-paper-agent (+https://github.com/shahshrey/Awesome-ai-agents)"
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._lock = threading.Lock()
+        self._next_slot = {}
+        self.requests_sent = 0
+        self.retries = 0
+
+    def _wait_for_slot(self, url: str) -> None:
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None if the server asks for too long"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+            return delay if delay <= self.max_retry_delay else None
+        # Full jitter keeps concurrent callers from retrying in lockstep
+        return min(random.uniform(0, self.backoff_seconds * 2 ** attempt), self.max_retry_delay)
+
+    def get(self, url: str, timeout: float = 10, **kwargs) -> requests.Response:
+        """
+        GET a URL with politeness spacing and retries
+        
+        Args:
+            url: URL to fetch
+            timeout: Per-attempt timeout in seconds
+            **kwargs: Passed to ``requests.Session.get`` (params, headers, stream)
+            
+        Returns:
+            The final response; retryable statuses are returned once retries run out
+        """
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_slot(url)
+            self.requests_sent += 1
+            response = None
+            try:
+                response = self.session.get(url, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    return response
+            delay = self._retry_delay(attempt, response)
+            if delay is None:
+                logger.warning(
+                    "arxiv_retry_after_too_long",
+                    url=url,
+                    status_code=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                    max_retry_delay=self.max_retry_delay,
+                )
+                return response
+            if response is not None:
+                response.close()
+            self.retries += 1
+            logger.warning(
+                "arxiv_request_retry",
+                url=url,
+                attempt=attempt + 1,
+                status_code=response.status_code if response is not None else None,
+                delay=round(delay, 2),
+            )
+            time.sleep(delay)
+
+    def download_pdf(
+        self, url: str, timeout: float = 30, headers: Optional[dict] = None
+    ) -> Tuple[requests.Response, Optional[bytes]]:
+        """
+        Stream a PDF download, aborting once it exceeds ``max_pdf_bytes``
+        
+        Args:
+            url: PDF URL
+            timeout: Per-attempt timeout in seconds
+            headers: Extra request headers, e.g. for conditional requests
+            
+        Returns:
+            The response and the PDF bytes, or None for non-200 responses
+        """
+        response = self.get(url, timeout=timeout, headers=headers, stream=True)
+        with response:
+            if response.status_code != 200:
+                return response, None
+            declared = int(response.headers.get("Content-Length") or 0)
+            if declared > self.max_pdf_bytes:
+                raise PdfTooLargeError(f"PDF is {declared} bytes, limit is {self.max_pdf_bytes}")
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(PDF_DOWNLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > self.max_pdf_bytes:
+                    raise PdfTooLargeError(f"PDF exceeded {self.max_pdf_bytes} bytes")
+                chunks.append(chunk)
+            return response, b"".join(chunks)
+
+    def stats(self) -> dict:
+        return {"requests_sent": self.requests_sent, "retries": self.retries}
+
+
+_arxiv_client: Optional[ArxivClient] = None
+_arxiv_client_lock = threading.Lock()
+
+
+def get_arxiv_client() -> ArxivClient:
+    """Process-wide arXiv client, created on first use"""
+    global _arxiv_client
+    with _arxiv_client_lock:
+        if _arxiv_client is None:
+            _arxiv_client = ArxivClient()
+        return _arxiv_client
+
+
+def _read_pdf_bytes(pdf_file) -> bytes:
+    """Return the raw bytes of a PDF given as bytes, a path, or a file-like object"""
+    if isinstance(pdf_file, (bytes, bytearray)):
+        return bytes(pdf_file)
+    if isinstance(pdf_file, (str, os.PathLike)):
+        with open(pdf_file, "rb") as f:
+            return f.read()
+    if hasattr(pdf_file, "getvalue"):
+        return pdf_file.getvalue()
+    pdf_file.seek(0)
+    return pdf_file.read()
+
+
+_worker_reader = None
+
+
+def _init_extraction_worker(pdf_bytes: bytes) -> None:
+    # Each worker parses the document once and then serves page ranges from it.
+    global _worker_reader
+    _worker_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+
+
+def _extract_page_range(start: int, stop: int) -> List[str]:
+    return [_worker_reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def iter_pdf_pages(
+    pdf_file,
+    start_page: int = 0,
+    max_pages: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Yield the text of each PDF page in order
+
+    Large documents are split into page chunks extracted by a process pool
+    when more than one CPU is available. Workers are spawned rather than
+    forked, since forking the multi-threaded Streamlit process can deadlock.
+    Only a bounded window of chunks is in flight, and closing the generator
+    early cancels the rest.
+
+    Args:
+        pdf_file: PDF bytes, path, file object or BytesIO stream
+        start_page: Zero-based index of the first page to extract
+        max_pages: Maximum number of pages to extract, None for all
+        workers: Worker processes, defaults to PDF_EXTRACTION_WORKERS
+
+    Yields:
+        Extracted text of each page
+    """
+    pdf_bytes = _read_pdf_bytes(pdf_file)
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    stop_page = len(pdf_reader.pages)
+    if max_pages is not None:
+        stop_page = min(stop_page, start_page + max_pages)
+    workers = PDF_EXTRACTION_WORKERS if workers is None else workers
+
+    if workers <= 1 or (os.cpu_count() or 1) <= 1 or stop_page - start_page < PDF_PARALLEL_MIN_PAGES:
+        for page_num in range(start_page, stop_page):
+            yield pdf_reader.pages[page_num].extract_text() or ""
+        return
+
+    chunks = iter(range(start_page, stop_page, PDF_PAGES_PER_CHUNK))
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_extraction_worker,
+        initargs=(pdf_bytes,),
+    )
+    pending = deque()
+
+    def submit(start: int) -> None:
+        stop = min(start + PDF_PAGES_PER_CHUNK, stop_page)
+        pending.append(pool.submit(_extract_page_range, start, stop))
+
+    try:
+        for start in itertools.islice(chunks, workers * 2):
+            submit(start)
+        while pending:
+            texts = pending.popleft().result()
+            start = next(chunks, None)
+            if start is not None:
+                submit(start)
+            yield from texts
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def extract_text_from_pdf(
+    pdf_file,
+    start_page: int = 0,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> str:
     """
     Extract text content from uploaded PDF file
     
     Args:
         pdf_file: PDF file object or BytesIO stream
+        start_page: Zero-based index of the first page to extract
+        max_pages: Maximum number of pages to extract, None for all
+        max_chars: Stop once this many characters have been extracted
+        workers: Worker processes, defaults to PDF_EXTRACTION_WORKERS
         
     Returns:
         Extracted text content from PDF
@@ -32,21 +307,84 @@ def extract_text_from_pdf(pdf_file) -> str:
     logger.info("extracting_text_from_pdf")
     
     try:
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
+        pages = []
+        length = 0
         
-        for page_num in range(len(pdf_reader.pages)):
-            page = pdf_reader.pages[page_num]
-            text += page.extract_text()
+        for page_text in iter_pdf_pages(pdf_file, start_page, max_pages, workers):
+            pages.append(page_text)
+            length += len(page_text)
+            if max_chars is not None and length >= max_chars:
+                break
             
-        logger.info("pdf_extraction_successful", pages=len(pdf_reader.pages))
-        return text
+        logger.info("pdf_extraction_successful", pages=len(pages))
+        return "".join(pages)
         
     except Exception as e:
         logger.error("pdf_extraction_failed", error=str(e))
         return ""
 
 
+def _paper_cache():
+    """The shared paper cache, or None when it is disabled or cannot be opened"""
+    try:
+        return get_paper_cache()
+    except Exception as e:
+        logger.warning("paper_cache_unavailable", error=str(e))
+        return None
+
+
+def _cache_read(cache, key: str):
+    """Look up and read a cache entry, treating any cache error as a miss
+    
+    Returns:
+        (entry, data), or (None, None) on a miss
+    """
+    if not cache:
+        return None, None
+    try:
+        cached = cache.get(key)
+        return (cached, cached.read()) if cached else (None, None)
+    except Exception as e:
+        logger.warning("paper_cache_read_failed", key=key, error=str(e))
+        return None, None
+
+
+def _cache_put(cache, key: str, data: bytes, **kwargs) -> None:
+    """Store a cache entry; a failed write only costs the next lookup a miss"""
+    if not cache:
+        return
+    try:
+        cache.put(key, data, **kwargs)
+    except Exception as e:
+        logger.warning("paper_cache_write_failed", key=key, error=str(e))
+
+
+def extract_text_cached(pdf_bytes: bytes, max_chars: Optional[int] = None) -> str:
+    """
+    Extract text from PDF bytes, reusing text cached under their SHA-256
+    
+    Args:
+        pdf_bytes: Raw PDF content
+        max_chars: Stop once this many characters have been extracted
+        
+    Returns:
+        Extracted text content from PDF
+    """
+    cache = _paper_cache()
+    # The limit is part of the key so a capped extraction never stands in for the full text
+    limit = "all" if max_chars is None else max_chars
+    key = f"text:{sha256_hex(pdf_bytes)}:{limit}"
+    cached, data = _cache_read(cache, key)
+    if cached:
+        logger.info("pdf_text_cache_hit", key=key)
+        return data.decode("utf-8")
+        
+    content = extract_text_from_pdf(io.BytesIO(pdf_bytes), max_chars=max_chars)
+    if content:
+        _cache_put(cache, key, content.encode("utf-8"), immutable=True)
+    return content
+
+
 def extract_arxiv_id(url: str) -> Optional[str]:
     """
     Extract arXiv ID from URL
@@ -59,7 +397,7 @@ def extract_arxiv_id(url: str) -> Optional[str]:
     """
     logger.debug("extracting_arxiv_id", url=url)
     
-    arxiv_pattern = r"arxiv\.org/(?:abs|pdf)/(\d+\.\d+)"
+    arxiv_pattern = r"arxiv\.org/(?:abs|pdf)/(\d+\.\d+(?:v\d+)?)"
     match = re.search(arxiv_pattern, url)
     
     if not match:
@@ -71,10 +409,202 @@ def extract_arxiv_id(url: str) -> Optional[str]:
     return arxiv_id
 
 
+def _base_arxiv_id(arxiv_id: str) -> str:
+    return re.sub(r"v\d+$", "", arxiv_id)
+
+
+def _arxiv_version(arxiv_id: str) -> int:
+    match = re.search(r"v(\d+)$", arxiv_id)
+    return int(match.group(1)) if match else 0
+
+
+def _cached_metadata(cache, arxiv_id: str) -> Tuple[Optional[PaperMetadata], bool]:
+    """Return cached metadata for an id and whether it is still fresh"""
+    cached, data = _cache_read(cache, f"metadata:{arxiv_id}")
+    if not cached:
+        return None, False
+    try:
+        return PaperMetadata.model_validate_json(data), cache.is_fresh(cached)
+    except Exception as e:
+        logger.warning("paper_cache_read_failed", arxiv_id=arxiv_id, error=str(e))
+        return None, False
+
+
+def _fetch_metadata_chunk(arxiv_ids: List[str]) -> Dict[str, PaperMetadata]:
+    """Fetch up to one id_list page of ids in a single request, keyed by requested id"""
+    params = {"id_list": ",".join(arxiv_ids), "max_results": len(arxiv_ids)}
+    response = get_arxiv_client().get(ARXIV_API_URL, timeout=30, params=params, stream=True)
+    
+    with response:
+        if response.status_code != 200:
+            logger.error("arxiv_api_error", status_code=response.status_code, ids=len(arxiv_ids))
+            return {}
+            
+        by_id = {}
+        latest = {}
+        for metadata in parse_arxiv_feed(response.iter_content(FEED_CHUNK_SIZE)):
+            by_id[metadata.arxiv_id] = metadata
+            base = _base_arxiv_id(metadata.arxiv_id)
+            if base not in latest or _arxiv_version(metadata.arxiv_id) > _arxiv_version(latest[base].arxiv_id):
+                latest[base] = metadata
+        
+    found = {}
+    for arxiv_id in arxiv_ids:
+        metadata = by_id.get(arxiv_id)
+        # arXiv answers an unversioned id with its latest version; a versioned id must match exactly
+        if metadata is None and not is_versioned_arxiv_id(arxiv_id):
+            metadata = latest.get(arxiv_id)
+        if metadata:
+            found[arxiv_id] = metadata.model_copy(update={"arxiv_id": arxiv_id})
+    return found
+
+
+def fetch_arxiv_metadata_batch(
+    arxiv_ids: List[str], batch_size: int = ARXIV_BATCH_SIZE
+) -> List[Optional[PaperMetadata]]:
+    """
+    Fetch metadata for many papers with comma-separated id_list requests
+    
+    Fresh cache entries are used as-is; the remaining unique ids are fetched
+    ``batch_size`` at a time.
+    
+    Args:
+        arxiv_ids: arXiv paper IDs, duplicates allowed
+        batch_size: Maximum ids per outbound request
+        
+    Returns:
+        PaperMetadata (or None when not found) for each id, in input order
+    """
+    logger.info("fetching_arxiv_metadata_batch", count=len(arxiv_ids))
+    
+    cache = _paper_cache()
+    results = {}
+    stale = {}
+    missing = []
+    for arxiv_id in dict.fromkeys(arxiv_ids):
+        metadata, fresh = _cached_metadata(cache, arxiv_id)
+        if fresh:
+            results[arxiv_id] = metadata
+        else:
+            stale[arxiv_id] = metadata
+            missing.append(arxiv_id)
+            
+    for start in range(0, len(missing), batch_size):
+        chunk = missing[start:start + batch_size]
+        try:
+            fetched = _fetch_metadata_chunk(chunk)
+        except requests.RequestException as e:
+            logger.error("arxiv_fetch_network_error", error=str(e))
+            fetched = {}
+        except Exception as e:
+            logger.error("arxiv_fetch_error", error=str(e))
+            fetched = {}
+            
+        for arxiv_id in chunk:
+            metadata = fetched.get(arxiv_id)
+            if metadata:
+                _cache_put(
+                    cache,
+                    f"metadata:{arxiv_id}",
+                    metadata.model_dump_json().encode("utf-8"),
+                    immutable=is_versioned_arxiv_id(arxiv_id),
+                )
+            # A stale entry is still better than nothing if arXiv cannot be reached
+            results[arxiv_id] = metadata or stale[arxiv_id]
+            
+    logger.info(
+        "arxiv_metadata_batch_fetched",
+        requested=len(arxiv_ids),
+        fetched=len(missing),
+        requests=-(-len(missing) // batch_size),
+    )
+    return [results[arxiv_id] for arxiv_id in arxiv_ids]
+
+
+class MetadataBatcher:
+    """
+    Collapses concurrent single-id metadata lookups into shared requests
+    
+    The first lookup opens a ``window_seconds`` window; every id asked for
+    before it closes, up to ``batch_size``, goes out in one id_list request.
+    Callers asking for the same id share one result.
+    """
+
+    def __init__(self, window_seconds: float = ARXIV_COALESCE_WINDOW_SECONDS, batch_size: int = ARXIV_BATCH_SIZE):
+        self.window_seconds = window_seconds
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._timer: Optional[threading.Timer] = None
+        self.lookups = 0
+        self.batches = 0
+
+    def lookup(self, arxiv_id: str) -> Optional[PaperMetadata]:
+        batch = None
+        with self._lock:
+            self.lookups += 1
+            future = self._pending.get(arxiv_id)
+            if future is None:
+                future = self._pending[arxiv_id] = Future()
+                if self.window_seconds <= 0 or len(self._pending) >= self.batch_size:
+                    batch = self._take()
+                elif self._timer is None:
+                    self._timer = threading.Timer(self.window_seconds, self._flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            self._run(batch)
+        return future.result()
+
+    def _take(self) -> Dict[str, Future]:
+        batch, self._pending = self._pending, {}
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _flush(self) -> None:
+        with self._lock:
+            batch = self._take()
+        self._run(batch)
+
+    def _run(self, batch: Dict[str, Future]) -> None:
+        if not batch:
+            return
+        self.batches += 1
+        try:
+            results = fetch_arxiv_metadata_batch(list(batch), self.batch_size)
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+        for future, metadata in zip(batch.values(), results):
+            future.set_result(metadata)
+
+    def stats(self) -> dict:
+        return {"lookups": self.lookups, "batches": self.batches}
+
+
+_metadata_batcher: Optional[MetadataBatcher] = None
+_metadata_batcher_lock = threading.Lock()
+
+
+def get_metadata_batcher() -> MetadataBatcher:
+    """Process-wide batcher shared by every fetch_arxiv_metadata caller"""
+    global _metadata_batcher
+    with _metadata_batcher_lock:
+        if _metadata_batcher is None:
+            _metadata_batcher = MetadataBatcher()
+        return _metadata_batcher
+
+
 def fetch_arxiv_metadata(arxiv_id: str) -> Optional[PaperMetadata]:
     """
     Fetch paper metadata from arXiv API
     
+    Lookups made at the same time from other threads are coalesced into one
+    id_list request by the shared MetadataBatcher.
+    
     Args:
         arxiv_id: arXiv paper ID
         
@@ -83,77 +613,73 @@ def fetch_arxiv_metadata(arxiv_id: str) -> Optional[PaperMetadata]:
     """
     logger.info("fetching_arxiv_metadata", arxiv_id=arxiv_id)
     
-    try:
-        url = f"{ARXIV_API_URL}?id_list={arxiv_id}"
-        response = requests.get(url, timeout=10)
-        
-        if response.status_code != 200:
-            logger.error("arxiv_api_error", status_code=response.status_code)
-            return None
-            
-        content = response.text
-        
-        # Extract fields using regex
-        title_match = re.search(r"<title>(.*?)</title>", content, re.DOTALL)
-        title = title_match.group(1).strip() if title_match else "Unknown Title"
-        
-        abstract_match = re.search(r"<summary>(.*?)</summary>", content, re.DOTALL)
-        abstract = abstract_match.group(1).strip() if abstract_match else ""
-        
-        # Extract authors
-        authors = re.findall(r"<name>(.*?)</name>", content)
-        
-        # Extract publication date
-        published_match = re.search(r"<published>(.*?)</published>", content)
-        pub_date = published_match.group(1)[:10] if published_match else None
-        
-        metadata = PaperMetadata(
-            title=title,
-            authors=authors,
-            abstract=abstract,
-            publication_date=pub_date,
-            venue="arXiv",
-            arxiv_id=arxiv_id,
-            doi=None,
-        )
-        
-        logger.info("arxiv_metadata_fetched", title=title, authors_count=len(authors))
+    metadata, fresh = _cached_metadata(_paper_cache(), arxiv_id)
+    if fresh:
+        logger.info("arxiv_metadata_cache_hit", arxiv_id=arxiv_id)
         return metadata
         
-    except requests.RequestException as e:
-        logger.error("arxiv_fetch_network_error", error=str(e))
-        return None
-    except Exception as e:
-        logger.error("arxiv_fetch_error", error=str(e))
-        return None
+    metadata = get_metadata_batcher().lookup(arxiv_id)
+    if metadata:
+        logger.info("arxiv_metadata_fetched", title=metadata.title, authors_count=len(metadata.authors))
+    return metadata
 
 
-def fetch_arxiv_pdf_content(arxiv_id: str) -> Optional[str]:
+def fetch_arxiv_pdf_content(arxiv_id: str, max_chars: Optional[int] = None) -> Optional[str]:
     """
     Fetch and extract text from arXiv PDF
     
     Args:
         arxiv_id: arXiv paper ID
+        max_chars: Stop extracting once this many characters have been extracted
         
     Returns:
         Extracted text content or None
     """
     logger.info("fetching_arxiv_pdf", arxiv_id=arxiv_id)
     
+    cache = _paper_cache()
+    cache_key = f"pdf:{arxiv_id}"
+    # Read the blob up front so one evicted after the lookup is a plain miss
+    cached, cached_bytes = _cache_read(cache, cache_key)
+    
     try:
-        pdf_url = ARXIV_PDF_URL.format(arxiv_id)
-        response = requests.get(pdf_url, timeout=30)
-        
-        if response.status_code != 200:
-            logger.error("arxiv_pdf_fetch_error", status_code=response.status_code)
-            return None
+        if cached and cache.is_fresh(cached):
+            logger.info("arxiv_pdf_cache_hit", arxiv_id=arxiv_id)
+            pdf_bytes = cached_bytes
+        else:
+            pdf_url = ARXIV_PDF_URL.format(arxiv_id)
+            headers = cached.conditional_headers() if cached else {}
+            response, downloaded = get_arxiv_client().download_pdf(pdf_url, timeout=30, headers=headers)
+            
+            if response.status_code == 304 and cached:
+                logger.info("arxiv_pdf_not_modified", arxiv_id=arxiv_id)
+                try:
+                    cache.touch(cache_key)
+                except Exception as e:
+                    logger.warning("paper_cache_write_failed", key=cache_key, error=str(e))
+                pdf_bytes = cached_bytes
+            elif response.status_code != 200:
+                logger.error("arxiv_pdf_fetch_error", status_code=response.status_code)
+                return None
+            else:
+                pdf_bytes = downloaded
+                _cache_put(
+                    cache,
+                    cache_key,
+                    pdf_bytes,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    immutable=is_versioned_arxiv_id(arxiv_id),
+                )
             
-        pdf_file = io.BytesIO(response.content)
-        content = extract_text_from_pdf(pdf_file)
+        content = extract_text_cached(pdf_bytes, max_chars=max_chars)
         
         logger.info("arxiv_pdf_fetched", content_length=len(content))
         return content
         
+    except PdfTooLargeError as e:
+        logger.error("arxiv_pdf_too_large", error=str(e))
+        return None
     except requests.RequestException as e:
         logger.error("arxiv_pdf_network_error", error=str(e))
         return None
@@ -176,33 +702,22 @@ def search_arxiv_papers(query: str, max_results: int = 10) -> list:
     logger.info("searching_arxiv", query=query, max_results=max_results)
     
     try:
-        search_url = f"{ARXIV_API_URL}?search_query=all:{query}&start=0&max_results={max_results}"
-        response = requests.get(search_url, timeout=10)
-        
-        if response.status_code != 200:
-            logger.error("arxiv_search_error", status_code=response.status_code)
-            return []
-            
-        content = response.text
-        entries = re.findall(r"<entry>(.*?)</entry>", content, re.DOTALL)
+        params = {"search_query": f"all:{query}", "start": 0, "max_results": max_results}
+        response = get_arxiv_client().get(ARXIV_API_URL, timeout=10, params=params, stream=True)
         
-        papers = []
-        for entry in entries:
-            title_match = re.search(r"<title>(.*?)</title>", entry, re.DOTALL)
-            id_match = re.search(r"<id>(.*?)</id>", entry)
-            
-            if not title_match or not id_match:
-                continue
+        with response:
+            if response.status_code != 200:
+                logger.error("arxiv_search_error", status_code=response.status_code)
+                return []
                 
-            title = title_match.group(1).strip()
-            arxiv_url = id_match.group(1).strip()
-            arxiv_id = arxiv_url.split("/")[-1]
-            
-            papers.append({
-                "title": title,
-                "url": arxiv_url,
-                "arxiv_id": arxiv_id
-            })
+            papers = [
+                {
+                    "title": metadata.title,
+                    "url": ARXIV_ABS_URL.format(metadata.arxiv_id),
+                    "arxiv_id": metadata.arxiv_id,
+                }
+                for metadata in parse_arxiv_feed(response.iter_content(FEED_CHUNK_SIZE))
+            ]
             
         logger.info("arxiv_search_complete", results_count=len(papers))
         return papers